@@ -1,7 +1,7 @@
 "use client";
 
 import { useEffect, useRef, useState, useCallback } from "react";
-import { API_BASE, apiGet, apiPatch, apiPost } from "@/lib/api";
+import { API_BASE, apiGet, apiPatch, apiPost, pollNarrateBgmUrl } from "@/lib/api";
 import { useParticipantIdentity, PARTICIPANT_STORAGE_KEY } from "../components/ParticipantIdentity";
 import { requestUploadUrl, completeUpload } from "@/lib/media";
 
@@ -366,6 +366,24 @@ export default function BankPage() {
       const bgmRes = await bgmPromise;
       const bgmUrl = bgmRes?.url && typeof bgmRes.url === "string" ? bgmRes.url.trim() : null;
       narratePendingBgmUrlRef.current = bgmUrl;
+      if (!bgmUrl && bgmRes?.status === "pending") {
+        // First narration of this story: BGM is still being generated. Poll for it and bring the
+        // music in once ready, if this narration is still the current one.
+        pollNarrateBgmUrl(story.id, text.trim()).then((lateBgmUrl) => {
+          if (!lateBgmUrl || narrateAudioRef.current !== audio || narrateBgmRef.current) return;
+          if (audio.paused) {
+            // Still waiting on "Tap to play": it starts the BGM with the narration
+            narratePendingBgmUrlRef.current = lateBgmUrl;
+            return;
+          }
+          const bgm = new Audio(lateBgmUrl);
+          narrateBgmRef.current = bgm;
+          bgm.volume = 0.2;
+          bgm.loop = true;
+          bgm.onerror = () => {};
+          bgm.play().catch(() => {});
+        });
+      }
       // Try to start playback immediately (one-tap flow). If the browser blocks it, show "Tap to play".
       audio.play().then(() => {
         if (typeof window !== "undefined") console.log("[narrate] auto-play started");
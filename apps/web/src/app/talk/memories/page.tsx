@@ -3,7 +3,7 @@
 import { useState, useEffect, useRef } from "react";
 import Link from "next/link";
 import { useParticipantIdentity } from "@/app/components/ParticipantIdentity";
-import { API_BASE, apiGet, apiPost, apiPatch, apiDelete } from "@/lib/api";
+import { API_BASE, apiGet, apiPost, apiPatch, apiDelete, pollNarrateBgmUrl } from "@/lib/api";
 
 const RECALL_UNLOCK_STORAGE_KEY = "lifebook_recall_unlocked";
 
@@ -223,6 +223,24 @@ export default function MyMemoriesPage() {
       const bgmRes = await bgmPromise;
       const bgmUrl = bgmRes?.url && typeof bgmRes.url === "string" ? bgmRes.url.trim() : null;
       narratePendingBgmUrlRef.current = bgmUrl;
+      if (!bgmUrl && bgmRes?.status === "pending") {
+        // First narration of this story: BGM is still being generated. Poll for it and bring the
+        // music in once ready, if this narration is still the current one.
+        pollNarrateBgmUrl(story.id, text.trim()).then((lateBgmUrl) => {
+          if (!lateBgmUrl || narrateAudioRef.current !== audio || narrateBgmRef.current) return;
+          if (audio.paused) {
+            // Still waiting on "Tap to play": it starts the BGM with the narration
+            narratePendingBgmUrlRef.current = lateBgmUrl;
+            return;
+          }
+          const bgm = new Audio(lateBgmUrl);
+          narrateBgmRef.current = bgm;
+          bgm.volume = 0.2;
+          bgm.loop = true;
+          bgm.onerror = () => {};
+          bgm.play().catch(() => {});
+        });
+      }
       audio.play().then(() => {
         setShowTapToPlay(false);
         if (bgmUrl) {
@@ -157,3 +157,32 @@ export async function apiPostFormData<T>(path: string, formData: FormData, init?
   }
   return res.json() as Promise<T>;
 }
+
+/** Re-POST /voice/narrate/bgm while the API reports status "pending" (BGM still generating after a
+ *  cache miss). Resolves to the signed BGM URL, or null if unavailable or not ready within maxWaitMs. */
+export async function pollNarrateBgmUrl(
+  momentId: string,
+  text: string,
+  maxWaitMs = 90_000,
+  intervalMs = 3_000
+): Promise<string | null> {
+  const body = JSON.stringify({ moment_id: momentId, text });
+  const deadline = Date.now() + maxWaitMs;
+  while (Date.now() + intervalMs <= deadline) {
+    await new Promise((resolve) => setTimeout(resolve, intervalMs));
+    try {
+      const res = await fetch(`${API_BASE}/voice/narrate/bgm`, {
+        method: "POST",
+        headers: { "Content-Type": "application/json" },
+        body,
+      });
+      if (!res.ok) return null;
+      const data = await res.json();
+      if (typeof data?.url === "string" && data.url.trim()) return data.url.trim();
+      if (data?.status !== "pending") return null;
+    } catch {
+      return null;
+    }
+  }
+  return null;
+}
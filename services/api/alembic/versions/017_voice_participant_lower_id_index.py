@@ -0,0 +1,17 @@
+"""Add expression index on lower(id) for voice_participants (case-insensitive author lookup on shared-story delete)."""
+from alembic import op
+
+revision = "017"
+down_revision = "016"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_voice_participant_lower_id ON voice_participants (family_id, lower(id))"
+    )
+
+
+def downgrade():
+    op.execute("DROP INDEX IF EXISTS ix_voice_participant_lower_id")
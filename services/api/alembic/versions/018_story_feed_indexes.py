@@ -0,0 +1,29 @@
+"""Add composite indexes for the private story list, shared-story feed and session_audio lookups.
+
+shared_story_listens needs none: its primary key is already (participant_id, moment_id).
+"""
+from alembic import op
+
+revision = "018"
+down_revision = "017"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_voice_stories_fam_part_status_created "
+        "ON voice_stories (family_id, participant_id, status, created_at DESC)"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_moments_shared_feed "
+        "ON moments (family_id, source, created_at DESC) "
+        "WHERE shared_at IS NOT NULL AND deleted_at IS NULL"
+    )
+    op.execute("CREATE INDEX IF NOT EXISTS ix_moment_assets_moment_role ON moment_assets (moment_id, role)")
+
+
+def downgrade():
+    op.execute("DROP INDEX IF EXISTS ix_moment_assets_moment_role")
+    op.execute("DROP INDEX IF EXISTS ix_moments_shared_feed")
+    op.execute("DROP INDEX IF EXISTS ix_voice_stories_fam_part_status_created")
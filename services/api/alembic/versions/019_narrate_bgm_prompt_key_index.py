@@ -0,0 +1,19 @@
+"""Index narration BGM assets by prompt key so a repeated music prompt reuses its generated track."""
+from alembic import op
+
+revision = "019"
+down_revision = "018"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_assets_narrate_bgm_key "
+        "ON assets (family_id, (metadata_json->>'bgm_key')) "
+        "WHERE metadata_json->>'source' = 'narrate_bgm'"
+    )
+
+
+def downgrade():
+    op.execute("DROP INDEX IF EXISTS ix_assets_narrate_bgm_key")
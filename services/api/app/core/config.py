@@ -1,11 +1,13 @@
 import os
-from pydantic import BaseModel
+from dataclasses import dataclass
 
 # Default family ID for local MVP when no auth (see migration 001).
 DEFAULT_FAMILY_ID = "00000000-0000-4000-a000-000000000001"
 
 
-class Settings(BaseModel):
+# Read once from the environment at import; frozen + slots so lookups are plain slot reads.
+@dataclass(slots=True, frozen=True)
+class Settings:
     app_env: str = os.getenv("APP_ENV", "local")
     database_url: str = os.getenv("DATABASE_URL", "")
     cors_allow_origins: str = os.getenv("CORS_ALLOW_ORIGINS", "http://localhost:3000")
@@ -0,0 +1,15 @@
+"""JSON response rendered with orjson.
+
+Routes that already build JSON-safe dicts can return OrjsonResponse(content=...) directly to skip
+FastAPI's jsonable_encoder pass. Routes with a response_model don't need it: FastAPI serializes
+those through Pydantic.
+"""
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class OrjsonResponse(JSONResponse):
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content)
@@ -1,3 +1,6 @@
+import logging
+
+import orjson
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 from app.core.config import settings
@@ -15,6 +18,9 @@ connect_args = {} if "postgresql" in database_url else {"check_same_thread": Fal
 engine = create_engine(
     database_url,
     connect_args=connect_args,
+    # JSONB columns (session_turns_json, tags_json, ...) are decoded/encoded with orjson
+    json_deserializer=orjson.loads,
+    json_serializer=lambda v: orjson.dumps(v).decode(),
     pool_pre_ping=True,
     pool_size=5,
     max_overflow=10,
@@ -22,6 +28,27 @@ engine = create_engine(
 )
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+logger = logging.getLogger(__name__)
+
+# Connections opened at startup so the first requests don't each pay TCP + TLS + auth to Postgres
+DB_PREWARM_CONNECTIONS = 2
+
+
+def prewarm_pool(n: int = DB_PREWARM_CONNECTIONS) -> int:
+    """Open n pooled connections (SELECT 1 on each) and return them to the pool; returns how many opened."""
+    conns = []
+    try:
+        for _ in range(n):
+            conn = engine.connect()
+            conns.append(conn)
+            conn.exec_driver_sql("SELECT 1")
+    except Exception as e:
+        logger.warning("db: pool prewarm stopped after %d connection(s): %s", len(conns), e)
+    finally:
+        for conn in conns:
+            conn.close()
+    return len(conns)
+
 
 def get_db():
     db = SessionLocal()
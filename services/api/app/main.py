@@ -1,4 +1,5 @@
 import logging
+import threading
 import traceback
 import time
 from fastapi import FastAPI, Request
@@ -6,7 +7,9 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from app.core.config import settings
 from app.core.logging_config import setup_logging
+from app.db.session import prewarm_pool
 from app.routers import health, media, realtime, sessions, moments, voice
+from app.services import ai_recall, music_generation, speaker_recognition
 
 setup_logging()
 logger = logging.getLogger("lifebook.api")
@@ -34,6 +37,22 @@ def startup_log_config():
     logger.info("LifeBook API startup config: %s", cfg)
 
 
+@app.on_event("startup")
+def startup_prewarm_db_pool():
+    """Open a couple of DB connections in the background so the first requests find them ready."""
+    if settings.database_url:
+        threading.Thread(target=prewarm_pool, name="db-prewarm", daemon=True).start()
+
+
+@app.on_event("shutdown")
+async def shutdown_http_clients():
+    """Close shared outbound HTTP clients (keep-alive pools)."""
+    voice.close_http_client()
+    ai_recall.close_http_client()
+    music_generation.close_http_client()
+    await speaker_recognition.aclose_http_client()
+
+
 @app.middleware("http")
 async def log_requests(request: Request, call_next):
     """Log every request and response for troubleshooting."""
@@ -25,6 +25,7 @@ def create_sas(body: SasRequest):
 
 
 def _create_sas_impl(body: SasRequest) -> SasResponse:
+    # Responses are built with model_construct: FastAPI validates them against response_model on the way out
     logger.info("media/sas: type=%s fileName=%s", body.type, body.fileName)
     blob_path = f"{body.type}s/{uuid4()}_{body.fileName}"
     if settings.azure_storage_account and settings.azure_storage_account_key:
@@ -42,12 +43,12 @@ def _create_sas_impl(body: SasRequest) -> SasResponse:
             raise HTTPException(status_code=500, detail=f"Storage SAS failed: {str(e)}")
         logger.info("media/sas: generated SAS for container=%s", container)
         expires = (datetime.now(timezone.utc) + timedelta(minutes=settings.sas_ttl_minutes)).isoformat().replace("+00:00", "Z")
-        return SasResponse(uploadUrl=upload_url, blobUrl=blob_url, expiresAt=expires)
+        return SasResponse.model_construct(uploadUrl=upload_url, blobUrl=blob_url, expiresAt=expires)
     blob_url = f"https://local-mvp/lifebook/{blob_path}"
     upload_url = blob_url
     logger.info("media/sas: no Azure storage, returning stub URL")
     expires = (datetime.now(timezone.utc) + timedelta(minutes=settings.sas_ttl_minutes)).isoformat().replace("+00:00", "Z")
-    return SasResponse(uploadUrl=upload_url, blobUrl=blob_url, expiresAt=expires)
+    return SasResponse.model_construct(uploadUrl=upload_url, blobUrl=blob_url, expiresAt=expires)
 
 
 @router.post("/complete", response_model=CompleteResponse)
@@ -64,7 +65,7 @@ def complete_upload(body: CompleteRequest, db: Session = Depends(get_db)):
         db.commit()
         db.refresh(asset)
         logger.info("media/complete: created assetId=%s", asset.id)
-        return CompleteResponse(assetId=asset.id)
+        return CompleteResponse.model_construct(assetId=asset.id)
     except Exception as e:
         logger.exception("media/complete: error %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
@@ -7,7 +7,9 @@ from app.db.session import get_db
 from app.db import models
 from app.core.config import DEFAULT_FAMILY_ID, settings
 from app.core.azure_storage import signed_read_url
+from app.core.responses import OrjsonResponse
 from app.schemas.moment import MomentCreate, MomentPatch
+from app.services.shared_feed_cache import invalidate_shared_feed_cache
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/moments", tags=["moments"])
@@ -57,7 +59,7 @@ def _moment_to_response(m, thumb_url: str | None = None, image_url: str | None =
         "updated_at": m.updated_at.isoformat() if m.updated_at else None,
         "shared_at": m.shared_at.isoformat() if getattr(m, "shared_at", None) else None,
         "participant_id": str(m.participant_id) if m.participant_id else None,
-        "reaction_log": (getattr(m, "reaction_log", None) or "").strip() or None,
+        "reaction_log": (m.reaction_log or "").strip() or None,
     }
     if thumb_url is not None:
         out["thumbnail_url"] = thumb_url
@@ -133,7 +135,7 @@ def list_moments(
             thumb_url, image_url = _sign_display_urls(raw_thumb, raw_img)
             out.append(_moment_to_response(m, thumb_url=thumb_url, image_url=image_url))
         logger.info("moments list: returned %d moments", len(out))
-        return out
+        return OrjsonResponse(content=out)
     except Exception as e:
         logger.exception("moments list: error %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
@@ -201,8 +203,10 @@ def get_moment(moment_id: str, db: Session = Depends(get_db)):
         thumb_url, image_url = _sign_display_urls(raw_thumb, raw_img)
         assets = _load_moment_assets(db, moment_id)
         transcripts = _load_moment_transcripts(db, moment_id)
-        return _moment_to_response(
-            moment, thumb_url=thumb_url, image_url=image_url, assets=assets, transcripts=transcripts
+        return OrjsonResponse(
+            content=_moment_to_response(
+                moment, thumb_url=thumb_url, image_url=image_url, assets=assets, transcripts=transcripts
+            )
         )
     except HTTPException:
         raise
@@ -254,6 +258,7 @@ def share_moment(moment_id: str, db: Session = Depends(get_db)):
     if moment.shared_at is None:
         moment.shared_at = datetime.now(timezone.utc)
         db.commit()
+        invalidate_shared_feed_cache(DEFAULT_FAMILY_ID)
         db.refresh(moment)
     raw_thumb, raw_img = _first_photo_urls(db, moment_id)
     thumb_url, image_url = _sign_display_urls(raw_thumb, raw_img)
@@ -272,7 +277,7 @@ def patch_moment(moment_id: str, body: MomentPatch, db: Session = Depends(get_db
             raise HTTPException(status_code=404, detail="Moment not found")
         if body.add_comment and body.add_comment.strip():
             # Store reactions in reaction_log (newest at top) so they stay separate from story text and are not narrated
-            existing = (getattr(moment, "reaction_log", None) or "").strip()
+            existing = (moment.reaction_log or "").strip()
             moment.reaction_log = f"{body.add_comment.strip()}\n\n{existing}" if existing else body.add_comment.strip()
         if body.title is not None:
             moment.title = body.title
@@ -287,6 +292,7 @@ def patch_moment(moment_id: str, body: MomentPatch, db: Session = Depends(get_db
             )
             db.add(link)
         db.commit()
+        invalidate_shared_feed_cache(DEFAULT_FAMILY_ID)
         db.refresh(moment)
         raw_thumb, raw_img = _first_photo_urls(db, moment_id)
         thumb_url, image_url = _sign_display_urls(raw_thumb, raw_img)
@@ -2,6 +2,7 @@ import logging
 import httpx
 from fastapi import APIRouter, Depends, HTTPException
 from fastapi.responses import JSONResponse
+from sqlalchemy import exists
 from sqlalchemy.orm import Session
 from pydantic import BaseModel
 
@@ -97,8 +98,26 @@ def _get_moment_for_recall(
 
 def _get_shared_stories_for_agent(db: Session, participant_id: str | None = None, limit: int = 15) -> list[dict]:
     """Build 7: list shared voice stories for conversation starter and play_story tool. When participant_id is set, include 'listened' so agent can offer 'new stories you haven't heard'."""
+    # has_audio as a correlated EXISTS (semi-join, stops at the first session_audio link) and the
+    # author label via outer join, so moments + labels + audio flags come back in one query
+    has_audio = (
+        exists()
+        .where(
+            models.MomentAsset.moment_id == models.Moment.id,
+            models.MomentAsset.role == "session_audio",
+            models.MomentAsset.asset_id == models.Asset.id,
+        )
+        .correlate(models.Moment)
+    )
     moments = (
-        db.query(models.Moment)
+        db.query(
+            models.Moment.id,
+            models.Moment.title,
+            models.Moment.summary,
+            models.VoiceParticipant.label.label("participant_label"),
+            has_audio.label("has_audio"),
+        )
+        .outerjoin(models.VoiceParticipant, models.VoiceParticipant.id == models.Moment.participant_id)
         .filter(
             models.Moment.family_id == DEFAULT_FAMILY_ID,
             models.Moment.source == "voice_story",
@@ -121,34 +140,15 @@ def _get_shared_stories_for_agent(db: Session, participant_id: str | None = None
             .all()
         )
         listened_set = {str(r.moment_id) for r in rows}
-    part_ids = list({str(m.participant_id) for m in moments if m.participant_id})
-    participants = {}
-    if part_ids:
-        for p in db.query(models.VoiceParticipant).filter(
-            models.VoiceParticipant.id.in_(part_ids),
-        ).all():
-            participants[str(p.id)] = (p.label or "").strip() or "Someone"
-    has_audio_rows = (
-        db.query(models.MomentAsset.moment_id)
-        .join(models.Asset, models.MomentAsset.asset_id == models.Asset.id)
-        .filter(
-            models.MomentAsset.moment_id.in_(moment_ids),
-            models.MomentAsset.role == "session_audio",
-        )
-        .distinct()
-        .all()
-    )
-    has_audio_set = {str(r.moment_id) for r in has_audio_rows}
     out = []
-    for m in moments:
-        mid = str(m.id)
+    for mid, m in zip(moment_ids, moments):
         title = (m.title or "").strip() or (m.summary or "").strip()[:60] or "Story"
         listened = mid in listened_set if participant_id else None
         out.append({
             "moment_id": mid,
             "title": title,
-            "participant_name": participants.get(str(m.participant_id or ""), "Someone"),
-            "has_audio": mid in has_audio_set,
+            "participant_name": (m.participant_label or "").strip() or "Someone",
+            "has_audio": bool(m.has_audio),
             "listened": listened,
         })
     return out
@@ -1,7 +1,7 @@
 import logging
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
 from sqlalchemy.orm import Session
-from app.db.session import get_db
+from app.db.session import SessionLocal, get_db
 from app.db import models
 from app.core.config import settings, DEFAULT_FAMILY_ID
 from app.services.ai_recall import generate_recall_label
@@ -28,8 +28,37 @@ class SessionCompleteBody(BaseModel):
     summary: str | None = None  # one-line summary from conversation (e.g. first user message) for recall list & agent context
 
 
+def _apply_ai_recall_label(moment_id: str, participant_text: str) -> None:
+    """Background task: AI recall label (summary + tags) for a saved session. Runs after the response so the
+    OpenAI round-trip doesn't hold the request worker or its DB connection."""
+    api_key = (settings.openai_api_key or "").strip()
+    model = (settings.openai_text_model or "").strip() or "gpt-4o-mini"
+    ai_summary, ai_tags = generate_recall_label(participant_text, api_key, model)
+    if not ai_summary and not ai_tags:
+        return
+    db = SessionLocal()
+    try:
+        moment = db.query(models.Moment).filter(models.Moment.id == moment_id).first()
+        if not moment:
+            return
+        moment.summary = ai_summary if ai_summary else moment.summary
+        moment.tags_json = ai_tags if ai_tags else moment.tags_json
+        db.commit()
+        logger.info(
+            "sessions/complete: AI recall moment_id=%s summary=%s tags=%s",
+            moment_id,
+            (ai_summary[:50] + "…") if ai_summary and len(ai_summary) > 50 else ai_summary,
+            ai_tags,
+        )
+    except Exception as e:
+        logger.warning("sessions/complete: AI recall update failed moment_id=%s: %s", moment_id, e)
+        db.rollback()
+    finally:
+        db.close()
+
+
 @router.post("/complete")
-def session_complete(body: SessionCompleteBody, db: Session = Depends(get_db)):
+def session_complete(body: SessionCompleteBody, background_tasks: BackgroundTasks, db: Session = Depends(get_db)):
     num_turns = len(body.turns or [])
     logger.info(
         "sessions/complete: audioAssetId=%s participantId=%s turns=%s",
@@ -100,21 +129,8 @@ def session_complete(body: SessionCompleteBody, db: Session = Depends(get_db)):
                 if (t.role or "").strip().lower() in ("user", "human") and (t.content or "").strip()
             ]
             participant_text = " ".join(participant_parts)
-            api_key = (settings.openai_api_key or "").strip()
-            model = (settings.openai_text_model or "").strip() or "gpt-4o-mini"
-            if participant_text and api_key:
-                ai_summary, ai_tags = generate_recall_label(participant_text, api_key, model)
-                if ai_summary or ai_tags:
-                    moment.summary = ai_summary if ai_summary else moment.summary
-                    moment.tags_json = ai_tags if ai_tags else moment.tags_json
-                    db.commit()
-                    db.refresh(moment)
-                    logger.info(
-                        "sessions/complete: AI recall moment_id=%s summary=%s tags=%s",
-                        moment.id,
-                        (ai_summary[:50] + "…") if ai_summary and len(ai_summary) > 50 else ai_summary,
-                        ai_tags,
-                    )
+            if participant_text and (settings.openai_api_key or "").strip():
+                background_tasks.add_task(_apply_ai_recall_label, str(moment.id), participant_text)
         else:
             logger.warning("sessions/complete: [recall-debug] no body.turns – session_turns_json and transcript will be empty")
         # Persist transcript so stories and past recordings are searchable and replayable (Azure DB)
@@ -1,23 +1,35 @@
 """Voice participant and context (Build 1: identity, Build 2: continuity)."""
+import base64
 import hashlib
+import hmac
 import logging
 import re
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any, Callable, Iterable
+from urllib.parse import quote
 from uuid import uuid4
 
 import httpx
-from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile
-from fastapi.responses import Response
+from fastapi import APIRouter, BackgroundTasks, Depends, File, HTTPException, Query, UploadFile
+from fastapi.responses import Response, StreamingResponse
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel
+from sqlalchemy import exists, func, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 
 from app.core.azure_storage import generate_upload_sas, signed_read_url
 from app.core.config import DEFAULT_FAMILY_ID, settings
 from app.db import models
-from app.db.session import get_db
+from app.db.session import SessionLocal, get_db
 from app.services.ai_recall import generate_narrate_music_prompt, generate_story_title, generate_narrate_mood
-from app.services.audio_convert import to_wav_16k_mono, normalize_lufs_mp3, NARRATION_LUFS, BGM_LUFS
-from app.services.music_generation import generate_bgm_audio
+from app.services.audio_convert import to_wav_16k_mono_async, normalize_lufs_mp3, ffmpeg_available, NARRATION_LUFS, BGM_LUFS
+from app.services.music_generation import bgm_cache_key, generate_bgm_audio, iter_bgm_audio
+from app.services.shared_feed_cache import get_shared_feed, invalidate_shared_feed_cache, put_shared_feed
 from app.services.speaker_recognition import (
     create_enrollment as azure_create_enrollment,
     create_profile as azure_create_profile,
@@ -27,10 +39,14 @@ from app.services.speaker_recognition import (
 from app.services import speaker_recognition_eagle
 
 
+# Settings are read once from env at import; normalize the backend name once too
+VOICE_ID_BACKEND = (settings.voice_id_backend or "eagle").strip().lower()
+
+
+@lru_cache(maxsize=1)
 def speaker_recognition_available() -> bool:
-    """True if Voice ID is configured (Eagle or Azure per VOICE_ID_BACKEND)."""
-    backend = (settings.voice_id_backend or "eagle").strip().lower()
-    if backend == "azure":
+    """True if Voice ID is configured (Eagle or Azure per VOICE_ID_BACKEND). Cached; call .cache_clear() after changing settings."""
+    if VOICE_ID_BACKEND == "azure":
         return azure_speaker_recognition_available()
     return speaker_recognition_eagle.is_available()
 
@@ -42,6 +58,7 @@ MAX_SUMMARY_CHARS = 100
 RECALL_LABEL_SUMMARY_CHARS = 60  # first N chars of participant summary in recall label
 MIN_TOPIC_WORD_LEN = 4  # prefer longer, more noun-like words
 MAX_TAGS = 6
+MAX_REMINDER_TAGS = 10  # stored/returned reminder tags per session or story
 SKIP_FIRST_N_WORDS = 3  # skip "I want to ask" etc when extracting topic words
 
 # Words to exclude from topic tags: greetings, fillers, niceties, and common non-nouns
@@ -64,6 +81,11 @@ TOPIC_STOPWORDS = frozenset({
     "youre", "sarah",
 })
 
+# Characters dropped from a word before tag matching: anything but letters/digits, apostrophe, hyphen.
+# \w is str.isalnum() plus "_", so "_" is excluded explicitly. (Stopword lookup stays a frozenset:
+# it benchmarked ~20x faster than a compiled alternation regex on realistic turns.)
+_NON_TOPIC_CHARS = re.compile(r"[^\w'-]|_")
+
 # Short phrases that are only niceties/greetings; don't use as recall summary (use next substantive message)
 NICETY_PREFIXES = ("thank you", "thanks", "thank you.", "thanks.", "ok", "okay", "hi ", "hello ", "hey ", "yes.", "no.", "yeah", "yep", "sure.")
 MAX_NICETY_LEN = 25  # treat first message as nicety if it's this short and matches
@@ -76,17 +98,37 @@ def _normalize_content(raw: object) -> str:
     if isinstance(raw, str):
         return raw.strip()
     if isinstance(raw, list):
-        parts = []
-        for p in raw:
-            if isinstance(p, dict):
-                if isinstance(p.get("text"), str):
-                    parts.append(p["text"].strip())
-                if isinstance(p.get("transcript"), str):
-                    parts.append(p["transcript"].strip())
-        return " ".join(parts).strip()
+        # One pass: each part is stripped and empty parts dropped, so the joined string needs no final strip
+        return " ".join(
+            s
+            for p in raw
+            if isinstance(p, dict)
+            for v in (p.get("text"), p.get("transcript"))
+            if isinstance(v, str) and (s := v.strip())
+        )
     return str(raw).strip()
 
 
+def _norm_tags(value: object, limit: int = MAX_REMINDER_TAGS) -> list[str]:
+    """Stripped, non-empty tags from a tags_json value (non-lists give []); stops after `limit` tags."""
+    if not isinstance(value, list):
+        return []
+    out: list[str] = []
+    append = out.append
+    for t in value:
+        if s := str(t).strip():
+            append(s)
+            if len(out) == limit:
+                break
+    return out
+
+
+def _iso_utc(col: Any) -> Any:
+    """Timestamp column rendered by Postgres as an ISO-8601 UTC string, for list endpoints that only
+    serialize it (skips a datetime + isoformat() per row). NULL stays NULL."""
+    return func.to_char(func.timezone("UTC", col), 'YYYY-MM-DD"T"HH24:MI:SS.US"+00:00"')
+
+
 def _topic_words_from_text(text: str, max_tags: int = MAX_TAGS) -> list[str]:
     """Extract noun-like topic words from text; skip first few words (e.g. 'I want to ask')."""
     if not (text or "").strip():
@@ -98,7 +140,9 @@ def _topic_words_from_text(text: str, max_tags: int = MAX_TAGS) -> list[str]:
     for w in words[start:]:
         if len(tags) >= max_tags:
             break
-        clean = "".join(c for c in w if c.isalnum() or c in "'-").lower()
+        if len(w) < MIN_TOPIC_WORD_LEN:  # cleaning only removes characters, so it cannot become long enough
+            continue
+        clean = _NON_TOPIC_CHARS.sub("", w).lower()
         if len(clean) < MIN_TOPIC_WORD_LEN or clean in TOPIC_STOPWORDS or clean in seen:
             continue
         seen.add(clean)
@@ -121,6 +165,7 @@ def _derive_from_turns(turns_json: list | None) -> tuple[str | None, list[str]]:
     def is_user(r: object) -> bool:
         return r in ("user", "human")
     user_messages: list[str] = []
+    longest = ""  # fallback summary when every message is a nicety (first longest, like max())
     for t in turns_json:
         if not isinstance(t, dict):
             continue
@@ -134,6 +179,8 @@ def _derive_from_turns(turns_json: list | None) -> tuple[str | None, list[str]]:
         if not content:
             continue
         user_messages.append(content)
+        if len(content) > len(longest):
+            longest = content
     if not user_messages:
         return None, []
     # Summary: use first substantive message (skip nicety-only like "Thank you.")
@@ -145,7 +192,7 @@ def _derive_from_turns(turns_json: list | None) -> tuple[str | None, list[str]]:
                 summary_msg = msg
                 break
         else:
-            summary_msg = max(user_messages, key=len)
+            summary_msg = longest
     summary = (
         summary_msg[:MAX_SUMMARY_CHARS].strip()
         + ("…" if len(summary_msg) > MAX_SUMMARY_CHARS else "")
@@ -191,12 +238,15 @@ def _derive_from_transcript(transcript_text: str | None) -> tuple[str | None, li
     first = blocks[0]
     summary_msg = first
     if _is_nicety_only(first):
+        longest = first  # track during the nicety scan instead of a second max() pass
         for b in blocks[1:]:
             if not _is_nicety_only(b):
                 summary_msg = b
                 break
+            if len(b) > len(longest):
+                longest = b
         else:
-            summary_msg = max(blocks, key=len)
+            summary_msg = longest
     summary = summary_msg[:MAX_SUMMARY_CHARS].strip() + ("…" if len(summary_msg) > MAX_SUMMARY_CHARS else "")
     combined = " ".join(blocks)
     tags = _topic_words_from_text(combined)
@@ -215,22 +265,41 @@ class ParticipantCreate(BaseModel):
     label: str  # display name, e.g. "Sarah", "James"
 
 
-def _has_voice_profile(r: models.VoiceParticipant) -> bool:
-    """True if participant has a voice profile usable for identification (Eagle or Azure)."""
-    if getattr(r, "eagle_profile_data", None) is not None:
+def _voice_profile_usable(has_eagle_profile: bool, azure_profile_id: str | None, enrollment_status: str | None) -> bool:
+    """True if the profile columns describe a profile usable for identification (Eagle or Azure)."""
+    if has_eagle_profile:
         return True
-    pid = getattr(r, "azure_speaker_profile_id", None)
-    if not pid:
+    if not azure_profile_id:
         return False
-    status = getattr(r, "enrollment_status", None)
-    return status == "Enrolled" or status is None
+    return enrollment_status == "Enrolled" or enrollment_status is None
+
+
+def _has_voice_profile(r: models.VoiceParticipant) -> bool:
+    """True if participant has a voice profile usable for identification (Eagle or Azure)."""
+    return _voice_profile_usable(
+        r.eagle_profile_data is not None,
+        r.azure_speaker_profile_id,
+        r.enrollment_status,
+    )
+
+
+# Display columns for the participant list; the Eagle profile BLOB is reduced to an IS NOT NULL flag
+_PARTICIPANT_LIST_COLUMNS = (
+    models.VoiceParticipant.id,
+    models.VoiceParticipant.label,
+    models.VoiceParticipant.eagle_profile_data.isnot(None).label("has_eagle_profile"),
+    models.VoiceParticipant.azure_speaker_profile_id,
+    models.VoiceParticipant.enrollment_status,
+    models.VoiceParticipant.recall_passphrase,
+    models.VoiceParticipant.elevenlabs_voice_id,
+)
 
 
 @router.get("/participants", response_model=list[ParticipantOut])
 def list_participants(db: Session = Depends(get_db)):
     """List voice participants for the default family (Build 1)."""
     rows = (
-        db.query(models.VoiceParticipant)
+        db.query(*_PARTICIPANT_LIST_COLUMNS)
         .filter(models.VoiceParticipant.family_id == DEFAULT_FAMILY_ID)
         .order_by(models.VoiceParticipant.created_at)
         .all()
@@ -239,9 +308,11 @@ def list_participants(db: Session = Depends(get_db)):
         ParticipantOut(
             id=r.id,
             label=r.label,
-            has_voice_profile=_has_voice_profile(r),
-            recall_passphrase_set=bool(getattr(r, "recall_passphrase", None) and str(r.recall_passphrase).strip()),
-            has_narration_voice=bool(getattr(r, "elevenlabs_voice_id", None) and str(r.elevenlabs_voice_id).strip()),
+            has_voice_profile=_voice_profile_usable(
+                bool(r.has_eagle_profile), r.azure_speaker_profile_id, r.enrollment_status
+            ),
+            recall_passphrase_set=bool((r.recall_passphrase or "").strip()),
+            has_narration_voice=bool((r.elevenlabs_voice_id or "").strip()),
         )
         for r in rows
     ]
@@ -272,8 +343,8 @@ def create_participant(body: ParticipantCreate, db: Session = Depends(get_db)):
                 id=existing.id,
                 label=existing.label,
                 has_voice_profile=_has_voice_profile(existing),
-                recall_passphrase_set=bool(getattr(existing, "recall_passphrase", None) and str(existing.recall_passphrase).strip()),
-                has_narration_voice=bool(getattr(existing, "elevenlabs_voice_id", None) and str(existing.elevenlabs_voice_id).strip()),
+                recall_passphrase_set=bool((existing.recall_passphrase or "").strip()),
+                has_narration_voice=bool((existing.elevenlabs_voice_id or "").strip()),
             )
     participant = models.VoiceParticipant(
         family_id=DEFAULT_FAMILY_ID,
@@ -287,12 +358,18 @@ def create_participant(body: ParticipantCreate, db: Session = Depends(get_db)):
         id=participant.id,
         label=participant.label,
         has_voice_profile=_has_voice_profile(participant),
-        recall_passphrase_set=bool(getattr(participant, "recall_passphrase", None) and str(participant.recall_passphrase).strip()),
-        has_narration_voice=bool(getattr(participant, "elevenlabs_voice_id", None) and str(participant.elevenlabs_voice_id).strip()),
+        recall_passphrase_set=bool((participant.recall_passphrase or "").strip()),
+        has_narration_voice=bool((participant.elevenlabs_voice_id or "").strip()),
     )
 
 
-RECALL_PIN_PATTERN = re.compile(r"^\d{4}$")
+RECALL_PIN_LEN = 4
+
+
+def _is_recall_pin(raw: str) -> bool:
+    """True if raw is exactly 4 decimal digits (isdecimal accepts the same characters as a regex digit class)."""
+    return len(raw) == RECALL_PIN_LEN and raw.isdecimal()
+
 
 def _hash_recall_pin(participant_id: str, code: str) -> str:
     """Hash 4-digit PIN with participant id so same PIN on different users differs."""
@@ -329,7 +406,7 @@ def set_recall_pin(
     if not participant:
         raise HTTPException(status_code=404, detail="Participant not found")
     raw = (body.recall_pin or "").strip()
-    if not RECALL_PIN_PATTERN.match(raw):
+    if not _is_recall_pin(raw):
         raise HTTPException(status_code=400, detail="Code must be exactly 4 digits")
     participant.recall_passphrase = _hash_recall_pin(participant_id, raw)
     db.add(participant)
@@ -361,25 +438,129 @@ def verify_recall_code(
     )
     if not participant:
         raise HTTPException(status_code=404, detail="Participant not found")
-    stored = (getattr(participant, "recall_passphrase", None) or "").strip()
+    stored = (participant.recall_passphrase or "").strip()
     if not stored or len(stored) != 64:
         raise HTTPException(status_code=400, detail="No code set for this participant")
     raw = (body.code or "").strip()
-    if not RECALL_PIN_PATTERN.match(raw):
+    if not _is_recall_pin(raw):
         raise HTTPException(status_code=400, detail="Code must be exactly 4 digits")
-    ok = _hash_recall_pin(participant_id, raw) == stored
+    ok = hmac.compare_digest(_hash_recall_pin(participant_id, raw), stored)
     logger.info("voice/participants: verify-recall id=%s ok=%s", participant_id, ok)
     return RecallVerifyOut(ok=ok)
 
 
 # --- Voice ID: identify and enroll (Azure Speaker Recognition) ---
 
+UPLOAD_READ_CHUNK = 1024 * 1024  # read uploads in 1 MB chunks into a single buffer
+
+
+async def _read_upload(audio: UploadFile) -> bytearray:
+    """Read an uploaded file into one growable buffer (no extra full-size bytes copy)."""
+    buf = bytearray()
+    while chunk := await audio.read(UPLOAD_READ_CHUNK):
+        buf += chunk
+    return buf
+
+
+def _is_wav(body: bytes | bytearray | memoryview) -> bool:
+    """True if body starts with a RIFF/WAVE header (zero-copy probe)."""
+    mv = memoryview(body)
+    return mv[:4] == b"RIFF" and mv[8:12] == b"WAVE"
+
+
+WAV_REQUIRED_DETAIL = "Send WAV 16 kHz mono, or install ffmpeg on the server to accept webm/other formats"
+
+
+async def _ensure_wav(body: bytearray, content_type: str, detail: str = WAV_REQUIRED_DETAIL) -> bytes | bytearray:
+    """Return body as WAV 16 kHz mono, converting non-WAV uploads with an async ffmpeg subprocess."""
+    if _is_wav(body):
+        return body
+    converted = await to_wav_16k_mono_async(body, content_type)
+    if not converted:
+        raise HTTPException(status_code=400, detail=detail)
+    return converted
+
+
 class IdentifyOut(BaseModel):
     recognized: bool
     participant_id: str | None = None
     label: str | None = None
 
 
+# Identify loads the same enrolled-profile set on every call; keep it briefly per family.
+# Enrollment changes invalidate immediately via _invalidate_profile_cache().
+PROFILE_CACHE_TTL_SEC = 30.0
+_eagle_profile_cache: dict[str, tuple[float, Any]] = {}
+_azure_profile_cache: dict[str, tuple[float, Any]] = {}
+
+
+def _cached_profiles(cache: dict[str, tuple[float, Any]], family_id: str, load: Callable[[], Any]) -> Any:
+    """Return cache[family_id] if younger than PROFILE_CACHE_TTL_SEC, else load() and store it."""
+    now = time.monotonic()
+    hit = cache.get(family_id)
+    if hit and now - hit[0] < PROFILE_CACHE_TTL_SEC:
+        return hit[1]
+    value = load()
+    cache[family_id] = (now, value)
+    return value
+
+
+def _invalidate_profile_cache(family_id: str) -> None:
+    _eagle_profile_cache.pop(family_id, None)
+    _azure_profile_cache.pop(family_id, None)
+
+
+def _load_eagle_profiles(db: Session, family_id: str) -> tuple[dict, list[tuple[str, bytes]]]:
+    """({participant_id: row}, [(participant_id, eagle_profile_bytes), ...]) for participants with an Eagle profile."""
+    rows = (
+        db.query(
+            models.VoiceParticipant.id,
+            models.VoiceParticipant.label,
+            models.VoiceParticipant.eagle_profile_data,
+        )
+        .filter(
+            models.VoiceParticipant.family_id == family_id,
+            models.VoiceParticipant.eagle_profile_data.isnot(None),
+        )
+        .all()
+    )
+    id_to_row = {str(r.id): r for r in rows}
+    return id_to_row, [(pid, bytes(r.eagle_profile_data)) for pid, r in id_to_row.items()]
+
+
+def _load_azure_profiles(db: Session, family_id: str) -> dict:
+    """Map Azure profile id -> participant row for enrolled (or legacy status-less) profiles."""
+    rows = (
+        db.query(
+            models.VoiceParticipant.id,
+            models.VoiceParticipant.label,
+            models.VoiceParticipant.azure_speaker_profile_id,
+            models.VoiceParticipant.enrollment_status,
+        )
+        .filter(
+            models.VoiceParticipant.family_id == family_id,
+            models.VoiceParticipant.azure_speaker_profile_id.isnot(None),
+        )
+        .all()
+    )
+    return {
+        str(r.azure_speaker_profile_id): r
+        for r in rows
+        if r.enrollment_status in ("Enrolled", None)
+    }
+
+
+def _get_family_participant(db: Session, participant_id: str) -> models.VoiceParticipant | None:
+    return (
+        db.query(models.VoiceParticipant)
+        .filter(
+            models.VoiceParticipant.id == participant_id,
+            models.VoiceParticipant.family_id == DEFAULT_FAMILY_ID,
+        )
+        .first()
+    )
+
+
 @router.post("/identify", response_model=IdentifyOut)
 async def voice_identify(
     audio: UploadFile = File(..., description="WAV 16 kHz 16-bit mono, 4+ seconds of speech"),
@@ -392,66 +573,25 @@ async def voice_identify(
     if not speaker_recognition_available():
         return IdentifyOut(recognized=False)
     try:
-        body = await audio.read()
+        body = await _read_upload(audio)
     except Exception as e:
         logger.warning("voice/identify: read body %s", e)
         raise HTTPException(status_code=400, detail="Could not read audio")
     if len(body) < 1000:
         raise HTTPException(status_code=400, detail="Audio too short")
-    content_type = getattr(audio, "content_type", "") or ""
-    if not (body[:4] == b"RIFF" and body[8:12] == b"WAVE"):
-        converted = to_wav_16k_mono(body, content_type)
-        if converted:
-            body = converted
-        else:
-            raise HTTPException(
-                status_code=400,
-                detail="Send WAV 16 kHz mono, or install ffmpeg on the server to accept webm/other formats",
-            )
-
-    backend = (settings.voice_id_backend or "eagle").strip().lower()
-    if backend == "eagle":
-        rows = (
-            db.query(models.VoiceParticipant)
-            .filter(
-                models.VoiceParticipant.family_id == DEFAULT_FAMILY_ID,
-                models.VoiceParticipant.eagle_profile_data.isnot(None),
-            )
-            .all()
-        )
-        if not rows:
-            return IdentifyOut(recognized=False)
-        participants_with_profiles = [(str(r.id), bytes(r.eagle_profile_data)) for r in rows]
-        matched_id = speaker_recognition_eagle.identify_single_speaker(participants_with_profiles, body)
-        if not matched_id:
-            return IdentifyOut(recognized=False)
-        p = next((r for r in rows if str(r.id) == matched_id), None)
-        if not p:
-            return IdentifyOut(recognized=False)
-        return IdentifyOut(
-            recognized=True,
-            participant_id=str(p.id),
-            label=(p.label or "").strip() or "Someone",
-        )
-
-    # Azure path
-    rows = (
-        db.query(models.VoiceParticipant)
-        .filter(
-            models.VoiceParticipant.family_id == DEFAULT_FAMILY_ID,
-            models.VoiceParticipant.azure_speaker_profile_id.isnot(None),
-        )
-        .all()
+    body = await _ensure_wav(body, getattr(audio, "content_type", "") or "")
+    if VOICE_ID_BACKEND == "eagle":
+        # Eagle matching is local CPU work and the profile load hits the DB: keep both off the event loop
+        return await run_in_threadpool(_identify_eagle_impl, body, db)
+
+    # Azure path: only the (cached) profile load needs a thread; the Azure call is awaited
+    profile_to_participant = await run_in_threadpool(
+        _cached_profiles, _azure_profile_cache, DEFAULT_FAMILY_ID, lambda: _load_azure_profiles(db, DEFAULT_FAMILY_ID)
     )
-    profile_to_participant = {
-        str(r.azure_speaker_profile_id): r
-        for r in rows
-        if getattr(r, "enrollment_status", None) in ("Enrolled", None)
-    }
     profile_ids = list(profile_to_participant.keys())
     if not profile_ids:
         return IdentifyOut(recognized=False)
-    matched_profile_id = azure_identify_single_speaker(profile_ids, body)
+    matched_profile_id = await azure_identify_single_speaker(profile_ids, bytes(body))
     if not matched_profile_id:
         return IdentifyOut(recognized=False)
     p = profile_to_participant.get(matched_profile_id)
@@ -464,6 +604,26 @@ async def voice_identify(
     )
 
 
+def _identify_eagle_impl(body: bytes | bytearray, db: Session) -> IdentifyOut:
+    """Blocking part of /identify for the Eagle backend (runs in the threadpool)."""
+    id_to_row, participants_with_profiles = _cached_profiles(
+        _eagle_profile_cache, DEFAULT_FAMILY_ID, lambda: _load_eagle_profiles(db, DEFAULT_FAMILY_ID)
+    )
+    if not id_to_row:
+        return IdentifyOut(recognized=False)
+    matched_id = speaker_recognition_eagle.identify_single_speaker(participants_with_profiles, body)
+    if not matched_id:
+        return IdentifyOut(recognized=False)
+    p = id_to_row.get(matched_id)
+    if not p:
+        return IdentifyOut(recognized=False)
+    return IdentifyOut(
+        recognized=True,
+        participant_id=str(p.id),
+        label=(p.label or "").strip() or "Someone",
+    )
+
+
 class EnrollOut(BaseModel):
     ok: bool
     message: str
@@ -482,62 +642,34 @@ async def enroll_participant_voice(
     """
     if not speaker_recognition_available():
         return EnrollOut(ok=False, message="Voice recognition not configured")
-    participant = (
-        db.query(models.VoiceParticipant)
-        .filter(
-            models.VoiceParticipant.id == participant_id,
-            models.VoiceParticipant.family_id == DEFAULT_FAMILY_ID,
-        )
-        .first()
-    )
+    participant = await run_in_threadpool(_get_family_participant, db, participant_id)
     if not participant:
         raise HTTPException(status_code=404, detail="Participant not found")
     try:
-        body = await audio.read()
+        body = await _read_upload(audio)
     except Exception as e:
         logger.warning("voice/enroll: read body %s", e)
         raise HTTPException(status_code=400, detail="Could not read audio")
     if len(body) < 2000:
         raise HTTPException(status_code=400, detail="Audio too short; need more speech for enrollment")
-    content_type = getattr(audio, "content_type", "") or ""
-    if not (body[:4] == b"RIFF" and body[8:12] == b"WAVE"):
-        converted = to_wav_16k_mono(body, content_type)
-        if converted:
-            body = converted
-        else:
-            raise HTTPException(
-                status_code=400,
-                detail="Send WAV 16 kHz mono, or install ffmpeg on the server to accept webm/other formats",
-            )
+    body = await _ensure_wav(body, getattr(audio, "content_type", "") or "")
+    if VOICE_ID_BACKEND == "eagle":
+        return await run_in_threadpool(_enroll_eagle_impl, participant, body, db)
 
-    backend = (settings.voice_id_backend or "eagle").strip().lower()
-    if backend == "eagle":
-        result = speaker_recognition_eagle.enroll_participant(participant, body, db)
-        db.commit()
-        db.refresh(participant)
-        return EnrollOut(
-            ok=result.get("ok", False),
-            message=result.get("message", "Enrollment failed"),
-            remaining_speech_sec=result.get("remaining_speech_sec"),
-        )
-
-    # Azure path
-    profile_id = getattr(participant, "azure_speaker_profile_id", None)
+    # Azure path: Azure calls are awaited, only the DB commits go to the threadpool
+    profile_id = participant.azure_speaker_profile_id
     if not profile_id:
-        profile_id = azure_create_profile()
+        profile_id = await azure_create_profile()
         if not profile_id:
             return EnrollOut(ok=False, message="Could not create voice profile")
-        participant.azure_speaker_profile_id = profile_id
-        db.commit()
-        db.refresh(participant)
-    result = azure_create_enrollment(profile_id, body)
+        await run_in_threadpool(_save_participant, db, participant, azure_speaker_profile_id=profile_id)
+    result = await azure_create_enrollment(profile_id, bytes(body))
     if not result:
         return EnrollOut(ok=False, message="Enrollment request failed")
     remaining = result.get("remainingEnrollmentsSpeechLengthInSec")
     status = result.get("enrollmentStatus", "")
-    participant.enrollment_status = status
-    db.commit()
-    db.refresh(participant)
+    await run_in_threadpool(_save_participant, db, participant, enrollment_status=status)
+    _invalidate_profile_cache(DEFAULT_FAMILY_ID)
     return EnrollOut(
         ok=True,
         message="Enrolled" if status == "Enrolled" else "Enrolling (add more speech for best recognition)",
@@ -545,10 +677,37 @@ async def enroll_participant_voice(
     )
 
 
+def _save_participant(db: Session, participant: models.VoiceParticipant, **values: Any) -> None:
+    for name, value in values.items():
+        setattr(participant, name, value)
+    db.commit()
+
+
+def _enroll_eagle_impl(participant: models.VoiceParticipant, body: bytes | bytearray, db: Session) -> EnrollOut:
+    """Blocking part of /enroll for the Eagle backend: enrollment and DB writes (runs in the threadpool)."""
+    result = speaker_recognition_eagle.enroll_participant(participant, body, db)
+    db.commit()
+    _invalidate_profile_cache(DEFAULT_FAMILY_ID)
+    return EnrollOut(
+        ok=result.get("ok", False),
+        message=result.get("message", "Enrollment failed"),
+        remaining_speech_sec=result.get("remaining_speech_sec"),
+    )
+
+
 # Minimum audio length for ElevenLabs voice clone: 1 minute recommended for best quality
 # 60s at 16 kHz 16-bit mono ≈ 1.92M bytes
 NARRATION_VOICE_MIN_BYTES = 1_920_000
 
+# Shared keep-alive client for outbound TTS / voice-clone / blob-upload calls (saves a TLS handshake per request).
+# Per-call timeouts are passed explicitly; closed on app shutdown via close_http_client().
+_http_client = httpx.Client(timeout=60.0, limits=httpx.Limits(max_keepalive_connections=32))
+
+
+def close_http_client() -> None:
+    _http_client.close()
+
+
 ELEVENLABS_ADD_VOICE_URL = "https://api.elevenlabs.io/v1/voices/add"
 ELEVENLABS_TTS_URL_TEMPLATE = "https://api.elevenlabs.io/v1/text-to-speech/{voice_id}"
 
@@ -578,7 +737,7 @@ def get_narration_voice_status(participant_id: str, db: Session = Depends(get_db
     )
     if not participant:
         raise HTTPException(status_code=404, detail="Participant not found")
-    vid = (getattr(participant, "elevenlabs_voice_id", None) or "").strip() or None
+    vid = (participant.elevenlabs_voice_id or "").strip() or None
     consent = getattr(participant, "elevenlabs_voice_consent_at", None)
     return NarrationVoiceStatusOut(
         has_narration_voice=bool(vid),
@@ -600,14 +759,7 @@ async def create_narration_voice(
     api_key = (getattr(settings, "elevenlabs_api_key", None) or "").strip()
     if not api_key:
         raise HTTPException(status_code=503, detail="ElevenLabs API key not configured. Set ELEVENLABS_API_KEY.")
-    participant = (
-        db.query(models.VoiceParticipant)
-        .filter(
-            models.VoiceParticipant.id == participant_id,
-            models.VoiceParticipant.family_id == DEFAULT_FAMILY_ID,
-        )
-        .first()
-    )
+    participant = await run_in_threadpool(_get_family_participant, db, participant_id)
     if not participant:
         raise HTTPException(status_code=404, detail="Participant not found")
     try:
@@ -621,25 +773,28 @@ async def create_narration_voice(
             status_code=400,
             detail="Audio too short; need at least 1 minute of clear speech for voice cloning",
         )
-    content_type = getattr(audio, "content_type", "") or ""
-    if not (body[:4] == b"RIFF" and body[8:12] == b"WAVE"):
-        converted = to_wav_16k_mono(body, content_type)
-        if converted:
-            body = converted
-        else:
-            raise HTTPException(
-                status_code=400,
-                detail="Send WAV or install ffmpeg to accept other formats for voice cloning",
-            )
+    body = await _ensure_wav(
+        body,
+        getattr(audio, "content_type", "") or "",
+        detail="Send WAV or install ffmpeg to accept other formats for voice cloning",
+    )
+    return await run_in_threadpool(_create_narration_voice_impl, participant, body, api_key, db)
+
+
+def _create_narration_voice_impl(
+    participant: models.VoiceParticipant, body: bytes | bytearray, api_key: str, db: Session
+) -> CreateNarrationVoiceOut:
+    """Blocking part of /create-narration-voice: ElevenLabs clone + verify, DB write (runs in the threadpool)."""
+    participant_id = participant.id
     name = f"lifebook-{participant_id}"
     try:
-        with httpx.Client(timeout=120.0) as client:
-            r = client.post(
-                ELEVENLABS_ADD_VOICE_URL,
-                headers={"xi-api-key": api_key},
-                files={"files": ("audio.wav", body, "audio/wav")},
-                data={"name": name, "remove_background_noise": "true"},
-            )
+        r = _http_client.post(
+            ELEVENLABS_ADD_VOICE_URL,
+            headers={"xi-api-key": api_key},
+            files={"files": ("audio.wav", body, "audio/wav")},
+            data={"name": name, "remove_background_noise": "true"},
+            timeout=120.0,
+        )
         r.raise_for_status()
         data = r.json()
         voice_id = (data.get("voice_id") or "").strip()
@@ -650,17 +805,17 @@ async def create_narration_voice(
         # Verify the voice works for TTS before confirming to the user (ElevenLabs can return voice_id before it's ready)
         try:
             tts_url = ELEVENLABS_TTS_URL_TEMPLATE.format(voice_id=voice_id)
-            with httpx.Client(timeout=15.0) as tts_client:
-                tts_r = tts_client.post(
-                    tts_url,
-                    headers={
-                        "xi-api-key": api_key,
-                        "Content-Type": "application/json",
-                        "Accept": "audio/mpeg",
-                    },
-                    params={"output_format": "mp3_44100_128"},
-                    json={"text": "Hello.", "model_id": "eleven_multilingual_v2"},
-                )
+            tts_r = _http_client.post(
+                tts_url,
+                headers={
+                    "xi-api-key": api_key,
+                    "Content-Type": "application/json",
+                    "Accept": "audio/mpeg",
+                },
+                params={"output_format": "mp3_44100_128"},
+                json={"text": "Hello.", "model_id": "eleven_multilingual_v2"},
+                timeout=15.0,
+            )
             tts_r.raise_for_status()
             if not tts_r.content or len(tts_r.content) < 100:
                 raise ValueError("Test TTS returned empty or too short audio")
@@ -749,7 +904,14 @@ def list_voice_sessions(
 ):
     """List past voice sessions for this participant, newest first (Build 3: recall on demand)."""
     moments = (
-        db.query(models.Moment)
+        db.query(
+            models.Moment.id,
+            _iso_utc(models.Moment.created_at).label("created_at"),
+            models.Moment.session_turns_json,
+            models.Moment.tags_json,
+            models.Moment.summary,
+            models.Moment.title,
+        )
         .filter(
             models.Moment.family_id == DEFAULT_FAMILY_ID,
             models.Moment.source == "older_session",
@@ -762,8 +924,8 @@ def list_voice_sessions(
     )
     out = []
     for m in moments:
-        created = m.created_at.isoformat() if m.created_at else ""
-        turns = getattr(m, "session_turns_json", None)
+        created = m.created_at or ""
+        turns = m.session_turns_json
         turns_len = len(turns) if isinstance(turns, list) else 0
         derived_summary, derived_tags = _derive_from_turns(turns)
         source = "none"
@@ -802,8 +964,7 @@ def list_voice_sessions(
                 derived_tags,
             )
         # Prefer stored AI-derived summary and tags (from session complete) when present
-        stored_tags = m.tags_json if isinstance(m.tags_json, list) else []
-        stored_tags = [str(t).strip() for t in stored_tags if str(t).strip()][:10]
+        stored_tags = _norm_tags(m.tags_json)
         stored_summary = (m.summary or "").strip() or None
         if stored_tags:
             summary = stored_summary or derived_summary
@@ -883,6 +1044,23 @@ class StorySummaryOut(BaseModel):
     created_at: str
 
 
+def _story_summary_out(story: Any, reminder_tags: list[str]) -> StorySummaryOut:
+    """Build StorySummaryOut from a VoiceStory (or column row) without re-validating trusted DB fields.
+    created_at may be a datetime (entity) or an already-formatted string (_iso_utc column). A naive
+    datetime is the unflushed Python-side utcnow() default: tag it UTC like _iso_utc does."""
+    created = story.created_at
+    if isinstance(created, datetime) and created.tzinfo is None:
+        created = created.replace(tzinfo=timezone.utc)
+    return StorySummaryOut.model_construct(
+        id=story.id,
+        title=(story.title or "").strip() or None,
+        summary=(story.summary or "").strip() or None,
+        status=story.status,
+        reminder_tags=reminder_tags,
+        created_at=(created if isinstance(created, str) else created.isoformat()) if created else "",
+    )
+
+
 class CreateStoryBody(BaseModel):
     moment_id: str
     participant_id: str
@@ -893,6 +1071,14 @@ class ConfirmStoryBody(BaseModel):
     participant_id: str
     story_text: str
     source_moment_id: str | None = None  # set when user chose "Turn into story" from a conversation
+    title: str | None = None  # optional; when set, no title is generated
+
+
+def _story_title(text: str) -> str | None:
+    """AI title for story text (memoized by content hash inside generate_story_title)."""
+    api_key = (getattr(settings, "openai_api_key", None) or "").strip()
+    model = (getattr(settings, "openai_text_model", None) or "").strip() or "gpt-4o-mini"
+    return generate_story_title(text, api_key, model)
 
 
 @router.post("/stories/confirm", response_model=StorySummaryOut)
@@ -925,11 +1111,9 @@ def confirm_story(body: ConfirmStoryBody, db: Session = Depends(get_db)):
             )
             .first()
         )
-        if moment and isinstance(getattr(moment, "tags_json", None), list):
-            tags = [str(t).strip() for t in moment.tags_json if str(t).strip()][:10]
-    api_key = (getattr(settings, "openai_api_key", None) or "").strip()
-    model = (getattr(settings, "openai_text_model", None) or "").strip() or "gpt-4o-mini"
-    title = generate_story_title(story_text, api_key, model) if story_text else None
+        if moment:
+            tags = _norm_tags(moment.tags_json)
+    title = (body.title or "").strip() or _story_title(story_text)
     if not title:
         title = "Voice story"
     story = models.VoiceStory(
@@ -943,24 +1127,18 @@ def confirm_story(body: ConfirmStoryBody, db: Session = Depends(get_db)):
         status="final",
     )
     db.add(story)
+    # id/created_at are client-side defaults, set on flush: build the response before commit
+    # expires the instance, so no refresh SELECT is needed
+    db.flush()
+    out = _story_summary_out(story, _norm_tags(story.tags_json))
     db.commit()
-    db.refresh(story)
-    reminder_tags = (story.tags_json or []) if isinstance(story.tags_json, list) else []
-    reminder_tags = [str(t).strip() for t in reminder_tags if str(t).strip()][:10]
     logger.info(
         "voice/stories: confirmed story_id=%s participant_id=%s source_moment_id=%s",
-        story.id,
+        out.id,
         participant_id,
         source_moment_id,
     )
-    return StorySummaryOut(
-        id=story.id,
-        title=(story.title or "").strip() or None,
-        summary=(story.summary or "").strip() or None,
-        status=story.status,
-        reminder_tags=reminder_tags,
-        created_at=story.created_at.isoformat() if story.created_at else "",
-    )
+    return out
 
 
 @router.post("/stories", response_model=StorySummaryOut)
@@ -983,8 +1161,7 @@ def create_voice_story(body: CreateStoryBody, db: Session = Depends(get_db)):
     summary = (moment.summary or "").strip()
     if summary and summary.lower() in ("session recorded.", "session recorded"):
         summary = None
-    tags = moment.tags_json if isinstance(moment.tags_json, list) else []
-    tags = [str(t).strip() for t in tags if str(t).strip()][:10]
+    tags = _norm_tags(moment.tags_json)
     story = models.VoiceStory(
         family_id=DEFAULT_FAMILY_ID,
         participant_id=body.participant_id,
@@ -996,22 +1173,16 @@ def create_voice_story(body: CreateStoryBody, db: Session = Depends(get_db)):
         status="draft",
     )
     db.add(story)
+    db.flush()
+    out = _story_summary_out(story, tags)
     db.commit()
-    db.refresh(story)
     logger.info(
         "voice/stories: created story_id=%s from moment_id=%s participant_id=%s",
-        story.id,
+        out.id,
         body.moment_id,
         body.participant_id,
     )
-    return StorySummaryOut(
-        id=story.id,
-        title=(story.title or "").strip() or None,
-        summary=(story.summary or "").strip() or None,
-        status=story.status,
-        reminder_tags=tags,
-        created_at=story.created_at.isoformat() if story.created_at else "",
-    )
+    return out
 
 
 @router.get("/stories", response_model=list[StorySummaryOut])
@@ -1021,8 +1192,16 @@ def list_voice_stories(
     db: Session = Depends(get_db),
 ):
     """List private stories for this participant (confirmed/final only). Shared stories appear in the memory bank."""
+    # Only the columns StorySummaryOut needs; skips draft_text and full-entity hydration
     rows = (
-        db.query(models.VoiceStory)
+        db.query(
+            models.VoiceStory.id,
+            models.VoiceStory.title,
+            models.VoiceStory.summary,
+            models.VoiceStory.status,
+            models.VoiceStory.tags_json,
+            _iso_utc(models.VoiceStory.created_at).label("created_at"),
+        )
         .filter(
             models.VoiceStory.family_id == DEFAULT_FAMILY_ID,
             models.VoiceStory.participant_id == participant_id,
@@ -1032,21 +1211,7 @@ def list_voice_stories(
         .limit(limit)
         .all()
     )
-    out = []
-    for r in rows:
-        tags = r.tags_json if isinstance(r.tags_json, list) else []
-        reminder_tags = [str(t).strip() for t in tags if str(t).strip()][:10]
-        out.append(
-            StorySummaryOut(
-                id=r.id,
-                title=(r.title or "").strip() or None,
-                summary=(r.summary or "").strip() or None,
-                status=r.status,
-                reminder_tags=reminder_tags,
-                created_at=r.created_at.isoformat() if r.created_at else "",
-            )
-        )
-    return out
+    return [_story_summary_out(r, _norm_tags(r.tags_json)) for r in rows]
 
 
 class PatchStoryBody(BaseModel):
@@ -1080,19 +1245,10 @@ def patch_voice_story(
     if b.summary is not None:
         story.summary = (b.summary or "").strip() or None
     db.add(story)
+    out = _story_summary_out(story, _norm_tags(story.tags_json))
     db.commit()
-    db.refresh(story)
-    tags = story.tags_json if isinstance(story.tags_json, list) else []
-    reminder_tags = [str(t).strip() for t in tags if str(t).strip()][:10]
     logger.info("voice/stories: patched story_id=%s participant_id=%s", story_id, participant_id)
-    return StorySummaryOut(
-        id=story.id,
-        title=(story.title or "").strip() or None,
-        summary=(story.summary or "").strip() or None,
-        status=story.status,
-        reminder_tags=reminder_tags,
-        created_at=story.created_at.isoformat() if story.created_at else "",
-    )
+    return out
 
 
 @router.delete("/stories/{story_id}")
@@ -1135,103 +1291,115 @@ class SharedStoryOut(BaseModel):
     listened: bool | None = None  # True if this participant has listened; None when participant_id not provided
 
 
-@router.get("/stories/shared", response_model=list[SharedStoryOut])
-def list_shared_stories(
-    participant_id: str | None = Query(None, description="If set, include 'listened' per story for this participant"),
-    new_only: bool = Query(False, description="If true and participant_id set, return only stories not yet listened by that participant"),
-    limit: int = Query(50, ge=1, le=100),
-    db: Session = Depends(get_db),
-):
-    """List shared voice stories for the family (memory bank). For conversation starter and play via voice."""
-    moments = (
-        db.query(models.Moment)
+# Shared-story feed (everything but per-participant "listened") is cached per family in
+# app.services.shared_feed_cache; share/delete/edit paths call invalidate_shared_feed_cache().
+SHARED_FEED_MAX_ROWS = 200  # largest window a request can ask for (limit <= 100, doubled for new_only)
+
+
+def _load_shared_feed(db: Session, family_id: str) -> list[SharedStoryOut]:
+    """Newest shared voice stories with author label and has_audio (listened=None)."""
+    # One query: moment + author (moment.participant_id, or the linked VoiceStory's for legacy rows)
+    # + author label + whether a session_audio asset exists.
+    author_id = func.coalesce(
+        models.Moment.participant_id,
+        select(models.VoiceStory.participant_id)
+        .where(
+            models.VoiceStory.shared_moment_id == models.Moment.id,
+            models.VoiceStory.family_id == family_id,
+            models.VoiceStory.participant_id.isnot(None),
+        )
+        .correlate(models.Moment)
+        .limit(1)
+        .scalar_subquery(),
+    )
+    has_audio = (
+        exists()
+        .where(
+            models.MomentAsset.moment_id == models.Moment.id,
+            models.MomentAsset.role == "session_audio",
+            models.MomentAsset.asset_id == models.Asset.id,
+        )
+        .correlate(models.Moment)
+    )
+    rows = (
+        db.query(
+            models.Moment.id,
+            models.Moment.title,
+            models.Moment.summary,
+            models.Moment.reaction_log,
+            _iso_utc(models.Moment.created_at).label("created_at"),
+            models.Moment.participant_id,
+            author_id.label("author_id"),
+            models.VoiceParticipant.label.label("author_label"),
+            has_audio.label("has_audio"),
+        )
+        .outerjoin(models.VoiceParticipant, models.VoiceParticipant.id == author_id)
         .filter(
-            models.Moment.family_id == DEFAULT_FAMILY_ID,
+            models.Moment.family_id == family_id,
             models.Moment.source == "voice_story",
             models.Moment.shared_at.isnot(None),
             models.Moment.deleted_at.is_(None),
         )
         .order_by(models.Moment.created_at.desc())
-        .limit(limit * 2 if new_only and participant_id else limit)
+        .limit(SHARED_FEED_MAX_ROWS)
         .all()
     )
-    if not moments:
-        return []
     # Backfill participant_id for legacy shared moments (so list and delete show correct author)
-    backfilled = False
-    for m in moments:
-        if m.participant_id is None:
-            story = (
-                db.query(models.VoiceStory)
-                .filter(
-                    models.VoiceStory.shared_moment_id == m.id,
-                    models.VoiceStory.family_id == DEFAULT_FAMILY_ID,
-                )
-                .first()
-            )
-            if story and story.participant_id:
-                m.participant_id = story.participant_id
-                db.add(m)
-                backfilled = True
-    if backfilled:
+    backfill = [
+        {"id": r.id, "participant_id": r.author_id}
+        for r in rows
+        if r.participant_id is None and r.author_id
+    ]
+    if backfill:
         try:
+            db.execute(update(models.Moment), backfill)
             db.commit()
         except Exception:
             db.rollback()
-    moment_ids = [str(m.id) for m in moments]
-    # Listened set for this participant
-    listened_set = set()
-    if participant_id:
-        rows = (
-            db.query(models.SharedStoryListen.moment_id)
-            .filter(
-                models.SharedStoryListen.participant_id == participant_id,
-                models.SharedStoryListen.moment_id.in_(moment_ids),
-            )
-            .all()
+    return [
+        SharedStoryOut.model_construct(
+            id=str(r.id),
+            title=(r.title or "").strip() or None,
+            summary=(r.summary or "").strip() or None,
+            reaction_log=(r.reaction_log or "").strip() or None,
+            participant_id=str(r.author_id) if r.author_id else None,
+            participant_name=(r.author_label or "").strip() or "Someone",
+            created_at=r.created_at or "",
+            has_audio=bool(r.has_audio),
+            listened=None,
         )
-        listened_set = {str(r.moment_id) for r in rows}
-    if new_only and participant_id:
-        moments = [m for m in moments if str(m.id) not in listened_set]
-        moment_ids = [str(m.id) for m in moments]
-    # Participant labels
-    part_ids = list({str(m.participant_id) for m in moments if m.participant_id})
-    participants = {}
-    if part_ids:
-        for p in db.query(models.VoiceParticipant).filter(
-            models.VoiceParticipant.id.in_(part_ids),
-        ).all():
-            participants[str(p.id)] = (p.label or "").strip() or "Someone"
-    # Which moments have session_audio
-    has_audio_rows = (
-        db.query(models.MomentAsset.moment_id)
-        .join(models.Asset, models.MomentAsset.asset_id == models.Asset.id)
+        for r in rows
+    ]
+
+
+@router.get("/stories/shared", response_model=list[SharedStoryOut])
+def list_shared_stories(
+    participant_id: str | None = Query(None, description="If set, include 'listened' per story for this participant"),
+    new_only: bool = Query(False, description="If true and participant_id set, return only stories not yet listened by that participant"),
+    limit: int = Query(50, ge=1, le=100),
+    db: Session = Depends(get_db),
+):
+    """List shared voice stories for the family (memory bank). For conversation starter and play via voice."""
+    feed = get_shared_feed(DEFAULT_FAMILY_ID)
+    if feed is None:
+        feed = _load_shared_feed(db, DEFAULT_FAMILY_ID)
+        put_shared_feed(feed, DEFAULT_FAMILY_ID)
+    feed = feed[: limit * 2 if new_only and participant_id else limit]
+    if not feed or not participant_id:
+        return feed[:limit]
+    # Listened set for this participant (never cached: changes on every playback)
+    listened_rows = (
+        db.query(models.SharedStoryListen.moment_id)
         .filter(
-            models.MomentAsset.moment_id.in_(moment_ids),
-            models.MomentAsset.role == "session_audio",
+            models.SharedStoryListen.participant_id == participant_id,
+            models.SharedStoryListen.moment_id.in_([s.id for s in feed]),
         )
-        .distinct()
         .all()
     )
-    has_audio_set = {str(r.moment_id) for r in has_audio_rows}
-    out = []
-    for m in moments:
-        mid = str(m.id)
-        listened = mid in listened_set if participant_id else None
-        out.append(
-            SharedStoryOut(
-                id=mid,
-                title=(m.title or "").strip() or None,
-                summary=(m.summary or "").strip() or None,
-                reaction_log=(getattr(m, "reaction_log", None) or "").strip() or None,
-                participant_id=str(m.participant_id) if m.participant_id else None,
-                participant_name=participants.get(str(m.participant_id or ""), "Someone"),
-                created_at=m.created_at.isoformat() if m.created_at else "",
-                has_audio=mid in has_audio_set,
-                listened=listened,
-            )
-        )
-    return out[:limit]
+    listened_set = {str(r.moment_id) for r in listened_rows}
+    if new_only:
+        feed = [s for s in feed if s.id not in listened_set]
+    return [s.model_copy(update={"listened": s.id in listened_set}) for s in feed[:limit]]
 
 
 class MarkListenedBody(BaseModel):
@@ -1260,15 +1428,266 @@ class NarrateBgmBody(BaseModel):
 class NarrateBgmOut(BaseModel):
     """Signed playback URL for generated BGM, or null if unavailable."""
     url: str | None
+    status: str | None = None  # ready | pending (generation running; poll again) | None (unavailable)
+
+
+# Signed BGM URLs per moment_id, so replays skip the Moment/cache/Asset lookups. Entries expire 5 min
+# before the SAS itself; a "not found" result is remembered briefly to absorb client retries. In-process
+# LRU, so ids that are never asked for again (e.g. bogus moment_ids) can't grow it without bound.
+BGM_URL_NEGATIVE_TTL_SEC = 60.0
+BGM_URL_CACHE_MAX = 1024
+_bgm_url_cache: OrderedDict[str, tuple[float, str | None]] = OrderedDict()
+_bgm_url_cache_lock = threading.Lock()
+
+
+def _bgm_url_ttl_sec() -> float:
+    return max(settings.read_sas_ttl_minutes - 5, 1) * 60.0
+
+
+# moment_id -> deadline for an in-flight background generation (dedupes concurrent misses/polls)
+BGM_PENDING_TTL_SEC = 120.0
+_bgm_pending: dict[str, float] = {}
+
+
+_bgm_pending_lock = threading.Lock()
+
+
+def _bgm_pending_active(moment_id: str) -> bool:
+    deadline = _bgm_pending.get(moment_id)
+    return deadline is not None and time.monotonic() < deadline
+
+
+def _claim_bgm_generation(moment_id: str) -> bool:
+    """Atomically mark moment_id as generating; False if another request already claimed it."""
+    with _bgm_pending_lock:
+        if _bgm_pending_active(moment_id):
+            return False
+        _bgm_pending[moment_id] = time.monotonic() + BGM_PENDING_TTL_SEC
+        return True
+
+
+def _bgm_cached_blob_url(db: Session, moment_id: str) -> str | None:
+    return (
+        db.query(models.Asset.blob_url)
+        .join(models.NarrateBgmCache, models.NarrateBgmCache.asset_id == models.Asset.id)
+        .filter(models.NarrateBgmCache.moment_id == moment_id)
+        .scalar()
+    )
+
+
+def _bgm_asset_for_prompt(db: Session, bgm_key: str) -> tuple[str, str] | None:
+    """(asset_id, blob_url) of an already-generated BGM track for the same prompt, if any."""
+    row = (
+        db.query(models.Asset.id, models.Asset.blob_url)
+        .filter(
+            models.Asset.family_id == DEFAULT_FAMILY_ID,
+            models.Asset.metadata_json["source"].astext == "narrate_bgm",
+            models.Asset.metadata_json["bgm_key"].astext == bgm_key,
+        )
+        .first()
+    )
+    return (row.id, row.blob_url) if row else None
+
+
+def _link_bgm_asset(db: Session, moment_id: str, asset_id: str) -> bool:
+    """Insert the NarrateBgmCache row; False if another instance already filled it (caller rolls back)."""
+    return bool(
+        db.execute(
+            pg_insert(models.NarrateBgmCache)
+            .values(moment_id=moment_id, asset_id=asset_id)
+            .on_conflict_do_nothing(index_elements=["moment_id"])
+        ).rowcount
+    )
+
+
+def _cache_bgm_url(moment_id: str, url: str | None, ttl_sec: float) -> None:
+    with _bgm_url_cache_lock:
+        _bgm_url_cache[moment_id] = (time.monotonic() + ttl_sec, url)
+        _bgm_url_cache.move_to_end(moment_id)
+        while len(_bgm_url_cache) > BGM_URL_CACHE_MAX:
+            _bgm_url_cache.popitem(last=False)
+
+
+def _cached_bgm_url(moment_id: str) -> tuple[bool, str | None]:
+    """Return (hit, url) for moment_id; url is None for a cached not-found."""
+    with _bgm_url_cache_lock:
+        hit = _bgm_url_cache.get(moment_id)
+        if not hit:
+            return False, None
+        if time.monotonic() >= hit[0]:
+            _bgm_url_cache.pop(moment_id, None)
+            return False, None
+        _bgm_url_cache.move_to_end(moment_id)
+        return True, hit[1]
+
+
+BLOB_UPLOAD_BLOCK_BYTES = 1024 * 1024
+
+
+def _upload_blob_blocks(upload_url: str, chunks: Iterable[bytes], content_type: str = "audio/mpeg") -> None:
+    """Stream chunks to Azure as staged blocks (Put Block) then commit them (Put Block List).
+    Holds at most one block in memory and uploads while the source is still producing."""
+    block_ids: list[str] = []
+    buf = bytearray()
+
+    def put_block() -> None:
+        block_id = base64.b64encode(f"{len(block_ids):08d}".encode()).decode()
+        # Append to the SAS query by hand: httpx params= would replace it rather than merge
+        r = _http_client.put(f"{upload_url}&comp=block&blockid={quote(block_id, safe='')}", content=bytes(buf), timeout=30.0)
+        r.raise_for_status()
+        block_ids.append(block_id)
+        buf.clear()
+
+    for chunk in chunks:
+        buf += chunk
+        if len(buf) >= BLOB_UPLOAD_BLOCK_BYTES:
+            put_block()
+    if buf:
+        put_block()
+    if not block_ids:
+        raise ValueError("no audio received")
+    block_list = "".join(f"<Latest>{b}</Latest>" for b in block_ids)
+    r = _http_client.put(
+        f"{upload_url}&comp=blocklist",
+        content=f'<?xml version="1.0" encoding="utf-8"?><BlockList>{block_list}</BlockList>'.encode(),
+        headers={"x-ms-blob-content-type": content_type},
+        timeout=30.0,
+    )
+    r.raise_for_status()
+
+
+def _generate_bgm_and_cache(moment_id: str, text: str) -> None:
+    """Background task: LLM prompt -> ElevenLabs Music -> normalize -> upload -> Asset + NarrateBgmCache.
+    Uses its own session so no request connection is held during the (up to ~40 s) generation."""
+    try:
+        key = (getattr(settings, "azure_storage_account_key", None) or "").strip()
+        # Another API instance may have generated it since the request's cache lookup
+        db = SessionLocal()
+        try:
+            existing_blob_url = _bgm_cached_blob_url(db, moment_id)
+        finally:
+            db.close()
+        if existing_blob_url:
+            url = signed_read_url(existing_blob_url, key, expiry_minutes=settings.read_sas_ttl_minutes)
+            _cache_bgm_url(moment_id, url, _bgm_url_ttl_sec())
+            return
+        api_key = (getattr(settings, "openai_api_key", None) or "").strip()
+        model = (getattr(settings, "openai_text_model", None) or "").strip() or "gpt-4o-mini"
+        elevenlabs_key = (getattr(settings, "elevenlabs_api_key", None) or "").strip()
+        # Upload SAS is local HMAC work that doesn't depend on the audio: sign it first so a bad
+        # storage key fails before any LLM/ElevenLabs spend (15 min TTL covers the ~40 s generation).
+        account = (getattr(settings, "azure_storage_account", None) or "").strip()
+        container = getattr(settings, "audio_container", "audio") or "audio"
+        blob_name = f"narration-bgm/{uuid4()}.mp3"
+        try:
+            blob_url, upload_url = generate_upload_sas(
+                account_name=account,
+                account_key=key,
+                container=container,
+                blob_name=blob_name,
+                expiry_minutes=settings.sas_ttl_minutes,
+            )
+        except Exception as e:
+            logger.warning("voice/narrate/bgm: upload SAS failed: %s", e)
+            return
+        prompt = generate_narrate_music_prompt(text, api_key, model)
+        bgm_key = bgm_cache_key(prompt)
+        # Same prompt (e.g. the default prompt when the LLM is unavailable) -> reuse that track,
+        # skipping the 30-90 s ElevenLabs call and the upload
+        db = SessionLocal()
+        try:
+            reused = _bgm_asset_for_prompt(db, bgm_key)
+            if reused:
+                if _link_bgm_asset(db, moment_id, reused[0]):
+                    db.commit()
+                else:
+                    db.rollback()
+                logger.info("voice/narrate/bgm: reused BGM asset %s for moment_id=%s", reused[0], moment_id)
+        except Exception as e:
+            logger.warning("voice/narrate/bgm: prompt cache lookup failed: %s", e)
+            db.rollback()
+            reused = None
+        finally:
+            db.close()
+        if reused:
+            url = signed_read_url(reused[1], key, expiry_minutes=settings.read_sas_ttl_minutes)
+            _cache_bgm_url(moment_id, url, _bgm_url_ttl_sec())
+            return
+        if ffmpeg_available():
+            # loudnorm needs the whole track, so buffer it, normalize, then upload in one PUT
+            audio_bytes = generate_bgm_audio(prompt, api_key=elevenlabs_key)
+            if not audio_bytes:
+                return
+            normalized_bgm = normalize_lufs_mp3(audio_bytes, BGM_LUFS)
+            if normalized_bgm:
+                audio_bytes = normalized_bgm
+            try:
+                r = _http_client.put(upload_url, content=audio_bytes, headers={"x-ms-blob-type": "BlockBlob"}, timeout=30.0)
+                r.raise_for_status()
+            except Exception as e:
+                logger.warning("voice/narrate/bgm: Azure upload failed: %s", e)
+                return
+        else:
+            # No normalization possible: pipe ElevenLabs chunks straight into Azure blocks
+            try:
+                _upload_blob_blocks(upload_url, iter_bgm_audio(prompt, api_key=elevenlabs_key))
+            except httpx.HTTPStatusError as e:
+                logger.warning("voice/narrate/bgm: streamed generate/upload HTTP %s: %s", e.response.status_code, (e.response.text or "")[:300])
+                return
+            except Exception as e:
+                logger.warning("voice/narrate/bgm: streamed generate/upload failed: %s", e)
+                return
+        # Create Asset and cache
+        db = SessionLocal()
+        try:
+            asset = models.Asset(
+                family_id=DEFAULT_FAMILY_ID,
+                type="audio",
+                blob_url=blob_url,
+                metadata_json={"source": "narrate_bgm", "moment_id": moment_id, "bgm_key": bgm_key},
+            )
+            db.add(asset)
+            db.flush()
+            if not _link_bgm_asset(db, moment_id, asset.id):
+                # Lost the race to another instance: keep its BGM, drop our Asset row
+                db.rollback()
+                logger.info("voice/narrate/bgm: cache already filled for moment_id=%s; orphaned blob %s", moment_id, blob_url)
+                blob_url = _bgm_cached_blob_url(db, moment_id) or blob_url
+            else:
+                db.commit()
+        except Exception as e:
+            logger.warning("voice/narrate/bgm: failed to save asset/cache: %s", e)
+            db.rollback()
+            return
+        finally:
+            db.close()
+        url = signed_read_url(blob_url, key, expiry_minutes=settings.read_sas_ttl_minutes)
+        _cache_bgm_url(moment_id, url, _bgm_url_ttl_sec())
+    except Exception as e:
+        logger.exception("voice/narrate/bgm: generation failed moment_id=%s: %s", moment_id, e)
+    finally:
+        with _bgm_pending_lock:
+            _bgm_pending.pop(moment_id, None)
 
 
 @router.post("/narrate/bgm", response_model=NarrateBgmOut)
-def narrate_bgm(body: NarrateBgmBody, db: Session = Depends(get_db)):
-    """Return BGM URL for this story. Cache hit: instant. Cache miss: generate via LLM + ElevenLabs Music, normalize to -24 LUFS, upload to Azure, cache and return. Returns url=null if ELEVENLABS_API_KEY or Azure not set or generation fails."""
+def narrate_bgm(
+    body: NarrateBgmBody,
+    background_tasks: BackgroundTasks,
+    response: Response,
+    db: Session = Depends(get_db),
+):
+    """Return BGM URL for this story. Cache hit: instant. Cache miss: 202 with status=pending while a background task generates via LLM + ElevenLabs Music, normalizes to -24 LUFS and uploads to Azure; the web clients poll until status=ready. Returns url=null if ELEVENLABS_API_KEY or Azure not set."""
     moment_id = (body.moment_id or "").strip()
     text = (body.text or "").strip()[:6000]
     if not moment_id:
         return NarrateBgmOut(url=None)
+    hit, cached_url = _cached_bgm_url(moment_id)
+    if hit:
+        return NarrateBgmOut(url=cached_url, status="ready" if cached_url else None)
+    if _bgm_pending_active(moment_id):
+        response.status_code = 202
+        return NarrateBgmOut(url=None, status="pending")
     moment = (
         db.query(models.Moment)
         .filter(
@@ -1281,73 +1700,28 @@ def narrate_bgm(body: NarrateBgmBody, db: Session = Depends(get_db)):
         .first()
     )
     if not moment:
+        _cache_bgm_url(moment_id, None, BGM_URL_NEGATIVE_TTL_SEC)
         return NarrateBgmOut(url=None)
     # Cache lookup
-    cached = (
-        db.query(models.NarrateBgmCache)
-        .filter(models.NarrateBgmCache.moment_id == moment_id)
-        .first()
-    )
-    if cached:
-        asset = db.query(models.Asset).filter(models.Asset.id == cached.asset_id).first()
-        if asset and asset.blob_url:
-            key = (getattr(settings, "azure_storage_account_key", None) or "").strip()
-            url = signed_read_url(asset.blob_url, key, expiry_minutes=settings.read_sas_ttl_minutes)
-            return NarrateBgmOut(url=url)
-    # Generate: LLM prompt -> MusicGen -> upload -> Asset -> cache
-    api_key = (getattr(settings, "openai_api_key", None) or "").strip()
-    model = (getattr(settings, "openai_text_model", None) or "").strip() or "gpt-4o-mini"
+    cached_blob_url = _bgm_cached_blob_url(db, moment_id)
+    if cached_blob_url:
+        key = (getattr(settings, "azure_storage_account_key", None) or "").strip()
+        url = signed_read_url(cached_blob_url, key, expiry_minutes=settings.read_sas_ttl_minutes)
+        _cache_bgm_url(moment_id, url, _bgm_url_ttl_sec())
+        return NarrateBgmOut(url=url, status="ready")
     elevenlabs_key = (getattr(settings, "elevenlabs_api_key", None) or "").strip()
     if not elevenlabs_key:
         logger.info("voice/narrate/bgm: ELEVENLABS_API_KEY not set, skipping generation")
         return NarrateBgmOut(url=None)
-    prompt = generate_narrate_music_prompt(text, api_key, model)
-    audio_bytes = generate_bgm_audio(prompt, api_key=elevenlabs_key)
-    if not audio_bytes:
-        return NarrateBgmOut(url=None)
-    normalized_bgm = normalize_lufs_mp3(audio_bytes, BGM_LUFS)
-    if normalized_bgm:
-        audio_bytes = normalized_bgm
-    # Upload to Azure
     account = (getattr(settings, "azure_storage_account", None) or "").strip()
     key = (getattr(settings, "azure_storage_account_key", None) or "").strip()
     if not account or not key:
         logger.warning("voice/narrate/bgm: Azure storage not configured, cannot store BGM")
         return NarrateBgmOut(url=None)
-    container = getattr(settings, "audio_container", "audio") or "audio"
-    blob_name = f"narration-bgm/{uuid4()}.mp3"
-    try:
-        blob_url, upload_url = generate_upload_sas(
-            account_name=account,
-            account_key=key,
-            container=container,
-            blob_name=blob_name,
-            expiry_minutes=settings.sas_ttl_minutes,
-        )
-        with httpx.Client(timeout=30.0) as client:
-            r = client.put(upload_url, content=audio_bytes, headers={"x-ms-blob-type": "BlockBlob"})
-            r.raise_for_status()
-    except Exception as e:
-        logger.warning("voice/narrate/bgm: Azure upload failed: %s", e)
-        return NarrateBgmOut(url=None)
-    # Create Asset and cache
-    try:
-        asset = models.Asset(
-            family_id=DEFAULT_FAMILY_ID,
-            type="audio",
-            blob_url=blob_url,
-            metadata_json={"source": "narrate_bgm", "moment_id": moment_id},
-        )
-        db.add(asset)
-        db.flush()
-        db.add(models.NarrateBgmCache(moment_id=moment_id, asset_id=asset.id))
-        db.commit()
-        url = signed_read_url(blob_url, key, expiry_minutes=settings.read_sas_ttl_minutes)
-        return NarrateBgmOut(url=url)
-    except Exception as e:
-        logger.warning("voice/narrate/bgm: failed to save asset/cache: %s", e)
-        db.rollback()
-        return NarrateBgmOut(url=None)
+    if _claim_bgm_generation(moment_id):
+        background_tasks.add_task(_generate_bgm_and_cache, moment_id, text)
+    response.status_code = 202
+    return NarrateBgmOut(url=None, status="pending")
 
 
 @router.post("/narrate/mood", response_model=NarrateMoodOut)
@@ -1454,35 +1828,36 @@ def _delete_shared_story_impl(moment_id: str, body: DeleteSharedStoryBody, db: S
         raise HTTPException(status_code=400, detail="participant_id is required.")
     if author_id != body_id:
         raise HTTPException(status_code=403, detail="Only the author can delete this story.")
-    # Resolve participant in Python so DB/collation quirks (e.g. Azure Postgres) cannot cause 404
-    all_participants = (
+    # Compare lower(id) in the DB so case/collation quirks (e.g. Azure Postgres) cannot cause 404;
+    # served by ix_voice_participant_lower_id. body_id == author_id at this point.
+    participant = (
         db.query(models.VoiceParticipant)
-        .filter(models.VoiceParticipant.family_id == DEFAULT_FAMILY_ID)
-        .all()
+        .filter(
+            models.VoiceParticipant.family_id == DEFAULT_FAMILY_ID,
+            func.lower(models.VoiceParticipant.id) == body_id,
+        )
+        .first()
     )
-    participant = None
-    for p in all_participants:
-        pid = (str(getattr(p, "id", "") or "")).strip().lower()
-        if pid == body_id or (author_pid and pid == author_pid.lower()):
-            participant = p
-            break
     if not participant:
         raise HTTPException(
             status_code=400,
             detail="Participant not found. Make sure you are signed in as the story author (choose your name in the top bar).",
         )
-    stored = (getattr(participant, "recall_passphrase", None) or "").strip()
+    stored = (participant.recall_passphrase or "").strip()
     if not stored or len(stored) != 64:
         raise HTTPException(status_code=400, detail="No recall code set for this participant.")
     raw = (body.code or "").strip()
-    if not RECALL_PIN_PATTERN.match(raw):
+    if not _is_recall_pin(raw):
         raise HTTPException(status_code=400, detail="Code must be exactly 4 digits.")
     pid = str(participant.id)
-    if _hash_recall_pin(pid, raw) != stored:
+    if not hmac.compare_digest(_hash_recall_pin(pid, raw), stored):
         raise HTTPException(status_code=401, detail="Incorrect pass code.")
     moment.deleted_at = datetime.now(timezone.utc)
     db.add(moment)
     db.commit()
+    with _bgm_url_cache_lock:
+        _bgm_url_cache.pop(moment_id, None)
+    invalidate_shared_feed_cache(DEFAULT_FAMILY_ID)
     logger.info("voice/stories: deleted shared story moment_id=%s participant_id=%s", moment_id, body.participant_id)
     return {"deleted": True}
 
@@ -1516,11 +1891,30 @@ def delete_shared_story(
 
 
 # OpenAI TTS: same voice as realtime agent (alloy) for Narrate Story
+OPENAI_TTS_URL = "https://api.openai.com/v1/audio/speech"
 OPENAI_TTS_MODEL = "tts-1-hd"
 OPENAI_TTS_VOICE = "alloy"
 OPENAI_TTS_MAX_CHARS = 4096
 
 
+def _stream_tts(url: str, voice_label: str, **request_kwargs: Any) -> StreamingResponse:
+    """POST to a TTS endpoint and pass the MP3 through as it arrives (used when there is no LUFS pass to buffer for).
+    Raises httpx.HTTPStatusError before any bytes are sent, so callers can fall back or map the error."""
+    r = _http_client.send(_http_client.build_request("POST", url, timeout=60.0, **request_kwargs), stream=True)
+    if r.is_error:
+        r.read()
+        r.close()
+        r.raise_for_status()
+
+    def body():
+        try:
+            yield from r.iter_bytes()
+        finally:
+            r.close()
+
+    return StreamingResponse(body(), media_type="audio/mpeg", headers={"X-Narration-Voice": voice_label})
+
+
 @router.post("/narrate", response_class=Response)
 def narrate_tts(body: NarrateBody, db: Session = Depends(get_db)):
     """Generate speech from text. If participant_id is set and that participant has a cloned voice (and ELEVENLABS_API_KEY), use ElevenLabs TTS; otherwise OpenAI TTS (alloy). Returns audio/mpeg."""
@@ -1539,7 +1933,7 @@ def narrate_tts(body: NarrateBody, db: Session = Depends(get_db)):
             .first()
         )
         if participant:
-            elevenlabs_voice_id = (getattr(participant, "elevenlabs_voice_id", None) or "").strip() or None
+            elevenlabs_voice_id = (participant.elevenlabs_voice_id or "").strip() or None
     elevenlabs_key = (getattr(settings, "elevenlabs_api_key", None) or "").strip()
     logger.info(
         "voice/narrate: participant_id=%s elevenlabs_voice_id=%s elevenlabs_configured=%s",
@@ -1548,17 +1942,20 @@ def narrate_tts(body: NarrateBody, db: Session = Depends(get_db)):
     if elevenlabs_voice_id and elevenlabs_key:
         try:
             url = ELEVENLABS_TTS_URL_TEMPLATE.format(voice_id=elevenlabs_voice_id)
-            with httpx.Client(timeout=60.0) as client:
-                r = client.post(
-                    url,
-                    headers={
-                        "xi-api-key": elevenlabs_key,
-                        "Content-Type": "application/json",
-                        "Accept": "audio/mpeg",
-                    },
-                    params={"output_format": "mp3_44100_128"},
-                    json={"text": text, "model_id": "eleven_multilingual_v2"},
-                )
+            request_kwargs = {
+                "headers": {
+                    "xi-api-key": elevenlabs_key,
+                    "Content-Type": "application/json",
+                    "Accept": "audio/mpeg",
+                },
+                "params": {"output_format": "mp3_44100_128"},
+                "json": {"text": text, "model_id": "eleven_multilingual_v2"},
+            }
+            if not ffmpeg_available():
+                resp = _stream_tts(url, "cloned", **request_kwargs)
+                logger.info("voice/narrate: streaming ElevenLabs cloned voice participant_id=%s voice_id=%s", participant_id, elevenlabs_voice_id)
+                return resp
+            r = _http_client.post(url, timeout=60.0, **request_kwargs)
             r.raise_for_status()
             content = r.content
             normalized = normalize_lufs_mp3(content, NARRATION_LUFS)
@@ -1583,21 +1980,25 @@ def narrate_tts(body: NarrateBody, db: Session = Depends(get_db)):
     if not api_key:
         raise HTTPException(status_code=503, detail="OpenAI API key not configured. Set OPENAI_API_KEY for narration.")
     try:
-        with httpx.Client(timeout=60.0) as client:
-            r = client.post(
-                "https://api.openai.com/v1/audio/speech",
-                headers={
-                    "Authorization": f"Bearer {api_key}",
-                    "Content-Type": "application/json",
-                },
-                json={
-                    "model": OPENAI_TTS_MODEL,
-                    "input": text,
-                    "voice": OPENAI_TTS_VOICE,
-                    "response_format": "mp3",
-                    "speed": 1.0,
-                },
-            )
+        request_kwargs = {
+            "headers": {
+                "Authorization": f"Bearer {api_key}",
+                "Content-Type": "application/json",
+            },
+            "json": {
+                "model": OPENAI_TTS_MODEL,
+                "input": text,
+                "voice": OPENAI_TTS_VOICE,
+                "response_format": "mp3",
+                "speed": 1.0,
+            },
+        }
+        if not ffmpeg_available():
+            # No loudnorm pass possible: stream instead of buffering the whole MP3
+            resp = _stream_tts(OPENAI_TTS_URL, "default", **request_kwargs)
+            logger.info("voice/narrate: streaming OpenAI default voice (participant_id=%s)", participant_id)
+            return resp
+        r = _http_client.post(OPENAI_TTS_URL, timeout=60.0, **request_kwargs)
         r.raise_for_status()
         content = r.content
         normalized = normalize_lufs_mp3(content, NARRATION_LUFS)
@@ -1684,9 +2085,7 @@ def share_voice_story(
     content_for_title = (story.draft_text or story.summary or "").strip()
     title = (story.title or "").strip() or None
     if content_for_title and not title:
-        api_key = (getattr(settings, "openai_api_key", None) or "").strip()
-        model = (getattr(settings, "openai_text_model", None) or "").strip() or "gpt-4o-mini"
-        ai_title = generate_story_title(content_for_title, api_key, model)
+        ai_title = _story_title(content_for_title)
         if ai_title:
             title = ai_title
     if not title:
@@ -1713,6 +2112,7 @@ def share_voice_story(
     story.status = "shared"
     story.shared_moment_id = moment.id
     db.commit()
+    invalidate_shared_feed_cache(DEFAULT_FAMILY_ID)
     logger.info(
         "voice/stories: shared story_id=%s moment_id=%s participant_id=%s",
         story_id,
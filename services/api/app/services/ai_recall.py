@@ -1,18 +1,192 @@
 """AI-derived recall label: summary and topic tags from participant text (OpenAI). Multilingual-friendly."""
+import functools
+import hashlib
 import json
 import logging
-import re
+import random
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+
 import httpx
+import orjson
 
 logger = logging.getLogger(__name__)
 
+# Request bodies / responses are encoded and decoded with orjson (its JSONDecodeError subclasses json's)
+_dumps = orjson.dumps
+_loads = orjson.loads
+
+OPENAI_CHAT_URL = "https://api.openai.com/v1/chat/completions"
+
+# One keep-alive client for all chat-completion calls (no TCP+TLS handshake per call).
+# Closed from the app shutdown hook via close_http_client().
+_CLIENT = httpx.Client(
+    timeout=15.0,
+    headers={"Content-Type": "application/json"},
+    limits=httpx.Limits(max_keepalive_connections=20, max_connections=100, keepalive_expiry=30.0),
+)
+
+
+def close_http_client() -> None:
+    _CLIENT.close()
+
+
+def _chat_body(model: str, system_json: bytes, user_text: str, options_json: bytes) -> bytes:
+    """Serialized chat-completion request: the pre-encoded system message and options are spliced in
+    as bytes, so only the model name and user message are encoded per call."""
+    return (
+        b'{"model":' + _dumps(model)
+        + b',"messages":[' + system_json + b"," + _dumps({"role": "user", "content": user_text})
+        + b"]," + options_json[1:]  # options object minus its opening brace
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _auth_headers(api_key: str) -> dict[str, str]:
+    return {"Authorization": f"Bearer {api_key}"}
+
+
+# Transient failures (connection errors, timeouts, 429, 5xx) are retried on the same keep-alive client
+OPENAI_RETRY_ATTEMPTS = 3
+OPENAI_RETRY_BASE_SEC = 0.5  # backoff 0.5 s, 1 s, ... plus up to 0.5 s jitter
+OPENAI_RETRY_AFTER_MAX_SEC = 10.0
+# Wall-clock cap on all attempts and waits of one call, so a request path (story title on confirm,
+# narrate mood) holds its worker about as long as a single timed-out attempt, not three plus backoff
+OPENAI_DEADLINE_SEC = 20.0
+OPENAI_ATTEMPT_TIMEOUT_SEC = 15.0
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+def _retry_delay(attempt: int, r: httpx.Response | None = None) -> float:
+    """Seconds to wait before retry number attempt+1: Retry-After when the server sent one, else exponential + jitter."""
+    if r is not None:
+        try:
+            return min(float(r.headers["retry-after"]), OPENAI_RETRY_AFTER_MAX_SEC)
+        except (KeyError, ValueError):
+            pass
+    return OPENAI_RETRY_BASE_SEC * (2 ** attempt) + random.uniform(0, OPENAI_RETRY_BASE_SEC)
+
+
+def _with_openai_retry(
+    send: Callable[[float], httpx.Response],
+    timeout: float = OPENAI_ATTEMPT_TIMEOUT_SEC,
+    deadline_sec: float = OPENAI_DEADLINE_SEC,
+) -> httpx.Response:
+    """Run send(attempt_timeout) and retry transient failures while the deadline allows; each attempt's
+    timeout is capped by the time left. Raises on the final failure like raise_for_status. send may
+    return a streamed response: any response not handed back to the caller is closed."""
+    deadline = time.monotonic() + deadline_sec
+    for attempt in range(OPENAI_RETRY_ATTEMPTS):
+        last = attempt == OPENAI_RETRY_ATTEMPTS - 1
+        remaining = max(deadline - time.monotonic(), 0.1)
+        try:
+            r = send(min(timeout, remaining))
+        except httpx.TransportError as e:
+            delay = _retry_delay(attempt)
+            if last or time.monotonic() + delay >= deadline:
+                raise
+            logger.info("ai_recall: OpenAI %s, retrying in %.1fs", type(e).__name__, delay)
+        else:
+            if r.status_code in _RETRY_STATUSES:
+                delay = _retry_delay(attempt, r)
+                if not last and time.monotonic() + delay < deadline:
+                    r.close()
+                    logger.info("ai_recall: OpenAI HTTP %s, retrying in %.1fs", r.status_code, delay)
+                    time.sleep(delay)
+                    continue
+            if r.is_error:
+                r.close()
+                r.raise_for_status()
+            return r
+        time.sleep(delay)
+    raise AssertionError("unreachable")
+
+
+def _post_openai(
+    body: bytes,
+    api_key: str,
+    timeout: float = OPENAI_ATTEMPT_TIMEOUT_SEC,
+    deadline_sec: float = OPENAI_DEADLINE_SEC,
+) -> httpx.Response:
+    """POST a chat completion through _with_openai_retry."""
+    return _with_openai_retry(
+        lambda t: _CLIENT.post(OPENAI_CHAT_URL, headers=_auth_headers(api_key), content=body, timeout=t),
+        timeout,
+        deadline_sec,
+    )
+
+
+# Results keyed by blake2b(function + model + normalized text): retries, unchanged or re-spaced text
+# and re-shares reuse the answer instead of re-calling OpenAI. In-process LRU; fallback/default
+# results are never stored.
+RESULT_CACHE_MAX = 1024
+RESULT_CACHE_TTL_SEC = 7 * 24 * 3600.0
+_result_cache: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+_result_cache_lock = threading.Lock()
+
+
+def _cache_text(text: str) -> str:
+    """Cache-key form of the input: whitespace runs collapsed only. Case and punctuation are kept, since
+    an edit to either (e.g. fixing a proper noun) can change the title/label/mood the model returns."""
+    return " ".join((text or "").split())
+
+
+def _result_key(fn_name: str, model: str, text: str) -> str:
+    return hashlib.blake2b(f"{fn_name}\0{model}\0{_cache_text(text)}".encode(), digest_size=16).hexdigest()
+
+
+def _cache_get(key: str) -> tuple[bool, Any]:
+    """Return (hit, value) for a result-cache key."""
+    with _result_cache_lock:
+        hit = _result_cache.get(key)
+        if hit and time.monotonic() < hit[0]:
+            _result_cache.move_to_end(key)
+            return True, hit[1]
+    return False, None
+
+
+def _cache_put(key: str, value: Any) -> None:
+    with _result_cache_lock:
+        _result_cache[key] = (time.monotonic() + RESULT_CACHE_TTL_SEC, value)
+        _result_cache.move_to_end(key)
+        while len(_result_cache) > RESULT_CACHE_MAX:
+            _result_cache.popitem(last=False)
+
+
+def _cached(miss: Any) -> Callable:
+    """Memoize fn(text, api_key, model) by content hash; results equal to `miss` (the failure default) are not cached."""
+
+    def decorator(fn: Callable) -> Callable:
+        @functools.wraps(fn)
+        def wrapper(text: str, api_key: str, model: str) -> Any:
+            key = _result_key(fn.__name__, model, text)
+            hit, value = _cache_get(key)
+            if hit:
+                return value
+            result = fn(text, api_key, model)
+            if result != miss:
+                _cache_put(key, result)
+            return result
+
+        return wrapper
+
+    return decorator
+
 SYSTEM_PROMPT = """You are a helper that creates short labels for voice conversation recall.
 Given only what the person (the user) said in a conversation, output:
 1. A one-line summary (max 15 words) of what they talked about or wanted. Use the same language as the input. No filler like "The user said...".
 2. Four to six topic tags: nouns or key themes (e.g. wedding, medication, holiday). No greetings, fillers, or generic words (no "thanks", "yeah", "little", "kind"). Use the same language as the input.
 Output valid JSON only, no markdown: {"summary": "...", "tags": ["tag1", "tag2", ...]}"""
 
+# Per-helper request parts, JSON-encoded once at import; each call only encodes model and the user message
+_RECALL_SYSTEM_JSON = _dumps({"role": "system", "content": SYSTEM_PROMPT})
+_RECALL_OPTIONS_JSON = _dumps({"max_tokens": 200, "temperature": 0.3, "response_format": {"type": "json_object"}})
 
+
+@_cached(miss=(None, []))
 def generate_recall_label(participant_text: str, api_key: str, model: str) -> tuple[str | None, list[str]]:
     """
     Call OpenAI to produce a one-line summary and topic tags from participant-only text.
@@ -23,29 +197,11 @@ def generate_recall_label(participant_text: str, api_key: str, model: str) -> tu
     if not text or not api_key:
         return None, []
 
-    payload = {
-        "model": model or "gpt-4o-mini",
-        "messages": [
-            {"role": "system", "content": SYSTEM_PROMPT},
-            {"role": "user", "content": text[:8000]},  # cap length
-        ],
-        "max_tokens": 200,
-        "temperature": 0.3,
-    }
+    body = _chat_body(model or "gpt-4o-mini", _RECALL_SYSTEM_JSON, text[:8000], _RECALL_OPTIONS_JSON)  # cap length
 
     try:
-        with httpx.Client() as client:
-            r = client.post(
-                "https://api.openai.com/v1/chat/completions",
-                headers={
-                    "Authorization": f"Bearer {api_key}",
-                    "Content-Type": "application/json",
-                },
-                json=payload,
-                timeout=15.0,
-            )
-        r.raise_for_status()
-        data = r.json()
+        r = _post_openai(body, api_key)
+        data = _loads(r.content)
         choice = (data.get("choices") or [None])[0]
         if not choice:
             return None, []
@@ -56,11 +212,85 @@ def generate_recall_label(participant_text: str, api_key: str, model: str) -> tu
         return None, []
 
 
+RECALL_BATCH_SIZE = 20  # texts per chat completion
+RECALL_BATCH_WORKERS = 4  # batches in flight at once
+
+RECALL_BATCH_PROMPT = """You are a helper that creates short labels for voice conversation recall.
+The input is a JSON array of texts; each is only what one person (the user) said in one conversation. For EACH text, output:
+1. A one-line summary (max 15 words) of what they talked about or wanted. Use the same language as that text. No filler like "The user said...".
+2. Four to six topic tags: nouns or key themes (e.g. wedding, medication, holiday). No greetings, fillers, or generic words (no "thanks", "yeah", "little", "kind"). Use the same language as that text.
+Output valid JSON only, no markdown, with exactly one label per input text in the same order: {"labels": [{"summary": "...", "tags": ["tag1", "tag2", ...]}, ...]}"""
+
+_RECALL_BATCH_SYSTEM_JSON = _dumps({"role": "system", "content": RECALL_BATCH_PROMPT})
+
+
+def _recall_label_batch(texts: list[str], api_key: str, model: str) -> list[tuple[str | None, list[str]]]:
+    """One chat completion labelling up to RECALL_BATCH_SIZE texts; all (None, []) if the reply doesn't line up."""
+    failed = [(None, [])] * len(texts)
+    options_json = _dumps(
+        {"max_tokens": 200 * len(texts), "temperature": 0.3, "response_format": {"type": "json_object"}}
+    )
+    user_text = _dumps([t[:8000] for t in texts]).decode()
+    try:
+        r = _post_openai(
+            _chat_body(model or "gpt-4o-mini", _RECALL_BATCH_SYSTEM_JSON, user_text, options_json),
+            api_key,
+            timeout=60.0,
+            deadline_sec=180.0,  # script-only batch call: room for all retries
+        )
+        choice = (_loads(r.content).get("choices") or [None])[0]
+        labels = _loads(((choice or {}).get("message") or {}).get("content") or "{}").get("labels")
+        if not isinstance(labels, list) or len(labels) != len(texts):
+            logger.warning("ai_recall: batch label count mismatch (sent %d)", len(texts))
+            return failed
+        return [_label_from_obj(obj) for obj in labels]
+    except Exception as e:
+        logger.warning("ai_recall: batch recall label call failed: %s", e)
+        return failed
+
+
+def generate_recall_labels_batch(
+    participant_texts: list[str], api_key: str, model: str
+) -> list[tuple[str | None, list[str]]]:
+    """
+    generate_recall_label for many texts (backfills, bulk imports): RECALL_BATCH_SIZE texts per request,
+    a few requests in parallel. Returns one (summary, tags) per input, in order; (None, []) for empty
+    input or failures. Shares the result cache with generate_recall_label.
+    """
+    results: list[tuple[str | None, list[str]]] = [(None, [])] * len(participant_texts)
+    if not api_key:
+        return results
+    todo: list[tuple[int, str, str]] = []
+    for i, raw in enumerate(participant_texts):
+        text = (raw or "").strip()
+        if not text:
+            continue
+        key = _result_key("generate_recall_label", model, text)
+        hit, value = _cache_get(key)
+        if hit:
+            results[i] = value
+        else:
+            todo.append((i, text, key))
+    chunks = [todo[n : n + RECALL_BATCH_SIZE] for n in range(0, len(todo), RECALL_BATCH_SIZE)]
+    with ThreadPoolExecutor(max_workers=RECALL_BATCH_WORKERS) as pool:
+        batch_results = pool.map(lambda chunk: _recall_label_batch([t for _, t, _ in chunk], api_key, model), chunks)
+        for chunk, labels in zip(chunks, batch_results):
+            for (i, _, key), label in zip(chunk, labels):
+                results[i] = label
+                if label != (None, []):
+                    _cache_put(key, label)
+    return results
+
+
 STORY_TITLE_PROMPT = """You are a helper that creates a short, descriptive title for a family story.
 Given the story text (from a voice conversation or narrative), output a single line: a title of 4 to 10 words that captures the main theme or subject. Use the same language as the input. No quotes, no "Title:", no filler.
 Output only the title line, nothing else."""
 
+_TITLE_SYSTEM_JSON = _dumps({"role": "system", "content": STORY_TITLE_PROMPT})
+_TITLE_OPTIONS_JSON = _dumps({"max_tokens": 60, "temperature": 0.3})
 
+
+@_cached(miss=None)
 def generate_story_title(story_content: str, api_key: str, model: str) -> str | None:
     """
     Call OpenAI to produce a short title (4–10 words) from story content.
@@ -69,28 +299,10 @@ def generate_story_title(story_content: str, api_key: str, model: str) -> str |
     text = (story_content or "").strip()
     if not text or not api_key:
         return None
-    payload = {
-        "model": model or "gpt-4o-mini",
-        "messages": [
-            {"role": "system", "content": STORY_TITLE_PROMPT},
-            {"role": "user", "content": text[:6000]},
-        ],
-        "max_tokens": 60,
-        "temperature": 0.3,
-    }
+    body = _chat_body(model or "gpt-4o-mini", _TITLE_SYSTEM_JSON, text[:6000], _TITLE_OPTIONS_JSON)
     try:
-        with httpx.Client() as client:
-            r = client.post(
-                "https://api.openai.com/v1/chat/completions",
-                headers={
-                    "Authorization": f"Bearer {api_key}",
-                    "Content-Type": "application/json",
-                },
-                json=payload,
-                timeout=15.0,
-            )
-        r.raise_for_status()
-        data = r.json()
+        r = _post_openai(body, api_key)
+        data = _loads(r.content)
         choice = (data.get("choices") or [None])[0]
         if not choice:
             return None
@@ -109,7 +321,46 @@ Given the story text below:
 2. Infer emotional tone and atmosphere (e.g. nostalgic, tender, warm, reflective).
 3. Output 1-3 sentences that describe the ideal background music. Be specific: instruments (e.g. soft piano, gentle strings), mood, tempo (e.g. 60 bpm), and cultural/language appropriateness. You MUST include: "instrumental only", "no vocals", and "suitable for voiceover" or "suitable for narration". Keep the whole prompt under 200 characters if possible."""
 
+_MUSIC_PROMPT_SYSTEM_JSON = _dumps({"role": "system", "content": NARRATE_MUSIC_PROMPT_SYSTEM})
+_MUSIC_PROMPT_OPTIONS_JSON = _dumps({"max_tokens": 150, "temperature": 0.3, "stream": True})
+
+
+def _stream_chat_content(body: bytes, api_key: str, max_chars: int) -> str | None:
+    """Chat completion via SSE (body must set "stream": true), concatenating delta.content as it arrives.
+    Returns None as soon as the text exceeds max_chars (the caller would reject it anyway)."""
+    parts: list[str] = []
+    size = 0
+    # Opening the stream (status line + headers) is retried like any other call; the body is not
+    r = _with_openai_retry(
+        lambda t: _CLIENT.send(
+            _CLIENT.build_request("POST", OPENAI_CHAT_URL, headers=_auth_headers(api_key), content=body, timeout=t),
+            stream=True,
+        )
+    )
+    try:
+        for line in r.iter_lines():
+            if not line.startswith("data:"):
+                continue
+            data = line[5:].strip()
+            if data == "[DONE]":
+                break
+            choice = (_loads(data).get("choices") or [None])[0]
+            piece = ((choice or {}).get("delta") or {}).get("content") or ""
+            if piece:
+                parts.append(piece)
+                size += len(piece)
+                if size > max_chars:
+                    return None
+    finally:
+        r.close()
+    return "".join(parts)
+
 
+MUSIC_PROMPT_MAX_CHARS = 500
+DEFAULT_MUSIC_PROMPT = "Soft ambient piano, gentle, 60 bpm, instrumental only, no vocals, suitable for voiceover."
+
+
+@_cached(miss=DEFAULT_MUSIC_PROMPT)
 def generate_narrate_music_prompt(story_text: str, api_key: str, model: str) -> str:
     """
     Produce a music-generation prompt from the full story for synthetic BGM.
@@ -117,37 +368,18 @@ def generate_narrate_music_prompt(story_text: str, api_key: str, model: str) ->
     On failure or empty input, returns a safe default prompt.
     """
     text = (story_text or "").strip()
-    default_prompt = "Soft ambient piano, gentle, 60 bpm, instrumental only, no vocals, suitable for voiceover."
+    default_prompt = DEFAULT_MUSIC_PROMPT
     if not text or not api_key:
         return default_prompt
-    payload = {
-        "model": model or "gpt-4o-mini",
-        "messages": [
-            {"role": "system", "content": NARRATE_MUSIC_PROMPT_SYSTEM},
-            {"role": "user", "content": text[:4000]},
-        ],
-        "max_tokens": 150,
-        "temperature": 0.3,
-    }
+    body = _chat_body(model or "gpt-4o-mini", _MUSIC_PROMPT_SYSTEM_JSON, text[:4000], _MUSIC_PROMPT_OPTIONS_JSON)
     try:
-        with httpx.Client() as client:
-            r = client.post(
-                "https://api.openai.com/v1/chat/completions",
-                headers={
-                    "Authorization": f"Bearer {api_key}",
-                    "Content-Type": "application/json",
-                },
-                json=payload,
-                timeout=15.0,
-            )
-        r.raise_for_status()
-        data = r.json()
-        choice = (data.get("choices") or [None])[0]
-        if not choice:
+        # Streamed so an over-long answer (rejected below) is abandoned mid-generation; a little
+        # slack covers the quotes/whitespace that are stripped before the length check
+        content = _stream_chat_content(body, api_key, max_chars=MUSIC_PROMPT_MAX_CHARS + 16)
+        if content is None:
             return default_prompt
-        content = (choice.get("message") or {}).get("content") or ""
         prompt = content.strip().strip('"').strip()
-        if not prompt or len(prompt) > 500:
+        if not prompt or len(prompt) > MUSIC_PROMPT_MAX_CHARS:
             return default_prompt
         if "instrumental" not in prompt.lower() and "no vocals" not in prompt.lower():
             prompt = prompt.rstrip(".") + ". Instrumental only, no vocals, suitable for voiceover."
@@ -170,22 +402,41 @@ NARRATE_TRACK_REGISTRY = [
 
 NARRATE_TRACK_IDS = frozenset(t["id"] for t in NARRATE_TRACK_REGISTRY)
 
-NARRATE_MUSIC_SELECTION_PROMPT = """You are choosing background music for a family story that will be read aloud. The music plays softly under the voice and should make the story more memorable without ever distracting from the words.
+# Track list in the prompt is rendered from the registry so the two can't drift apart
+_track_lines = "\n".join(f"{t['id']} — {t['description']}" for t in NARRATE_TRACK_REGISTRY)
+
+NARRATE_MUSIC_SELECTION_PROMPT = f"""You are choosing background music for a family story that will be read aloud. The music plays softly under the voice and should make the story more memorable without ever distracting from the words.
 
 Your job: review the FULL narration below. Consider its content, situation, emotional arc, key moments, and who or what it is about. Then choose the single track that best fits—the one that will support and deepen the listener's experience.
 
 Available tracks (reply with exactly one track id):
 
-reflective — Calm, thoughtful. Gentle piano or soft pads. For life reflections, wisdom, quiet contemplation, looking inward.
-warm — Joyful and loving. Uplifting but soft. For celebrations, family love, weddings, births, gratitude, togetherness.
-nostalgic — Bittersweet looking back. Melancholy but gentle. For childhood memories, past places, people no longer here, heritage.
-tender — Gentle sadness, comfort, care. For loss, illness, hard times, saying goodbye, or stories that need emotional holding.
-gentle_adventure — Light curiosity and movement. For travel, discovery, first times, small triumphs, gentle excitement.
-neutral — Calm and unobtrusive. For mixed or general stories where no single mood dominates, or when in doubt.
+{_track_lines}
+
+Reply with valid JSON only, no markdown: {{"track_id": "<one of the ids above>", "music_brief": "<one short sentence explaining why this track fits this story>"}}"""
 
-Reply with valid JSON only, no markdown: {"track_id": "<one of the ids above>", "music_brief": "<one short sentence explaining why this track fits this story>"}"""
+# Structured output: the API guarantees JSON matching this schema, track_id restricted to the registry
+NARRATE_MOOD_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "pick_track",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "track_id": {"type": "string", "enum": [t["id"] for t in NARRATE_TRACK_REGISTRY]},
+                "music_brief": {"type": "string"},
+            },
+            "required": ["track_id", "music_brief"],
+            "additionalProperties": False,
+        },
+    },
+}
+_MOOD_SYSTEM_JSON = _dumps({"role": "system", "content": NARRATE_MUSIC_SELECTION_PROMPT})
+_MOOD_OPTIONS_JSON = _dumps({"max_tokens": 120, "temperature": 0.2, "response_format": NARRATE_MOOD_RESPONSE_FORMAT})
 
 
+@_cached(miss=("neutral", ""))
 def generate_narrate_mood(story_text: str, api_key: str, model: str) -> tuple[str, str]:
     """
     AI-driven: review the full narration and pick the best background music track.
@@ -195,28 +446,10 @@ def generate_narrate_mood(story_text: str, api_key: str, model: str) -> tuple[st
     text = (story_text or "").strip()
     if not text or not api_key:
         return "neutral", ""
-    payload = {
-        "model": model or "gpt-4o-mini",
-        "messages": [
-            {"role": "system", "content": NARRATE_MUSIC_SELECTION_PROMPT},
-            {"role": "user", "content": text[:6000]},
-        ],
-        "max_tokens": 120,
-        "temperature": 0.2,
-    }
+    body = _chat_body(model or "gpt-4o-mini", _MOOD_SYSTEM_JSON, text[:6000], _MOOD_OPTIONS_JSON)
     try:
-        with httpx.Client() as client:
-            r = client.post(
-                "https://api.openai.com/v1/chat/completions",
-                headers={
-                    "Authorization": f"Bearer {api_key}",
-                    "Content-Type": "application/json",
-                },
-                json=payload,
-                timeout=15.0,
-            )
-        r.raise_for_status()
-        data = r.json()
+        r = _post_openai(body, api_key)
+        data = _loads(r.content)
         choice = (data.get("choices") or [None])[0]
         if not choice:
             return "neutral", ""
@@ -228,31 +461,29 @@ def generate_narrate_mood(story_text: str, api_key: str, model: str) -> tuple[st
         return "neutral", ""
 
 
-def _parse_narrate_music_response(content: str) -> tuple[str, str]:
-    """Parse JSON { track_id, music_brief } from model output. Returns (track_id, music_brief); track_id validated against registry."""
+def _strip_code_fence(content: str) -> str:
+    """Strip whitespace and a surrounding markdown code block (```json ... ```) if present; plain string ops."""
     content = (content or "").strip()
     if content.startswith("```"):
-        content = re.sub(r"^```(?:json)?\s*", "", content)
-        content = re.sub(r"\s*```$", "", content)
+        content = content[3:].removeprefix("json").lstrip()
+        if content.endswith("```"):
+            content = content[:-3].rstrip()
+    return content
+
+
+def _parse_narrate_music_response(content: str) -> tuple[str, str]:
+    """Parse the schema-constrained { track_id, music_brief } JSON. Returns (track_id, music_brief)."""
     try:
-        obj = json.loads(content)
-        raw_id = (obj.get("track_id") or "").strip().lower()
-        track_id = raw_id if raw_id in NARRATE_TRACK_IDS else "neutral"
-        music_brief = (obj.get("music_brief") or "").strip() or ""
-        return track_id, music_brief
-    except (json.JSONDecodeError, TypeError, KeyError):
+        obj = _loads(content)
+        track_id = obj["track_id"]
+        return (track_id if track_id in NARRATE_TRACK_IDS else "neutral"), obj["music_brief"].strip()
+    except (json.JSONDecodeError, TypeError, KeyError, AttributeError):
         return "neutral", ""
 
 
-def _parse_response(content: str) -> tuple[str | None, list[str]]:
-    """Parse JSON summary + tags from model output. Tolerates markdown code blocks."""
-    content = (content or "").strip()
-    # Strip markdown code block if present
-    if content.startswith("```"):
-        content = re.sub(r"^```(?:json)?\s*", "", content)
-        content = re.sub(r"\s*```$", "", content)
+def _label_from_obj(obj: Any) -> tuple[str | None, list[str]]:
+    """(summary, tags) from one {"summary": ..., "tags": [...]} object."""
     try:
-        obj = json.loads(content)
         summary = (obj.get("summary") or "").strip() or None
         raw_tags = obj.get("tags")
         if isinstance(raw_tags, list):
@@ -260,5 +491,14 @@ def _parse_response(content: str) -> tuple[str | None, list[str]]:
         else:
             tags = []
         return summary, tags
-    except (json.JSONDecodeError, TypeError):
+    except (TypeError, AttributeError):
+        return None, []
+
+
+def _parse_response(content: str) -> tuple[str | None, list[str]]:
+    """Parse JSON summary + tags from model output. Tolerates markdown code blocks."""
+    content = _strip_code_fence(content)
+    try:
+        return _label_from_obj(_loads(content))
+    except json.JSONDecodeError:
         return None, []
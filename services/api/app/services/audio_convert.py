@@ -1,12 +1,15 @@
 """
 Convert uploaded audio to WAV 16 kHz 16-bit mono for Azure Speaker Recognition.
-Accepts webm, wav, or other formats supported by pydub/ffmpeg.
+Accepts webm, wav, or other formats supported by ffmpeg.
 
 Also provides LUFS normalization for narration (TTS) and BGM using ffmpeg loudnorm.
 """
-import io
+import asyncio
 import logging
+import shutil
+import struct
 import subprocess
+from functools import lru_cache
 from typing import Optional
 
 logger = logging.getLogger(__name__)
@@ -17,6 +20,33 @@ BGM_LUFS = -24
 FFMPEG_LOUDNORM_TIMEOUT = 60
 
 
+@lru_cache(maxsize=1)
+def ffmpeg_available() -> bool:
+    """True if ffmpeg is on PATH (LUFS normalization and non-WAV conversion need it)."""
+    return shutil.which("ffmpeg") is not None
+
+
+def _loudnorm_cmd(target_lufs: float) -> list[str]:
+    # Clamp to valid loudnorm range
+    i = max(-70.0, min(-5.0, target_lufs))
+    return [
+        "ffmpeg",
+        "-nostdin",
+        "-i",
+        "pipe:0",
+        "-af",
+        f"loudnorm=I={i}:TP=-1.5:LRA=11",
+        "-ar",
+        "44100",
+        # libmp3lame algorithm quality (LAME -q 5): cheaper psychoacoustic search than LAME's default
+        "-compression_level",
+        "5",
+        "-f",
+        "mp3",
+        "pipe:1",
+    ]
+
+
 def normalize_lufs_mp3(audio_bytes: bytes, target_lufs: float) -> Optional[bytes]:
     """
     Normalize MP3 audio to target integrated loudness (LUFS) using ffmpeg loudnorm.
@@ -24,23 +54,9 @@ def normalize_lufs_mp3(audio_bytes: bytes, target_lufs: float) -> Optional[bytes
     """
     if not audio_bytes or len(audio_bytes) < 100:
         return None
-    # Clamp to valid loudnorm range
-    i = max(-70.0, min(-5.0, target_lufs))
     try:
         proc = subprocess.run(
-            [
-                "ffmpeg",
-                "-nostdin",
-                "-i",
-                "pipe:0",
-                "-af",
-                f"loudnorm=I={i}:TP=-1.5:LRA=11",
-                "-ar",
-                "44100",
-                "-f",
-                "mp3",
-                "pipe:1",
-            ],
+            _loudnorm_cmd(target_lufs),
             input=audio_bytes,
             capture_output=True,
             timeout=FFMPEG_LOUDNORM_TIMEOUT,
@@ -64,34 +80,80 @@ def normalize_lufs_mp3(audio_bytes: bytes, target_lufs: float) -> Optional[bytes
         return None
 
 
-def to_wav_16k_mono(data: bytes, content_type: Optional[str] = None) -> Optional[bytes]:
+def _input_format(content_type: Optional[str]) -> Optional[str]:
+    """ffmpeg demuxer name for a known upload content type (lets ffmpeg skip probing), else None."""
+    if not content_type:
+        return None
+    if "webm" in content_type:
+        return "webm"
+    if "wav" in content_type or "wave" in content_type:
+        return "wav"
+    if "ogg" in content_type:
+        return "ogg"
+    if "mp3" in content_type or "mpeg" in content_type:
+        return "mp3"
+    return None
+
+
+def is_wav_16k_mono(data: bytes | bytearray | memoryview) -> bool:
+    """True if data is uncompressed PCM WAV already at 16 kHz, mono, 16-bit (header check, no ffmpeg)."""
+    if len(data) < 44:
+        return False
+    mv = memoryview(data)
+    if mv[:4] != b"RIFF" or mv[8:12] != b"WAVE" or mv[12:16] != b"fmt ":
+        return False
+    audio_format, channels, sample_rate = struct.unpack_from("<HHI", mv, 20)
+    bits = struct.unpack_from("<H", mv, 34)[0]
+    return (audio_format, channels, sample_rate, bits) == (1, 1, 16000, 16)
+
+
+def _wav_cmd(content_type: Optional[str]) -> list[str]:
+    cmd = ["ffmpeg", "-nostdin"]
+    fmt = _input_format(content_type)
+    if fmt:
+        cmd += ["-f", fmt]
+    return cmd + ["-i", "pipe:0", "-ac", "1", "-ar", "16000", "-f", "wav", "-acodec", "pcm_s16le", "pipe:1"]
+
+
+async def to_wav_16k_mono_async(
+    data: bytes | bytearray | memoryview, content_type: Optional[str] = None
+) -> bytes | bytearray | memoryview | None:
     """
     Convert audio bytes to WAV 16 kHz 16-bit mono. Returns None if conversion fails.
+    Accepts any bytes-like input (bytes, bytearray, memoryview) without copying it first.
+    Single ffmpeg process (bytes in on stdin, WAV out on stdout) run as an asyncio subprocess, so
+    waiting on it holds neither the event loop nor a threadpool worker. Input that is already
+    16 kHz mono 16-bit WAV is returned as-is (same object and type) without starting ffmpeg.
     """
-    try:
-        from pydub import AudioSegment
-    except ImportError:
-        logger.debug("pydub not installed; cannot convert audio")
-        return None
     if not data or len(data) < 100:
         return None
+    if is_wav_16k_mono(data):
+        return data
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            *_wav_cmd(content_type),
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+    except FileNotFoundError:
+        logger.debug("audio_convert: ffmpeg not found; cannot convert audio")
+        return None
     try:
-        fmt = None
-        if content_type:
-            if "webm" in content_type:
-                fmt = "webm"
-            elif "wav" in content_type or "wave" in content_type:
-                fmt = "wav"
-            elif "ogg" in content_type:
-                fmt = "ogg"
-            elif "mp3" in content_type or "mpeg" in content_type:
-                fmt = "mp3"
-        seg = AudioSegment.from_file(io.BytesIO(data), format=fmt)
-        seg = seg.set_channels(1)
-        seg = seg.set_frame_rate(16000)
-        out = io.BytesIO()
-        seg.export(out, format="wav", parameters=["-acodec", "pcm_s16le"])
-        return out.getvalue()
+        stdout, stderr = await asyncio.wait_for(proc.communicate(input=data), timeout=FFMPEG_LOUDNORM_TIMEOUT)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        logger.warning("audio_convert: wav conversion timed out")
+        return None
     except Exception as e:
         logger.warning("audio_convert: %s", e)
         return None
+    if proc.returncode != 0 or not stdout:
+        logger.warning(
+            "audio_convert: wav conversion failed returncode=%s stderr=%s",
+            proc.returncode,
+            (stderr or b"")[:500].decode("utf-8", errors="replace"),
+        )
+        return None
+    return stdout
@@ -1,5 +1,7 @@
 """AI-generated background music for narration (ElevenLabs Music API)."""
+import hashlib
 import logging
+from collections.abc import Iterator
 
 import httpx
 
@@ -8,6 +10,56 @@ logger = logging.getLogger(__name__)
 ELEVENLABS_MUSIC_URL = "https://api.elevenlabs.io/v1/music"
 DEFAULT_DURATION_SEC = 60  # frontend loops if narration is longer
 HTTP_TIMEOUT = 120.0  # music generation can take 30-90s
+MUSIC_MODEL_ID = "music_v1"
+STREAM_CHUNK_BYTES = 64 * 1024
+
+# Shared keep-alive client; closed from the app shutdown hook via close_http_client()
+_CLIENT = httpx.Client(
+    timeout=HTTP_TIMEOUT,
+    headers={"Content-Type": "application/json"},
+    limits=httpx.Limits(max_keepalive_connections=20, max_connections=100, keepalive_expiry=30.0),
+)
+
+
+def close_http_client() -> None:
+    _CLIENT.close()
+
+
+def _music_length_ms(duration: int) -> int:
+    # music_length_ms: 3000–600000 (3s–10min); use duration in ms
+    return min(max(5000, duration * 1000), 120000)  # 5s–120s for BGM
+
+
+def bgm_cache_key(prompt: str, duration: int = DEFAULT_DURATION_SEC) -> str:
+    """Stable key for the track generate_bgm_audio would produce: same prompt, length and model -> same key."""
+    raw = f"{(prompt or '').strip()[:4100]}|{_music_length_ms(duration)}|{MUSIC_MODEL_ID}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def iter_bgm_audio(
+    prompt: str, duration: int = DEFAULT_DURATION_SEC, api_key: str = "", chunk_size: int = STREAM_CHUNK_BYTES
+) -> Iterator[bytes]:
+    """
+    Generate instrumental BGM via ElevenLabs Music API, yielding MP3 chunks as they arrive so callers
+    can forward them without buffering the whole track. Raises on HTTP/transport errors.
+    """
+    payload = {
+        "prompt": prompt.strip()[:4100],
+        "music_length_ms": _music_length_ms(duration),
+        "force_instrumental": True,
+        "model_id": MUSIC_MODEL_ID,
+    }
+    with _CLIENT.stream(
+        "POST",
+        ELEVENLABS_MUSIC_URL,
+        params={"output_format": "mp3_22050_32"},
+        headers={"xi-api-key": api_key.strip()},
+        json=payload,
+    ) as r:
+        if r.is_error:
+            r.read()  # load the error body so callers can log e.response.text
+        r.raise_for_status()
+        yield from r.iter_bytes(chunk_size)
 
 
 def generate_bgm_audio(prompt: str, duration: int = DEFAULT_DURATION_SEC, api_key: str = "") -> bytes | None:
@@ -22,27 +74,8 @@ def generate_bgm_audio(prompt: str, duration: int = DEFAULT_DURATION_SEC, api_ke
         logger.warning("music_generation: ELEVENLABS_API_KEY not set")
         return None
 
-    # music_length_ms: 3000–600000 (3s–10min); use duration in ms
-    length_ms = min(max(5000, duration * 1000), 120000)  # 5s–120s for BGM
-    payload = {
-        "prompt": prompt[:4100],
-        "music_length_ms": length_ms,
-        "force_instrumental": True,
-        "model_id": "music_v1",
-    }
     try:
-        with httpx.Client(timeout=HTTP_TIMEOUT) as client:
-            r = client.post(
-                ELEVENLABS_MUSIC_URL,
-                params={"output_format": "mp3_22050_32"},
-                headers={
-                    "Content-Type": "application/json",
-                    "xi-api-key": key,
-                },
-                json=payload,
-            )
-            r.raise_for_status()
-            return r.content
+        return b"".join(iter_bgm_audio(prompt, duration, key))
     except httpx.HTTPStatusError as e:
         logger.warning("music_generation: ElevenLabs HTTP %s: %s", e.response.status_code, (e.response.text or "")[:300])
         return None
@@ -0,0 +1,29 @@
+"""
+In-process cache of the shared-story feed per family (every home-screen load reads it).
+
+The voice router fills it; any router that shares, edits or deletes a story invalidates it. The TTL
+bounds staleness from anything that can't invalidate (e.g. maintenance scripts).
+"""
+import time
+from typing import Any
+
+from app.core.config import DEFAULT_FAMILY_ID
+
+SHARED_FEED_CACHE_TTL_SEC = 60.0
+_shared_feed_cache: dict[str, tuple[float, list[Any]]] = {}
+
+
+def get_shared_feed(family_id: str = DEFAULT_FAMILY_ID) -> list[Any] | None:
+    """Cached feed for family_id, or None if missing or older than the TTL."""
+    hit = _shared_feed_cache.get(family_id)
+    if hit and time.monotonic() - hit[0] < SHARED_FEED_CACHE_TTL_SEC:
+        return hit[1]
+    return None
+
+
+def put_shared_feed(feed: list[Any], family_id: str = DEFAULT_FAMILY_ID) -> None:
+    _shared_feed_cache[family_id] = (time.monotonic(), feed)
+
+
+def invalidate_shared_feed_cache(family_id: str = DEFAULT_FAMILY_ID) -> None:
+    _shared_feed_cache.pop(family_id, None)
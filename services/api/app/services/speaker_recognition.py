@@ -2,19 +2,52 @@
 Azure Speaker Recognition (Voice ID): create profile, enroll, identify.
 Uses REST API 2021-09-05. Audio: WAV, 16 kHz, 16-bit mono PCM.
 """
+import asyncio
+import importlib.util
 import logging
+from collections import OrderedDict
+from functools import cache
+from hashlib import sha256
 from typing import Any
 
 import httpx
+import orjson
 
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Request bodies / responses are encoded and decoded with orjson
+_dumps = orjson.dumps
+_loads = orjson.loads
+
 API_VERSION = "2021-09-05"
 BASE_PATH = "speaker-recognition/identification/text-independent"
 
+# Shared keep-alive async client: one TCP+TLS handshake to the Speech endpoint instead of one per call,
+# and routes await Azure without holding a worker thread. Closed from the app shutdown hook via aclose_http_client().
+# HTTP/2 (optional, needs the h2 package) multiplexes concurrent enroll/identify calls over that one connection.
+_ACLIENT = httpx.AsyncClient(
+    http2=importlib.util.find_spec("h2") is not None,
+    timeout=httpx.Timeout(30.0, connect=5.0),
+    limits=httpx.Limits(max_keepalive_connections=20, max_connections=100, keepalive_expiry=30.0),
+)
+
+
+# identify results for identical audio against the same profiles (client retries, duplicate segments).
+# Key: sha256(audio) + sorted profile ids. Only answered requests are cached; enrollment clears it.
+IDENTIFY_CACHE_MAX = 256
+# Max in-flight Azure requests per identify_many / enroll_many batch
+BATCH_CONCURRENCY = 10
+_identify_cache: OrderedDict[str, str | None] = OrderedDict()
+
+
+async def aclose_http_client() -> None:
+    await _ACLIENT.aclose()
+
 
+# settings is frozen at import, so endpoint and auth header are computed once
+@cache
 def _base_url() -> str:
     endpoint = (settings.azure_speech_endpoint or "").strip()
     if endpoint:
@@ -25,18 +58,24 @@ def _base_url() -> str:
     return f"https://{region}.api.cognitive.microsoft.com"
 
 
-def _headers() -> dict[str, str]:
+@cache
+def _auth_header_items() -> tuple[tuple[str, str], ...]:
     key = (settings.azure_speech_key or "").strip()
     if not key:
-        return {}
-    return {"Ocp-Apim-Subscription-Key": key}
+        return ()
+    return (("Ocp-Apim-Subscription-Key", key),)
+
+
+def _headers() -> dict[str, str]:
+    """New dict per call from the cached auth header (callers add Content-Type)."""
+    return dict(_auth_header_items())
 
 
 def is_available() -> bool:
     return bool(_base_url() and _headers())
 
 
-def create_profile() -> str | None:
+async def create_profile() -> str | None:
     """
     Create an empty speaker profile for identification. Returns profile_id (UUID string) or None.
     """
@@ -45,15 +84,14 @@ def create_profile() -> str | None:
     if not headers:
         return None
     try:
-        with httpx.Client() as client:
-            r = client.post(
-                url,
-                headers={**headers, "Content-Type": "application/json"},
-                json={"locale": "en-us"},
-                timeout=10.0,
-            )
+        r = await _ACLIENT.post(
+            url,
+            headers={**headers, "Content-Type": "application/json"},
+            content=_dumps({"locale": "en-us"}),
+            timeout=10.0,
+        )
         if r.status_code == 201:
-            data = r.json()
+            data = _loads(r.content)
             pid = data.get("profileId") or data.get("profile_id")
             if pid:
                 logger.info("speaker_recognition: created profile %s", pid)
@@ -65,7 +103,7 @@ def create_profile() -> str | None:
         return None
 
 
-def create_enrollment(profile_id: str, audio_bytes: bytes) -> dict[str, Any] | None:
+async def create_enrollment(profile_id: str, audio_bytes: bytes) -> dict[str, Any] | None:
     """
     Add enrollment audio to a profile. Audio must be WAV 16 kHz 16-bit mono.
     Returns enrollment info dict (enrollmentStatus, remainingEnrollmentsSpeechLengthInSec, etc.) or None.
@@ -76,10 +114,11 @@ def create_enrollment(profile_id: str, audio_bytes: bytes) -> dict[str, Any] | N
         return None
     headers["Content-Type"] = "audio/wav; codecs=audio/pcm"
     try:
-        with httpx.Client() as client:
-            r = client.post(url, headers=headers, content=audio_bytes, timeout=30.0)
+        r = await _ACLIENT.post(url, headers=headers, content=audio_bytes, timeout=30.0)
         if r.status_code == 201:
-            data = r.json()
+            # Profile changed: earlier identify answers may no longer hold
+            _identify_cache.clear()
+            data = _loads(r.content)
             logger.info(
                 "speaker_recognition: enrollment profile=%s status=%s remaining_sec=%s",
                 profile_id,
@@ -94,7 +133,7 @@ def create_enrollment(profile_id: str, audio_bytes: bytes) -> dict[str, Any] | N
         return None
 
 
-def identify_single_speaker(profile_ids: list[str], audio_bytes: bytes) -> str | None:
+async def identify_single_speaker(profile_ids: list[str], audio_bytes: bytes) -> str | None:
     """
     Identify which of the given profiles matches the speaker in the audio.
     Audio must be WAV 16 kHz 16-bit mono; at least ~4 s of speech recommended (or use ignoreMinLength).
@@ -107,14 +146,17 @@ def identify_single_speaker(profile_ids: list[str], audio_bytes: bytes) -> str |
     headers = _headers()
     if not headers:
         return None
+    cache_key = sha256(audio_bytes).hexdigest() + "|" + ",".join(sorted(profile_ids))
+    if cache_key in _identify_cache:
+        _identify_cache.move_to_end(cache_key)
+        return _identify_cache[cache_key]
     headers["Content-Type"] = "audio/wav; codecs=audio/pcm"
     try:
-        with httpx.Client() as client:
-            r = client.post(url, headers=headers, content=audio_bytes, timeout=15.0)
+        r = await _ACLIENT.post(url, headers=headers, content=audio_bytes, timeout=15.0)
         if r.status_code != 200:
             logger.warning("speaker_recognition: identify %s %s", r.status_code, r.text[:200])
             return None
-        data = r.json()
+        data = _loads(r.content)
         identified = data.get("identifiedProfile") or {}
         pid = identified.get("profileId")
         score = identified.get("score", 0)
@@ -123,9 +165,32 @@ def identify_single_speaker(profile_ids: list[str], audio_bytes: bytes) -> str |
             "speaker_recognition: identify response profile=%s score=%s (threshold 0.45)",
             pid, score_f,
         )
-        if pid and score_f >= 0.45:
-            return str(pid)
-        return None
+        matched = str(pid) if pid and score_f >= 0.45 else None
+        _identify_cache[cache_key] = matched
+        while len(_identify_cache) > IDENTIFY_CACHE_MAX:
+            _identify_cache.popitem(last=False)
+        return matched
     except Exception as e:
         logger.exception("speaker_recognition: identify error: %s", e)
         return None
+
+
+async def _gather_bounded(calls: list) -> list:
+    """Await coroutines concurrently (at most BATCH_CONCURRENCY in flight); results in input order."""
+    slots = asyncio.Semaphore(BATCH_CONCURRENCY)
+
+    async def run(call):
+        async with slots:
+            return await call
+
+    return list(await asyncio.gather(*(run(c) for c in calls)))
+
+
+async def identify_many(profile_ids: list[str], clips: list[bytes]) -> list[str | None]:
+    """identify_single_speaker for several clips against the same profiles, run concurrently."""
+    return await _gather_bounded([identify_single_speaker(profile_ids, clip) for clip in clips])
+
+
+async def enroll_many(enrollments: list[tuple[str, bytes]]) -> list[dict[str, Any] | None]:
+    """create_enrollment for several (profile_id, audio_bytes) pairs (e.g. onboarding), run concurrently."""
+    return await _gather_bounded([create_enrollment(pid, audio) for pid, audio in enrollments])
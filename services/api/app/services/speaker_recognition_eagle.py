@@ -4,6 +4,10 @@ Uses pveagle; audio must be 16 kHz 16-bit mono PCM (WAV body after 44-byte heade
 """
 import logging
 import struct
+import sys
+import threading
+from array import array
+from collections import OrderedDict
 from typing import Any
 
 from app.core.config import settings
@@ -12,34 +16,113 @@ logger = logging.getLogger(__name__)
 
 # Minimum WAV data length (after 44-byte header) to attempt parse
 WAV_HEADER_LEN = 44
+# RIFF chunk id, chunk size, WAVE format tag: validated with one unpack
+_WAV_HDR = struct.Struct("<4sI4s")
 IDENTIFY_SCORE_THRESHOLD = 0.5
+# Stop processing frames early once the leading profile's mean clears the threshold and leads
+# the runner-up by this margin (checked every IDENTIFY_EARLY_EXIT_EVERY frames)
+IDENTIFY_EARLY_EXIT_EVERY = 16
+IDENTIFY_EARLY_EXIT_MARGIN = 0.15
 
 
 def _access_key() -> str:
     return (settings.picovoice_access_key or "").strip()
 
 
+# pveagle handles load the model and allocate native buffers on creation, so they are kept across requests
+# and reset() between uses. They are not thread-safe: each cache's lock is held while a handle is in use.
+RECOGNIZER_CACHE_MAX = 4
+_profiler_lock = threading.Lock()
+_profilers: dict[str, Any] = {}
+_recognizer_lock = threading.Lock()
+# (access key, ((participant_id, hash(profile)), ...)) -> (recognizer, participant ids in recognizer order)
+_recognizers: OrderedDict[tuple, tuple[Any, list[str]]] = OrderedDict()
+
+
+def _delete_handle(handle: Any) -> None:
+    try:
+        handle.delete()
+    except Exception:
+        pass
+
+
+def _get_profiler(pveagle: Any, key: str) -> Any:
+    """Cached profiler for key, reset for a fresh enrollment. Caller holds _profiler_lock."""
+    profiler = _profilers.get(key)
+    if profiler is None:
+        profiler = _profilers[key] = pveagle.create_profiler(key)
+    else:
+        profiler.reset()
+    return profiler
+
+
+def _get_recognizer(
+    pveagle: Any, key: str, participants_with_profiles: list[tuple[str, bytes]]
+) -> tuple[tuple, Any, list[str]] | None:
+    """(cache key, recognizer, participant ids) for these profiles; None if no profile loads. Caller holds _recognizer_lock."""
+    cache_key = (key, tuple((pid, hash(blob)) for pid, blob in participants_with_profiles))
+    hit = _recognizers.get(cache_key)
+    if hit:
+        _recognizers.move_to_end(cache_key)
+        hit[0].reset()
+        return cache_key, hit[0], hit[1]
+    profiles, pids = [], []
+    for pid, blob in participants_with_profiles:
+        try:
+            profiles.append(pveagle.EagleProfile.from_bytes(blob))
+            pids.append(pid)
+        except Exception:
+            continue
+    if not profiles:
+        return None
+    recognizer = pveagle.create_recognizer(key, profiles)
+    _recognizers[cache_key] = (recognizer, pids)
+    while len(_recognizers) > RECOGNIZER_CACHE_MAX:
+        _, (old, _) = _recognizers.popitem(last=False)
+        _delete_handle(old)
+    return cache_key, recognizer, pids
+
+
 def is_available() -> bool:
     return bool(_access_key())
 
 
-def wav_to_pcm(wav_bytes: bytes) -> list[int] | None:
-    """
-    Extract 16-bit LE mono PCM from WAV bytes (44-byte header + data).
-    Returns list of int16 samples or None if invalid.
-    """
+def pcm_from_bytes(data: bytes | bytearray | memoryview) -> array:
+    """Decode 16-bit LE PCM bytes into an int16 array in one C-level copy (a trailing odd byte is dropped)."""
+    samples = array("h")
+    samples.frombytes(memoryview(data)[: len(data) - len(data) % 2])
+    if sys.byteorder != "little":
+        samples.byteswap()
+    return samples
+
+
+def _pcm_view(data: bytes | bytearray | memoryview) -> memoryview | array:
+    """int16 samples over 16-bit LE PCM bytes: a zero-copy memoryview cast on little-endian hosts, else a decoded array."""
+    if sys.byteorder != "little":
+        return pcm_from_bytes(data)
+    return memoryview(data)[: len(data) - len(data) % 2].cast("h")
+
+
+def _wav_data(wav_bytes: bytes) -> memoryview | None:
+    """Zero-copy view of the PCM data after the 44-byte WAV header, or None if not a usable WAV."""
     if len(wav_bytes) < WAV_HEADER_LEN + 2:
         return None
-    if wav_bytes[:4] != b"RIFF" or wav_bytes[8:12] != b"WAVE":
+    riff, _size, wave = _WAV_HDR.unpack_from(wav_bytes, 0)
+    if riff != b"RIFF" or wave != b"WAVE":
         return None
-    data = wav_bytes[WAV_HEADER_LEN:]
-    if len(data) % 2 != 0:
-        data = data[: len(data) - 1]
-    count = len(data) // 2
-    try:
-        return [struct.unpack_from("<h", data, i * 2)[0] for i in range(count)]
-    except struct.error:
+    data = memoryview(wav_bytes)[WAV_HEADER_LEN:]
+    return data[: len(data) - len(data) % 2]
+
+
+def wav_to_pcm(wav_bytes: bytes) -> array | None:
+    """
+    Extract 16-bit LE mono PCM from WAV bytes (44-byte header + data).
+    Returns an int16 array (a sequence of ints, as pveagle expects) or None if invalid.
+    """
+    data = _wav_data(wav_bytes)
+    if data is None:
         return None
+    return pcm_from_bytes(data)
 
 
 def enroll_participant(participant: Any, wav_bytes: bytes, db: Any) -> dict[str, Any]:
@@ -52,8 +135,8 @@ def enroll_participant(participant: Any, wav_bytes: bytes, db: Any) -> dict[str,
     key = _access_key()
     if not key:
         return {"ok": False, "message": "Voice ID not configured"}
-    pcm = wav_to_pcm(wav_bytes)
-    if not pcm:
+    data = _wav_data(wav_bytes)
+    if not data:
         return {"ok": False, "message": "Invalid or unsupported WAV"}
     try:
         import pveagle
@@ -61,53 +144,64 @@ def enroll_participant(participant: Any, wav_bytes: bytes, db: Any) -> dict[str,
         logger.warning("speaker_recognition_eagle: pveagle not installed")
         return {"ok": False, "message": "Speaker recognition not available"}
 
-    # Append to pending PCM
-    pending = getattr(participant, "eagle_pending_pcm", None) or b""
-    # Pending is stored as bytes: 16-bit LE per sample
-    pcm_bytes = struct.pack(f"<{len(pcm)}h", *pcm)
-    new_pending = pending + pcm_bytes
-    participant.eagle_pending_pcm = new_pending
+    # Append to pending PCM (stored as bytes: 16-bit LE per sample). The clip's raw bytes are appended
+    # in place; the only full copy is the bytes handed to the column, and the profiler reads the bytearray.
+    pending_ba = bytearray(getattr(participant, "eagle_pending_pcm", None) or b"")
+    del pending_ba[len(pending_ba) - len(pending_ba) % 2 :]  # keep sample alignment
+    pending_ba.extend(data)
+    participant.eagle_pending_pcm = bytes(pending_ba)
     db.flush()
+    pcm_from_pending = _pcm_view(pending_ba)
 
     # Run profiler on full pending
-    pcm_from_pending: list[int] = []
-    for i in range(0, len(new_pending), 2):
-        if i + 2 <= len(new_pending):
-            pcm_from_pending.append(struct.unpack_from("<h", new_pending, i)[0])
     if not pcm_from_pending:
         return {"ok": True, "message": "Enrolling (add more speech)", "remaining_speech_sec": 10.0}
 
     try:
-        profiler = pveagle.create_profiler(key)
-        try:
-            min_samples = profiler.min_enroll_samples
-            percentage = 0.0
-            idx = 0
-            while idx < len(pcm_from_pending) and percentage < 100.0:
-                chunk = pcm_from_pending[idx : idx + min_samples]
-                if len(chunk) < min_samples:
-                    break
-                percentage, feedback = profiler.enroll(chunk)
-                idx += min_samples
-            if percentage >= 100.0:
-                profile = profiler.export()
-                participant.eagle_profile_data = profile.to_bytes()
-                participant.eagle_pending_pcm = None
-                participant.enrollment_status = "Enrolled"
-                db.flush()
-                return {"ok": True, "message": "Enrolled", "remaining_speech_sec": None}
-            # Not enough yet
-            participant.enrollment_status = "Enrolling"
+        profile_bytes = None
+        with _profiler_lock:
+            try:
+                profiler = _get_profiler(pveagle, key)
+                min_samples = profiler.min_enroll_samples
+                percentage = 0.0
+                # memoryview slices are zero-copy int sequences over the int16 buffer
+                samples = memoryview(pcm_from_pending)
+                for idx in range(0, len(samples) - min_samples + 1, min_samples):
+                    percentage, feedback = profiler.enroll(samples[idx : idx + min_samples])
+                    if percentage >= 100.0:
+                        break
+                if percentage >= 100.0:
+                    profile_bytes = profiler.export().to_bytes()
+            except Exception:
+                # Don't reuse a handle left in an unknown state
+                stale = _profilers.pop(key, None)
+                if stale is not None:
+                    _delete_handle(stale)
+                raise
+        if profile_bytes is not None:
+            participant.eagle_profile_data = profile_bytes
+            participant.eagle_pending_pcm = None
+            participant.enrollment_status = "Enrolled"
             db.flush()
-            remaining = max(0, 15 - (len(pcm_from_pending) / 16000))  # rough sec remaining at 16 kHz
-            return {"ok": True, "message": "Enrolling (add more speech for best recognition)", "remaining_speech_sec": remaining}
-        finally:
-            profiler.delete()
+            return {"ok": True, "message": "Enrolled", "remaining_speech_sec": None}
+        # Not enough yet
+        participant.enrollment_status = "Enrolling"
+        db.flush()
+        remaining = max(0, 15 - (len(pcm_from_pending) / 16000))  # rough sec remaining at 16 kHz
+        return {"ok": True, "message": "Enrolling (add more speech for best recognition)", "remaining_speech_sec": remaining}
     except Exception as e:
         logger.exception("speaker_recognition_eagle: enroll error %s", e)
         return {"ok": False, "message": "Enrollment failed"}
 
 
+def _clear_leader(score_sums: list[float], n_frames: int) -> bool:
+    """True if the best mean score is above threshold and ahead of the runner-up by the early-exit margin."""
+    top = sorted(score_sums, reverse=True)[:2]
+    leader = top[0] / n_frames
+    runner_up = top[1] / n_frames if len(top) > 1 else 0.0
+    return leader >= IDENTIFY_SCORE_THRESHOLD and leader - runner_up > IDENTIFY_EARLY_EXIT_MARGIN
+
+
 def identify_single_speaker(
     participants_with_profiles: list[tuple[str, bytes]],
     wav_bytes: bytes,
@@ -121,53 +215,52 @@ def identify_single_speaker(
     key = _access_key()
     if not key:
         return None
-    pcm = wav_to_pcm(wav_bytes)
-    if not pcm or len(pcm) < 1000:
+    data = _wav_data(wav_bytes)
+    if data is None:
+        return None
+    pcm = _pcm_view(data)  # int16 view straight over the request body, no decoded copy
+    if len(pcm) < 1000:
         return None
     try:
         import pveagle
     except ImportError:
         return None
     try:
-        profiles = []
-        for _pid, blob in participants_with_profiles:
-            try:
-                profiles.append(pveagle.EagleProfile.from_bytes(blob))
-            except Exception:
-                continue
-        if not profiles:
-            return None
-        recognizer = pveagle.create_recognizer(key, profiles)
-        try:
-            frame_len = recognizer.frame_length
-            scores_per_speaker: list[list[float]] = [[] for _ in profiles]
-            for i in range(0, len(pcm) - frame_len, frame_len):
-                frame = pcm[i : i + frame_len]
-                if len(frame) != frame_len:
-                    break
-                frame_scores = recognizer.process(frame)
-                for j, s in enumerate(frame_scores):
-                    if j < len(scores_per_speaker):
-                        scores_per_speaker[j].append(s)
-            recognizer.delete()
-        except Exception:
+        with _recognizer_lock:
+            entry = _get_recognizer(pveagle, key, participants_with_profiles)
+            if entry is None:
+                return None
+            cache_key, recognizer, pids = entry
             try:
-                recognizer.delete()
+                frame_len = recognizer.frame_length
+                # Running per-speaker score sums (mean = sum / frames); no per-frame score lists kept
+                score_sums = [0.0] * len(pids)
+                n_frames = 0
+                samples = memoryview(pcm)  # zero-copy frames (pcm may be a decoded array on big-endian hosts)
+                for i in range(0, len(samples) - frame_len, frame_len):
+                    frame_scores = recognizer.process(samples[i : i + frame_len])
+                    for j, s in zip(range(len(score_sums)), frame_scores):
+                        score_sums[j] += s
+                    n_frames += 1
+                    if n_frames % IDENTIFY_EARLY_EXIT_EVERY == 0 and _clear_leader(score_sums, n_frames):
+                        break
             except Exception:
-                pass
+                # Don't reuse a handle left in an unknown state
+                _recognizers.pop(cache_key, None)
+                _delete_handle(recognizer)
+                return None
+        if not n_frames:
             return None
-        # Mean score per speaker
-        mean_scores = []
-        for lst in scores_per_speaker:
-            mean_scores.append(sum(lst) / len(lst) if lst else 0.0)
-        best_idx = max(range(len(mean_scores)), key=lambda i: mean_scores[i])
-        if mean_scores[best_idx] >= IDENTIFY_SCORE_THRESHOLD:
+        best_idx = max(range(len(score_sums)), key=score_sums.__getitem__)
+        best_score = score_sums[best_idx] / n_frames
+        if best_score >= IDENTIFY_SCORE_THRESHOLD:
             logger.info(
                 "speaker_recognition_eagle: identify best participant_idx=%s score=%.3f",
                 best_idx,
-                mean_scores[best_idx],
+                best_score,
             )
-            return participants_with_profiles[best_idx][0]
+            # Index into the loaded profiles' ids: profiles that failed to load are not in the recognizer
+            return pids[best_idx]
         return None
     except Exception as e:
         logger.exception("speaker_recognition_eagle: identify error %s", e)
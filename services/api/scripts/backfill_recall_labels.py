@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Backfill AI recall labels (summary + topic tags) for voice session moments that have none yet,
+e.g. sessions saved before OPENAI_API_KEY was configured. Labels are generated in batches
+(many sessions per OpenAI request) from the participant's own words in session_turns_json.
+
+Run from services/api:
+  DATABASE_URL='postgresql://...' OPENAI_API_KEY=... uv run python scripts/backfill_recall_labels.py --dry-run
+  DATABASE_URL='postgresql://...' OPENAI_API_KEY=... uv run python scripts/backfill_recall_labels.py --confirm
+"""
+import argparse
+import sys
+
+from sqlalchemy import func, or_
+
+from app.core.config import DEFAULT_FAMILY_ID, settings
+from app.db.session import SessionLocal
+from app.db import models
+from app.services.ai_recall import generate_recall_labels_batch
+
+
+def _participant_text(turns) -> str:
+    """Participant-only words from session turns (same rule as POST /sessions/complete)."""
+    if not isinstance(turns, list):
+        return ""
+    return " ".join(
+        (t.get("content") or "").strip()
+        for t in turns
+        if isinstance(t, dict)
+        and (t.get("role") or "").strip().lower() in ("user", "human")
+        and (t.get("content") or "").strip()
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Backfill AI recall labels for unlabelled voice sessions.")
+    parser.add_argument("--limit", type=int, default=500, help="Max sessions to label in this run (default 500)")
+    parser.add_argument("--dry-run", action="store_true", help="Generate and print labels without saving")
+    parser.add_argument("--confirm", action="store_true", help="Required to save labels (safety check)")
+    args = parser.parse_args()
+
+    if not args.dry_run and not args.confirm:
+        print("Add --confirm to save labels, or --dry-run to preview them.", file=sys.stderr)
+        sys.exit(1)
+    api_key = (settings.openai_api_key or "").strip()
+    if not api_key:
+        print("OPENAI_API_KEY is not set.", file=sys.stderr)
+        sys.exit(1)
+    model = (settings.openai_text_model or "").strip() or "gpt-4o-mini"
+
+    db = SessionLocal()
+    try:
+        moments = (
+            db.query(models.Moment)
+            .filter(
+                models.Moment.family_id == DEFAULT_FAMILY_ID,
+                models.Moment.source == "older_session",
+                models.Moment.deleted_at.is_(None),
+                models.Moment.session_turns_json.isnot(None),
+                # SQL NULL, or the JSON null that an explicit tags_json=None is stored as (JSONB type)
+                or_(models.Moment.tags_json.is_(None), func.jsonb_typeof(models.Moment.tags_json) == "null"),
+            )
+            .order_by(models.Moment.created_at.desc())
+            .limit(args.limit)
+            .all()
+        )
+        todo = [(m, _participant_text(m.session_turns_json)) for m in moments]
+        todo = [(m, text) for m, text in todo if text]
+        if not todo:
+            print("No unlabelled voice sessions found.")
+            return
+        print(f"Labelling {len(todo)} session(s)...")
+        labels = generate_recall_labels_batch([text for _, text in todo], api_key, model)
+        updated = 0
+        for (moment, _), (summary, tags) in zip(todo, labels):
+            if not summary and not tags:
+                continue
+            print(f"  {moment.id}: {summary!r} {tags}")
+            if not args.dry_run:
+                moment.summary = summary or moment.summary
+                moment.tags_json = tags or moment.tags_json
+                updated += 1
+        if args.dry_run:
+            print("Dry run: nothing saved.")
+        else:
+            db.commit()
+            print(f"Saved labels for {updated} session(s).")
+    except Exception as e:
+        db.rollback()
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
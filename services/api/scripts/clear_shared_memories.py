@@ -1,8 +1,8 @@
 #!/usr/bin/env python3
 """
 Hard-delete all shared voice story moments (Shared Memories) for the default family.
-Removes rows in FK-safe order: SharedStoryListen, Transcript, MomentAsset, MomentPerson,
-unlinks VoiceStory (shared_moment_id=null, status=final), then deletes Moment rows.
+Removes SharedStoryListen, Transcript, MomentAsset, MomentPerson and NarrateBgmCache rows,
+unlinks VoiceStory (shared_moment_id=null, status=final), then deletes Moment rows, all in one statement.
 Participants and other data are unchanged.
 
 Use when: starting with a clean Shared Memories list in production. Back up the DB first.
@@ -24,74 +24,68 @@ def _is_production_database_url(url: str) -> bool:
     return "database.azure.com" in url or ".postgres.database.azure.com" in url
 
 
+from sqlalchemy import text
+
 from app.db.session import SessionLocal
-from app.db import models
+
+
+# One statement, one round trip: every dependent delete/unlink runs as a data-modifying CTE over the same
+# target set. FK checks (NO ACTION) run at end of statement, so deleting moments alongside their children is safe.
+_CLEAR_SHARED_MEMORIES_SQL = text(
+    """
+    WITH targets AS (
+        SELECT id FROM moments
+        WHERE family_id = :family_id AND source = 'voice_story' AND shared_at IS NOT NULL
+    ),
+    listens AS (
+        DELETE FROM shared_story_listens WHERE moment_id IN (SELECT id FROM targets) RETURNING 1
+    ),
+    transcripts_deleted AS (
+        DELETE FROM transcripts WHERE moment_id IN (SELECT id FROM targets) RETURNING 1
+    ),
+    assets_unlinked AS (
+        DELETE FROM moment_assets WHERE moment_id IN (SELECT id FROM targets) RETURNING 1
+    ),
+    people_unlinked AS (
+        DELETE FROM moment_people WHERE moment_id IN (SELECT id FROM targets) RETURNING 1
+    ),
+    bgm_cache AS (
+        DELETE FROM narrate_bgm_cache WHERE moment_id IN (SELECT id FROM targets) RETURNING 1
+    ),
+    stories AS (
+        UPDATE voice_stories SET shared_moment_id = NULL, status = 'final'
+        WHERE family_id = :family_id AND shared_moment_id IN (SELECT id FROM targets)
+        RETURNING 1
+    ),
+    moments_deleted AS (
+        DELETE FROM moments WHERE id IN (SELECT id FROM targets) RETURNING 1
+    )
+    SELECT
+        (SELECT count(*) FROM listens) AS shared_story_listens,
+        (SELECT count(*) FROM transcripts_deleted) AS transcripts,
+        (SELECT count(*) FROM assets_unlinked) AS moment_assets,
+        (SELECT count(*) FROM people_unlinked) AS moment_people,
+        (SELECT count(*) FROM bgm_cache) AS narrate_bgm_cache,
+        (SELECT count(*) FROM stories) AS voice_stories_unlinked,
+        (SELECT count(*) FROM moments_deleted) AS moments_deleted
+    """
+)
 
 
 def _clear_shared_memories_impl(db):
     """Hard-delete all shared voice story moments (default family) and dependent rows."""
-    moment_ids = [
-        r[0]
-        for r in db.query(models.Moment.id).filter(
-            models.Moment.family_id == DEFAULT_FAMILY_ID,
-            models.Moment.source == "voice_story",
-            models.Moment.shared_at.isnot(None),
-        ).all()
-    ]
-    if not moment_ids:
+    counts = db.execute(_CLEAR_SHARED_MEMORIES_SQL, {"family_id": DEFAULT_FAMILY_ID}).mappings().one()
+    n = counts["moments_deleted"]
+    if not n:
         print("  No shared voice story moments found.")
         return 0
-
-    total = 0
-
-    # 1. shared_story_listens (references moments)
-    n = db.query(models.SharedStoryListen).filter(
-        models.SharedStoryListen.moment_id.in_(moment_ids)
-    ).delete(synchronize_session=False)
-    print(f"  shared_story_listens: {n}")
-    total += n
-
-    # 2. transcripts (references moments)
-    n = db.query(models.Transcript).filter(
-        models.Transcript.moment_id.in_(moment_ids)
-    ).delete(synchronize_session=False)
-    print(f"  transcripts: {n}")
-    total += n
-
-    # 3. moment_assets
-    n = db.query(models.MomentAsset).filter(
-        models.MomentAsset.moment_id.in_(moment_ids)
-    ).delete(synchronize_session=False)
-    print(f"  moment_assets: {n}")
-    total += n
-
-    # 4. moment_people
-    n = db.query(models.MomentPerson).filter(
-        models.MomentPerson.moment_id.in_(moment_ids)
-    ).delete(synchronize_session=False)
-    print(f"  moment_people: {n}")
-    total += n
-
-    # 5. Unlink voice_stories (set shared_moment_id=null, status=final so story stays in Recall)
-    stories = db.query(models.VoiceStory).filter(
-        models.VoiceStory.shared_moment_id.in_(moment_ids),
-        models.VoiceStory.family_id == DEFAULT_FAMILY_ID,
-    ).all()
-    for s in stories:
-        s.shared_moment_id = None
-        s.status = "final"
-        db.add(s)
-    print(f"  voice_stories unlinked: {len(stories)}")
-    total += len(stories)
-    db.flush()  # ensure UPDATE is applied before we delete moments (avoids FK violation)
-
-    # 6. Delete the moments
-    n = db.query(models.Moment).filter(
-        models.Moment.id.in_(moment_ids)
-    ).delete(synchronize_session=False)
+    print(f"  shared_story_listens: {counts['shared_story_listens']}")
+    print(f"  transcripts: {counts['transcripts']}")
+    print(f"  moment_assets: {counts['moment_assets']}")
+    print(f"  moment_people: {counts['moment_people']}")
+    print(f"  narrate_bgm_cache: {counts['narrate_bgm_cache']}")
+    print(f"  voice_stories unlinked: {counts['voice_stories_unlinked']}")
     print(f"  moments (hard-deleted): {n}")
-    total += n
-
     return n
 
 
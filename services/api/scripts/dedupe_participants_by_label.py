@@ -16,10 +16,64 @@ import argparse
 import sys
 from collections import defaultdict
 
+from sqlalchemy import bindparam, text
+
 from app.core.config import DEFAULT_FAMILY_ID
 from app.db.session import SessionLocal
 from app.db import models
 
+# Transaction-scoped lock so two dedupe runs never merge at the same time; released on commit/rollback
+_DEDUPE_LOCK = text("SELECT pg_advisory_xact_lock(hashtext('dedupe_participants_by_label'))")
+
+# Labels with more than one participant, ids oldest first. The family's participant rows are locked
+# (FOR UPDATE in the CTE; it isn't allowed next to GROUP BY) so concurrent dedupe runs serialize.
+_DUPLICATE_LABELS = text(
+    """
+    WITH locked AS (
+        SELECT id, label, created_at FROM voice_participants WHERE family_id = :family_id FOR UPDATE
+    )
+    SELECT label, array_agg(id ORDER BY created_at, id) AS ids
+    FROM locked
+    GROUP BY label
+    HAVING count(*) > 1
+    ORDER BY label
+    """
+)
+
+_REASSIGN_MOMENTS = text(
+    """
+    UPDATE moments m SET participant_id = v.kept
+    FROM unnest(CAST(:dups AS text[]), CAST(:kepts AS text[])) AS v(dup, kept)
+    WHERE m.participant_id = v.dup
+    """
+)
+
+_REASSIGN_STORIES = text(
+    """
+    UPDATE voice_stories s SET participant_id = v.kept
+    FROM unnest(CAST(:dups AS text[]), CAST(:kepts AS text[])) AS v(dup, kept)
+    WHERE s.participant_id = v.dup
+    """
+)
+
+# Move a dup's listen to the kept participant unless the kept participant (or an earlier dup, which
+# moves instead) already has that moment; whatever stays on the dups afterwards is a conflict to drop.
+_REASSIGN_LISTENS = text(
+    """
+    UPDATE shared_story_listens s SET participant_id = :kept_id
+    WHERE s.participant_id IN :dup_ids
+      AND NOT EXISTS (
+        SELECT 1 FROM shared_story_listens o
+        WHERE o.moment_id = s.moment_id
+          AND (o.participant_id = :kept_id OR (o.participant_id IN :dup_ids AND o.participant_id < s.participant_id))
+      )
+    """
+).bindparams(bindparam("dup_ids", expanding=True))
+
+_DELETE_LEFTOVER_LISTENS = text(
+    "DELETE FROM shared_story_listens WHERE participant_id IN :dup_ids"
+).bindparams(bindparam("dup_ids", expanding=True))
+
 
 def list_duplicates(db):
     """Show participants grouped by label; highlight labels that have duplicates."""
@@ -44,66 +98,40 @@ def list_duplicates(db):
 
 def dedupe(db):
     """For each label with multiple participants, keep oldest and reassign FKs then delete duplicates."""
-    rows = (
-        db.query(models.VoiceParticipant)
-        .filter(models.VoiceParticipant.family_id == DEFAULT_FAMILY_ID)
-        .order_by(models.VoiceParticipant.label, models.VoiceParticipant.created_at)
-        .all()
-    )
-    by_label = defaultdict(list)
-    for p in rows:
-        by_label[p.label].append(p)
+    db.execute(_DEDUPE_LOCK)
+    # Keep first (oldest by created_at) per label, merge the rest into it
+    merges = []  # (label, kept_id, dup_ids)
+    for label, ids in db.execute(_DUPLICATE_LABELS, {"family_id": DEFAULT_FAMILY_ID}):
+        kept_id = ids[0]
+        dup_ids = ids[1:]
+        print(f"Merging {len(dup_ids)} duplicate(s) for label {label!r} into id={kept_id}")
+        merges.append((label, kept_id, dup_ids))
+    if not merges:
+        return 0
+
+    # 1-2. Moments and VoiceStory: point every duplicate to its kept participant, all labels in one
+    #      statement per table (dup -> kept pairs joined from two parallel arrays)
+    pairs = {
+        "dups": [dup_id for _, _, dup_ids in merges for dup_id in dup_ids],
+        "kepts": [kept_id for _, kept_id, dup_ids in merges for _ in dup_ids],
+    }
+    n_moments = db.execute(_REASSIGN_MOMENTS, pairs).rowcount
+    if n_moments:
+        print(f"  moments: reassigned {n_moments}")
+    n_stories = db.execute(_REASSIGN_STORIES, pairs).rowcount
+    if n_stories:
+        print(f"  voice_stories: reassigned {n_stories}")
 
     total_deleted = 0
-    for label, participants in by_label.items():
-        if len(participants) <= 1:
-            continue
-        # Keep first (oldest by created_at), merge the rest into it
-        keep = participants[0]
-        dups = participants[1:]
-        kept_id = keep.id
-        dup_ids = [p.id for p in dups]
-        print(f"Merging {len(dups)} duplicate(s) for label {label!r} into id={kept_id}")
-
-        # 1. Moments: point to kept participant
-        n_moments = (
-            db.query(models.Moment)
-            .filter(models.Moment.participant_id.in_(dup_ids))
-            .update({models.Moment.participant_id: kept_id}, synchronize_session=False)
-        )
-        if n_moments:
-            print(f"  moments: reassigned {n_moments} to {kept_id}")
-
-        # 2. VoiceStory: point to kept participant
-        n_stories = (
-            db.query(models.VoiceStory)
-            .filter(models.VoiceStory.participant_id.in_(dup_ids))
-            .update({models.VoiceStory.participant_id: kept_id}, synchronize_session=False)
-        )
-        if n_stories:
-            print(f"  voice_stories: reassigned {n_stories} to {kept_id}")
-
-        # 3. SharedStoryListen: (participant_id, moment_id) is PK. Reassign where possible;
-        #    if (kept_id, moment_id) already exists, delete the dup row.
-        for dup_id in dup_ids:
-            listens = (
-                db.query(models.SharedStoryListen)
-                .filter(models.SharedStoryListen.participant_id == dup_id)
-                .all()
-            )
-            for listen in listens:
-                existing = (
-                    db.query(models.SharedStoryListen).filter(
-                        models.SharedStoryListen.participant_id == kept_id,
-                        models.SharedStoryListen.moment_id == listen.moment_id,
-                    ).first()
-                )
-                if existing:
-                    db.delete(listen)
-                else:
-                    listen.participant_id = kept_id
-                    db.add(listen)
-        db.flush()
+    for label, kept_id, dup_ids in merges:
+        # 3. SharedStoryListen: (participant_id, moment_id) is PK. Reassign dup rows that don't conflict,
+        #    then delete the conflicting leftovers: two statements per label.
+        print(f"Label {label!r} (kept id={kept_id}):")
+        params = {"kept_id": kept_id, "dup_ids": dup_ids}
+        n_listens = db.execute(_REASSIGN_LISTENS, params).rowcount
+        n_dropped = db.execute(_DELETE_LEFTOVER_LISTENS, params).rowcount
+        if n_dropped or n_listens:
+            print(f"  shared_story_listens: reassigned {n_listens}, dropped {n_dropped} already-listened")
 
         # 4. Delete duplicate participants
         n_del = (
@@ -150,6 +178,10 @@ def main():
             sys.exit(0 if dup_count == 0 else 1)
 
         deleted = dedupe(db)
+        if not deleted:
+            # Nothing merged: no commit needed (closing the session ends the read-only transaction)
+            print("Done. No duplicate participants found.")
+            return
         db.commit()
         print(f"Done. Deleted {deleted} duplicate participant(s).")
     except Exception as e:
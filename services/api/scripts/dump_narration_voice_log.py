@@ -31,14 +31,16 @@ from app.db import models
 
 def dump_log(db, participant_name: str) -> None:
     """Dump narration-voice diagnostic log for participant (e.g. Harry)."""
-    name_lower = participant_name.strip().lower()
-    participants = [
-        p
-        for p in db.query(models.VoiceParticipant)
-        .filter(models.VoiceParticipant.family_id == DEFAULT_FAMILY_ID)
+    # Case-insensitive "contains" match done in SQL; escape LIKE wildcards in the name
+    pattern = participant_name.strip().replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    participants = (
+        db.query(models.VoiceParticipant)
+        .filter(
+            models.VoiceParticipant.family_id == DEFAULT_FAMILY_ID,
+            models.VoiceParticipant.label.ilike(f"%{pattern}%", escape="\\"),
+        )
         .all()
-        if name_lower in (p.label or "").lower()
-    ]
+    )
 
     # Environment (no secrets)
     elevenlabs_configured = bool((getattr(settings, "elevenlabs_api_key", None) or "").strip())
@@ -56,9 +58,10 @@ def dump_log(db, participant_name: str) -> None:
         print(f"No participants found matching {participant_name!r}.")
         return
 
-    # All shared story moments (voice_story, shared_at not null)
+    # All shared story moments (voice_story, shared_at not null). Only the columns the report uses,
+    # not full Moment rows (session turns etc.)
     shared_moments = (
-        db.query(models.Moment)
+        db.query(models.Moment.id, models.Moment.participant_id, models.Moment.title)
         .filter(
             models.Moment.family_id == DEFAULT_FAMILY_ID,
             models.Moment.source == "voice_story",
@@ -67,19 +70,32 @@ def dump_log(db, participant_name: str) -> None:
         )
         .all()
     )
+    # VoiceStory owner per shared moment, loaded once (not one query per moment per participant)
+    story_pid_by_moment = {}
+    if shared_moments:
+        for shared_moment_id, story_pid in (
+            db.query(models.VoiceStory.shared_moment_id, models.VoiceStory.participant_id)
+            .filter(
+                models.VoiceStory.family_id == DEFAULT_FAMILY_ID,
+                models.VoiceStory.shared_moment_id.in_([m.id for m in shared_moments]),
+            )
+            .all()
+        ):
+            story_pid_by_moment.setdefault(str(shared_moment_id), story_pid)
 
     for p in participants:
         pid = str(p.id)
         label = (p.label or "").strip() or "(no label)"
         elevenlabs_id = (getattr(p, "elevenlabs_voice_id", None) or "").strip() or None
         consent_at = getattr(p, "elevenlabs_voice_consent_at", None)
+        can_clone = bool(elevenlabs_id and elevenlabs_configured)
 
         print("-" * 70)
         print(f"PARTICIPANT: {label}")
         print(f"  id: {pid}")
         print(f"  elevenlabs_voice_id: {elevenlabs_id or '(none)'}")
         print(f"  elevenlabs_voice_consent_at: {consent_at}")
-        if elevenlabs_id and elevenlabs_configured:
+        if can_clone:
             print("  → Clone voice WOULD be used for narration (if participant_id is sent to /narrate)")
         elif elevenlabs_id and not elevenlabs_configured:
             print("  → Clone voice NOT used: ELEVENLABS_API_KEY not set in this environment")
@@ -95,15 +111,8 @@ def dump_log(db, participant_name: str) -> None:
             if m_pid == pid:
                 stories_for_participant.append((m, m_pid, "moment.participant_id"))
                 continue
-            story = (
-                db.query(models.VoiceStory)
-                .filter(
-                    models.VoiceStory.shared_moment_id == m.id,
-                    models.VoiceStory.family_id == DEFAULT_FAMILY_ID,
-                )
-                .first()
-            )
-            if story and str(story.participant_id) == pid:
+            story_pid = story_pid_by_moment.get(mid)
+            if story_pid and str(story_pid) == pid:
                 stories_for_participant.append(
                     (m, m_pid or "(null)", "voice_story.participant_id" + (" (moment.participant_id missing)" if not m_pid else ""))
                 )
@@ -115,22 +124,11 @@ def dump_log(db, participant_name: str) -> None:
             # When playback/narrate runs, participant_id sent to /narrate comes from moment.participant_id (or backfill from VoiceStory)
             effective_pid = str(m.participant_id) if m.participant_id else None
             if not effective_pid:
-                story_for_pid = (
-                    db.query(models.VoiceStory)
-                    .filter(
-                        models.VoiceStory.shared_moment_id == m.id,
-                        models.VoiceStory.family_id == DEFAULT_FAMILY_ID,
-                    )
-                    .first()
-                )
-                if story_for_pid and story_for_pid.participant_id:
-                    effective_pid = str(story_for_pid.participant_id)
+                story_pid = story_pid_by_moment.get(mid)
+                if story_pid:
+                    effective_pid = str(story_pid)
 
-            clone_used = (
-                elevenlabs_configured
-                and elevenlabs_id
-                and effective_pid == pid
-            )
+            clone_used = can_clone and effective_pid == pid
             print(f"  moment_id: {mid}")
             print(f"  title: {title!r}")
             print(f"  moment.participant_id: {m_pid}")
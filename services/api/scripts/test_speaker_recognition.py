@@ -10,7 +10,9 @@ Exits 0 if the configured backend is working; non-zero otherwise.
 """
 from __future__ import annotations
 
+import asyncio
 import os
+import struct
 import sys
 
 # Load .env from repo root only (single source of truth)
@@ -35,28 +37,18 @@ def get_config() -> tuple[str, str, str | None]:
     return key, region, endpoint
 
 
+# 44-byte PCM WAV header; everything but the two length fields is fixed (16 kHz, 16-bit mono)
+_WAV_HEADER = struct.Struct("<4sI4s4sIHHIIHH4sI")
+
+
 def make_minimal_wav_seconds(seconds: float) -> bytes:
     """Build a minimal valid WAV (16 kHz, 16-bit mono) of silence."""
     num_samples = int(16000 * seconds)
     data_len = num_samples * 2
-    header = bytearray(44)
-    # RIFF
-    header[0:4] = b"RIFF"
-    header[4:8] = (36 + data_len).to_bytes(4, "little")
-    header[8:12] = b"WAVE"
-    # fmt
-    header[12:16] = b"fmt "
-    header[16:20] = (16).to_bytes(4, "little")
-    header[20:22] = (1).to_bytes(2, "little")  # PCM
-    header[22:24] = (1).to_bytes(2, "little")  # mono
-    header[24:28] = (16000).to_bytes(4, "little")
-    header[28:32] = (32000).to_bytes(4, "little")
-    header[32:34] = (2).to_bytes(2, "little")
-    header[34:36] = (16).to_bytes(2, "little")
-    # data
-    header[36:40] = b"data"
-    header[40:44] = data_len.to_bytes(4, "little")
-    return bytes(header) + (b"\x00\x00" * num_samples)
+    header = _WAV_HEADER.pack(
+        b"RIFF", 36 + data_len, b"WAVE", b"fmt ", 16, 1, 1, 16000, 32000, 2, 16, b"data", data_len
+    )
+    return header + bytes(data_len)
 
 
 def _base_url(region: str, endpoint: str | None) -> str:
@@ -67,19 +59,21 @@ def _base_url(region: str, endpoint: str | None) -> str:
     return ""
 
 
-def test_create_profile(key: str, region: str, endpoint: str | None) -> tuple[bool, str, int, str | None]:
+def _client(key: str, base: str) -> httpx.AsyncClient:
+    """One pooled client for all calls (single TLS handshake); retries failed connects."""
+    return httpx.AsyncClient(
+        base_url=base,
+        headers={"Ocp-Apim-Subscription-Key": key},
+        timeout=30.0,
+        transport=httpx.AsyncHTTPTransport(retries=2),
+    )
+
+
+async def test_create_profile(client: httpx.AsyncClient) -> tuple[bool, str, int, str | None]:
     """Try to create a speaker profile. Returns (ok, message, status_code, profile_id)."""
-    base = _base_url(region, endpoint)
-    if not base:
-        return False, "No AZURE_SPEECH_ENDPOINT or AZURE_SPEECH_REGION", -1, None
-    url = f"{base}/{BASE_PATH}/profiles?api-version={API_VERSION}"
-    headers = {
-        "Ocp-Apim-Subscription-Key": key,
-        "Content-Type": "application/json",
-    }
+    url = f"/{BASE_PATH}/profiles?api-version={API_VERSION}"
     try:
-        with httpx.Client() as client:
-            r = client.post(url, headers=headers, json={"locale": "en-us"}, timeout=15.0)
+        r = await client.post(url, json={"locale": "en-us"}, timeout=15.0)
     except Exception as e:
         return False, f"Request failed: {e}", -1, None
     if r.status_code == 201:
@@ -89,21 +83,13 @@ def test_create_profile(key: str, region: str, endpoint: str | None) -> tuple[bo
     return False, f"{r.status_code} {r.text[:500]}", r.status_code, None
 
 
-def test_enrollment(key: str, region: str, endpoint: str | None, profile_id: str) -> tuple[bool, str, int]:
+async def test_enrollment(client: httpx.AsyncClient, profile_id: str) -> tuple[bool, str, int]:
     """Try to add enrollment audio (minimal WAV). Returns (ok, message, status_code)."""
-    base = _base_url(region, endpoint)
-    if not base:
-        return False, "No AZURE_SPEECH_ENDPOINT or AZURE_SPEECH_REGION", -1
-    url = f"{base}/{BASE_PATH}/profiles/{profile_id}/enrollments?api-version={API_VERSION}"
-    headers = {
-        "Ocp-Apim-Subscription-Key": key,
-        "Content-Type": "audio/wav; codecs=audio/pcm",
-    }
+    url = f"/{BASE_PATH}/profiles/{profile_id}/enrollments?api-version={API_VERSION}"
     # At least a few seconds of audio for enrollment (silence is valid)
     wav = make_minimal_wav_seconds(5.0)
     try:
-        with httpx.Client() as client:
-            r = client.post(url, headers=headers, content=wav, timeout=30.0)
+        r = await client.post(url, headers={"Content-Type": "audio/wav; codecs=audio/pcm"}, content=wav)
     except Exception as e:
         return False, f"Request failed: {e}", -1
     if r.status_code == 201:
@@ -113,6 +99,38 @@ def test_enrollment(key: str, region: str, endpoint: str | None, profile_id: str
     return False, f"{r.status_code} {r.text[:500]}", r.status_code
 
 
+async def _test_azure(key: str, base: str) -> int:
+    """Create a profile, then enroll audio into it, over one async client."""
+    async with _client(key, base) as client:
+        ok, msg, status, profile_id = await test_create_profile(client)
+        if not ok:
+            print("Create profile: FAILED")
+            print(f"  {msg}")
+            if status == 401:
+                print()
+                print("  401 usually means Speaker Recognition is not enabled for this subscription.")
+                print("  See: https://aka.ms/azure-speaker-recognition")
+            return 1
+        print("Create profile: OK")
+        print(f"  {msg}")
+        print()
+
+        if profile_id:
+            ok2, msg2, status2 = await test_enrollment(client, profile_id)
+            if not ok2:
+                print("Enrollment: FAILED")
+                print(f"  {msg2}")
+                return 1
+            print("Enrollment: OK")
+            print(f"  {msg2}")
+        else:
+            print("Enrollment: skipped (no profile id)")
+
+    print()
+    print("Speaker Recognition is working.")
+    return 0
+
+
 def main() -> int:
     backend = (os.getenv("VOICE_ID_BACKEND") or "eagle").strip().lower()
     picovoice_key = (os.getenv("PICOVOICE_ACCESS_KEY") or "").strip()
@@ -146,33 +164,7 @@ def main() -> int:
         print(f"  Endpoint: {endpoint}")
     print()
 
-    ok, msg, status, profile_id = test_create_profile(key, region, endpoint)
-    if not ok:
-        print("Create profile: FAILED")
-        print(f"  {msg}")
-        if status == 401:
-            print()
-            print("  401 usually means Speaker Recognition is not enabled for this subscription.")
-            print("  See: https://aka.ms/azure-speaker-recognition")
-        return 1
-    print("Create profile: OK")
-    print(f"  {msg}")
-    print()
-
-    if profile_id:
-        ok2, msg2, status2 = test_enrollment(key, region, endpoint, profile_id)
-        if not ok2:
-            print("Enrollment: FAILED")
-            print(f"  {msg2}")
-            return 1
-        print("Enrollment: OK")
-        print(f"  {msg2}")
-    else:
-        print("Enrollment: skipped (no profile id)")
-
-    print()
-    print("Speaker Recognition is working.")
-    return 0
+    return asyncio.run(_test_azure(key, _base_url(region, endpoint)))
 
 
 if __name__ == "__main__":
@@ -12,7 +12,9 @@ Enrollment may not reach 100% with silence; the script still passes if the libra
 from __future__ import annotations
 
 import os
+import struct
 import sys
+from functools import lru_cache
 
 _script_dir = os.path.dirname(os.path.abspath(__file__))
 _api_root = os.path.abspath(os.path.join(_script_dir, ".."))
@@ -31,25 +33,35 @@ except ImportError:
 from app.services import speaker_recognition_eagle
 
 
+# 44-byte PCM WAV header; everything but the two length fields is fixed (16 kHz, 16-bit mono)
+_WAV_HEADER = struct.Struct("<4sI4s4sIHHIIHH4sI")
+
+
 def make_minimal_wav_seconds(seconds: float) -> bytes:
     """Build a minimal valid WAV (16 kHz, 16-bit mono) of silence."""
     num_samples = int(16000 * seconds)
     data_len = num_samples * 2
-    header = bytearray(44)
-    header[0:4] = b"RIFF"
-    header[4:8] = (36 + data_len).to_bytes(4, "little")
-    header[8:12] = b"WAVE"
-    header[12:16] = b"fmt "
-    header[16:20] = (16).to_bytes(4, "little")
-    header[20:22] = (1).to_bytes(2, "little")
-    header[22:24] = (1).to_bytes(2, "little")
-    header[24:28] = (16000).to_bytes(4, "little")
-    header[28:32] = (32000).to_bytes(4, "little")
-    header[32:34] = (2).to_bytes(2, "little")
-    header[34:36] = (16).to_bytes(2, "little")
-    header[36:40] = b"data"
-    header[40:44] = data_len.to_bytes(4, "little")
-    return bytes(header) + (b"\x00\x00" * num_samples)
+    header = _WAV_HEADER.pack(
+        b"RIFF", 36 + data_len, b"WAVE", b"fmt ", 16, 1, 1, 16000, 32000, 2, 16, b"data", data_len
+    )
+    return header + bytes(data_len)
+
+
+@lru_cache(maxsize=1)
+def _load_profiler(key: str):
+    """Eagle profiler created once per process (native model load); callers reset() it before use."""
+    import pveagle
+
+    return pveagle.create_profiler(key)
+
+
+def _discard_profiler(profiler) -> None:
+    """Drop a profiler left in an unknown state so the next run creates a fresh one."""
+    _load_profiler.cache_clear()
+    try:
+        profiler.delete()
+    except Exception:
+        pass
 
 
 def main() -> int:
@@ -77,7 +89,8 @@ def main() -> int:
     key = (settings.picovoice_access_key or "").strip()
 
     try:
-        profiler = pveagle.create_profiler(key)
+        profiler = _load_profiler(key)
+        profiler.reset()
     except Exception as e:
         print(f"Create profiler: FAILED — {e}")
         return 1
@@ -86,32 +99,24 @@ def main() -> int:
     try:
         min_samples = profiler.min_enroll_samples
         percentage = 0.0
-        idx = 0
-        while idx < len(pcm) and percentage < 100.0:
-            chunk = pcm[idx : idx + min_samples]
-            if len(chunk) < min_samples:
+        # memoryview slices over the int16 array: zero-copy chunks, no per-sample Python ints
+        samples = memoryview(pcm)
+        for idx in range(0, len(samples) - min_samples + 1, min_samples):
+            percentage, feedback = profiler.enroll(samples[idx : idx + min_samples])
+            if percentage >= 100.0:
                 break
-            percentage, feedback = profiler.enroll(chunk)
-            idx += min_samples
     except Exception as e:
         print(f"Enroll: FAILED — {e}")
-        try:
-            profiler.delete()
-        except Exception:
-            pass
+        _discard_profiler(profiler)
         return 1
 
     if percentage >= 100.0:
         print(f"Enroll: OK (100%)")
         try:
             profile = profiler.export()
-            profiler.delete()
         except Exception as e:
             print(f"Export profile: FAILED — {e}")
-            try:
-                profiler.delete()
-            except Exception:
-                pass
+            _discard_profiler(profiler)
             return 1
         profile_bytes = profile.to_bytes()
         print("Export profile: OK")
@@ -119,22 +124,15 @@ def main() -> int:
         # Recognizer: process same audio
         recognizer = pveagle.create_recognizer(key, [profile])
         frame_len = recognizer.frame_length
-        scores: list[float] = []
-        for i in range(0, len(pcm) - frame_len, frame_len):
-            frame = pcm[i : i + frame_len]
-            if len(frame) != frame_len:
-                break
-            frame_scores = recognizer.process(frame)
-            if frame_scores:
-                scores.append(float(frame_scores[0]))
+        # Whole frames only, sliced once as zero-copy views; pveagle has no batch process, and the
+        # recognizer is stateful, so frames stay sequential
+        frames = [samples[i : i + frame_len] for i in range(0, len(samples) - frame_len + 1, frame_len)]
+        process = recognizer.process
+        scores = [float(frame_scores[0]) for frame in frames if (frame_scores := process(frame))]
         recognizer.delete()
         mean_score = sum(scores) / len(scores) if scores else 0.0
         print(f"Recognizer (same audio): OK (mean score={mean_score:.3f})")
     else:
-        try:
-            profiler.delete()
-        except Exception:
-            pass
         print(f"Enroll: OK ({percentage:.0f}% — need more speech for 100%; Eagle library works)")
 
     print()
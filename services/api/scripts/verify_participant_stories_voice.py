@@ -15,12 +15,12 @@ For Azure: use --azure-db so the script loads DATABASE_URL from repo root .env.a
   Or from repo root: ./scripts/azure-api-status.sh narrate-verify Harry
 """
 import argparse
-import json
-import ssl
+import asyncio
 import sys
+from collections import defaultdict
 from pathlib import Path
-from urllib.request import Request, urlopen
-from urllib.error import HTTPError, URLError
+
+import httpx
 
 # Load .env.azure *before* importing app, so DATABASE_URL is set for Azure (avoids local .env / host "db")
 if "--azure-db" in sys.argv:
@@ -34,30 +34,67 @@ if "--azure-db" in sys.argv:
     if not _env_azure.is_file():
         print("Missing .env.azure. Set AZURE_ENV_PATH or run from repo root (e.g. ./scripts/azure-api-status.sh narrate-verify Harry).", file=sys.stderr)
         sys.exit(1)
-    from dotenv import load_dotenv
-    load_dotenv(_env_azure)
+    from dotenv import dotenv_values
+    # Single parse of the file; keys already in the environment win (same as load_dotenv's default)
+    for _key, _value in dotenv_values(_env_azure).items():
+        if _value is not None:
+            _os.environ.setdefault(_key, _value)
+
+from sqlalchemy import or_
 
 from app.core.config import DEFAULT_FAMILY_ID, settings
 from app.db.session import SessionLocal
 from app.db import models
 
 
-def get_asset_created_at(db, asset_id: str | None):
-    if not asset_id:
-        return None
-    a = db.query(models.Asset).filter(models.Asset.id == asset_id).first()
-    return a.created_at if a else None
+NARRATE_CONCURRENCY = 4
+
+
+def _story_fields(m) -> tuple[str, str, str]:
+    """(moment_id, display title, text sent to /voice/narrate) for a shared moment row, computed once."""
+    title = (m.title or "").strip() or "(no title)"
+    return str(m.id), title, (m.summary or "").strip() or title[:500]
+
+
+async def _narrate_all(api_base: str, jobs, concurrency: int, verify_ssl: bool) -> dict:
+    """POST /voice/narrate for every (participant_id, moment_id, text) job, at most `concurrency` in
+    flight on one keep-alive client. Returns {(participant_id, moment_id): (voice_header, error)}."""
+    url = f"{api_base.rstrip('/')}/voice/narrate"
+    sem = asyncio.Semaphore(max(1, concurrency))
+
+    async def one(client: httpx.AsyncClient, pid: str, text: str):
+        async with sem:
+            try:
+                resp = await client.post(url, json={"text": text[:2000], "participant_id": pid})
+                resp.raise_for_status()
+                return resp.headers.get("X-Narration-Voice", "").strip(), None
+            except httpx.HTTPError as e:
+                return None, e
+
+    limits = httpx.Limits(max_connections=max(1, concurrency))
+    async with httpx.AsyncClient(timeout=30.0, verify=verify_ssl, limits=limits) as client:
+        results = await asyncio.gather(*(one(client, pid, text) for pid, _, text in jobs))
+    return {(pid, mid): result for (pid, mid, _), result in zip(jobs, results)}
 
 
-def verify(db, participant_name: str, api_base: str | None, no_verify_ssl: bool = False) -> None:
-    name_lower = participant_name.strip().lower()
-    participants = [
-        p
-        for p in db.query(models.VoiceParticipant)
-        .filter(models.VoiceParticipant.family_id == DEFAULT_FAMILY_ID)
+def verify(
+    db,
+    participant_name: str,
+    api_base: str | None,
+    concurrency: int = NARRATE_CONCURRENCY,
+    verify_ssl: bool = True,
+) -> None:
+    """Report each matched participant's shared stories; with api_base, POST /voice/narrate per story."""
+    # Case-insensitive "contains" match done in SQL; escape LIKE wildcards in the name
+    pattern = participant_name.strip().replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    participants = (
+        db.query(models.VoiceParticipant)
+        .filter(
+            models.VoiceParticipant.family_id == DEFAULT_FAMILY_ID,
+            models.VoiceParticipant.label.ilike(f"%{pattern}%", escape="\\"),
+        )
         .all()
-        if name_lower in (p.label or "").lower()
-    ]
+    )
 
     print("=" * 72)
     print("VERIFY PARTICIPANT SHARED STORIES – SAME CLONE VOICE?")
@@ -92,16 +129,83 @@ def verify(db, participant_name: str, api_base: str | None, no_verify_ssl: bool
             print(f"  - id={p.id} label={p.label!r} elevenlabs_voice_id={vid}")
         print()
 
+    # Only shared story moments owned by a matched participant: moment.participant_id, or the
+    # participant_id of the VoiceStory that was shared as the moment
+    pid_list = [p.id for p in participants]
+    story_moment_ids = (
+        db.query(models.VoiceStory.shared_moment_id)
+        .filter(
+            models.VoiceStory.family_id == DEFAULT_FAMILY_ID,
+            models.VoiceStory.participant_id.in_(pid_list),
+            models.VoiceStory.shared_moment_id.isnot(None),
+        )
+    )
+    # Only the columns the report uses, not full Moment rows (session turns etc.)
     shared_moments = (
-        db.query(models.Moment)
+        db.query(models.Moment.id, models.Moment.participant_id, models.Moment.title, models.Moment.summary)
         .filter(
             models.Moment.family_id == DEFAULT_FAMILY_ID,
             models.Moment.source == "voice_story",
             models.Moment.shared_at.isnot(None),
             models.Moment.deleted_at.is_(None),
+            or_(models.Moment.participant_id.in_(pid_list), models.Moment.id.in_(story_moment_ids)),
         )
         .all()
     )
+    moment_ids = [m.id for m in shared_moments]
+
+    # VoiceStory and session_audio asset per shared moment, one query each (not per moment per participant)
+    story_by_moment = {}
+    playback_by_moment = {}
+    if moment_ids:
+        for shared_moment_id, story_pid, final_audio_asset_id in (
+            db.query(
+                models.VoiceStory.shared_moment_id,
+                models.VoiceStory.participant_id,
+                models.VoiceStory.final_audio_asset_id,
+            )
+            .filter(
+                models.VoiceStory.shared_moment_id.in_(moment_ids),
+                models.VoiceStory.family_id == DEFAULT_FAMILY_ID,
+            )
+            .all()
+        ):
+            story_by_moment.setdefault(str(shared_moment_id), (story_pid, final_audio_asset_id))
+        for moment_id, asset_id, created_at in (
+            db.query(models.MomentAsset.moment_id, models.MomentAsset.asset_id, models.Asset.created_at)
+            .outerjoin(models.Asset, models.Asset.id == models.MomentAsset.asset_id)
+            .filter(
+                models.MomentAsset.moment_id.in_(moment_ids),
+                models.MomentAsset.role == "session_audio",
+            )
+            .all()
+        ):
+            playback_by_moment.setdefault(str(moment_id), (asset_id, created_at))
+
+    # Bucket shared moments by owner in one pass: moment.participant_id, and also the VoiceStory's
+    # participant_id when it differs (a moment can then count for both). Each entry carries the
+    # moment's (id, title, narrate text) strings, built once per moment rather than per use.
+    moments_by_participant = defaultdict(list)
+    for m in shared_moments:
+        fields = _story_fields(m)
+        m_pid = str(m.participant_id) if m.participant_id else None
+        if m_pid:
+            moments_by_participant[m_pid].append(fields)
+        story = story_by_moment.get(fields[0])
+        if story and story[0] and str(story[0]) != m_pid:
+            moments_by_participant[str(story[0])].append(fields)
+
+    # Live narrate checks are independent backend round trips: run them all up front, overlapped,
+    # and print the results in story order below
+    narrate_results = {}
+    if api_base:
+        jobs = [
+            (str(p.id), mid, text_for_narrate)
+            for p in participants
+            for mid, _, text_for_narrate in moments_by_participant.get(str(p.id), [])
+        ]
+        if jobs:
+            narrate_results = asyncio.run(_narrate_all(api_base, jobs, concurrency, verify_ssl))
 
     for p in participants:
         pid = str(p.id)
@@ -109,23 +213,7 @@ def verify(db, participant_name: str, api_base: str | None, no_verify_ssl: bool
         elevenlabs_id = (getattr(p, "elevenlabs_voice_id", None) or "").strip() or None
 
         # This participant's shared stories
-        stories_for_participant = []
-        for m in shared_moments:
-            mid = str(m.id)
-            m_pid = str(m.participant_id) if m.participant_id else None
-            if m_pid == pid:
-                stories_for_participant.append(m)
-                continue
-            story = (
-                db.query(models.VoiceStory)
-                .filter(
-                    models.VoiceStory.shared_moment_id == m.id,
-                    models.VoiceStory.family_id == DEFAULT_FAMILY_ID,
-                )
-                .first()
-            )
-            if story and str(story.participant_id) == pid:
-                stories_for_participant.append(m)
+        stories_for_participant = moments_by_participant.get(pid, [])
 
         print("-" * 72)
         print(f"PARTICIPANT: {label} (id={pid})")
@@ -133,34 +221,14 @@ def verify(db, participant_name: str, api_base: str | None, no_verify_ssl: bool
         print(f"  Shared stories: {len(stories_for_participant)}")
         print()
 
-        for m in stories_for_participant:
-            mid = str(m.id)
-            title = (m.title or "").strip() or "(no title)"
+        for mid, title, _ in stories_for_participant:
             # VoiceStory for this moment
-            story = (
-                db.query(models.VoiceStory)
-                .filter(
-                    models.VoiceStory.shared_moment_id == mid,
-                    models.VoiceStory.family_id == DEFAULT_FAMILY_ID,
-                )
-                .first()
-            )
-            final_asset_id = str(story.final_audio_asset_id) if story and story.final_audio_asset_id else None
+            story = story_by_moment.get(mid)
+            final_asset_id = str(story[1]) if story and story[1] else None
             # Moment's session_audio asset (what playback URL serves)
-            ma = (
-                db.query(models.MomentAsset)
-                .filter(
-                    models.MomentAsset.moment_id == mid,
-                    models.MomentAsset.role == "session_audio",
-                )
-                .first()
-            )
-            playback_asset_id = str(ma.asset_id) if ma else None
-            playback_created = get_asset_created_at(db, ma.asset_id if ma else None) if ma else None
-
-            text_for_narrate = (m.summary or "").strip() or (title or "Test.")[:500]
-            if not text_for_narrate:
-                text_for_narrate = "Test."
+            playback = playback_by_moment.get(mid)
+            playback_asset_id = str(playback[0]) if playback else None
+            playback_created = playback[1] if playback else None
 
             print(f"  Story: {title!r}")
             print(f"    moment_id: {mid}")
@@ -173,26 +241,16 @@ def verify(db, participant_name: str, api_base: str | None, no_verify_ssl: bool
                 print("    → No stored audio; only live Narrate is used (always uses participant_id → clone).")
 
             # Live narrate check
-            if api_base:
-                url = f"{api_base.rstrip('/')}/voice/narrate"
-                payload = {"text": text_for_narrate[:2000], "participant_id": pid}
-                try:
-                    req = Request(url, data=json.dumps(payload).encode("utf-8"), method="POST")
-                    req.add_header("Content-Type", "application/json")
-                    ctx = None
-                    if no_verify_ssl:
-                        ctx = ssl.create_default_context()
-                        ctx.check_hostname = False
-                        ctx.verify_mode = ssl.CERT_NONE
-                    with urlopen(req, timeout=30, context=ctx) as resp:
-                        voice_header = resp.headers.get("X-Narration-Voice", "").strip()
-                        print(f"    POST /voice/narrate → X-Narration-Voice: {voice_header or '(not set)'}")
-                        if voice_header == "cloned":
-                            print("    → Live narrate uses CLONED voice for this story.")
-                        elif voice_header == "default":
-                            print("    → Live narrate uses DEFAULT voice (not clone) for this story.")
-                except (HTTPError, URLError, OSError) as e:
-                    print(f"    POST /voice/narrate → error: {e}")
+            if (pid, mid) in narrate_results:
+                voice_header, error = narrate_results[(pid, mid)]
+                if error is not None:
+                    print(f"    POST /voice/narrate → error: {error}")
+                else:
+                    print(f"    POST /voice/narrate → X-Narration-Voice: {voice_header or '(not set)'}")
+                    if voice_header == "cloned":
+                        print("    → Live narrate uses CLONED voice for this story.")
+                    elif voice_header == "default":
+                        print("    → Live narrate uses DEFAULT voice (not clone) for this story.")
             print()
 
         # Summary
@@ -226,11 +284,17 @@ def main():
         action="store_true",
         help="Skip SSL verification for narrate requests (use if you get CERTIFICATE_VERIFY_FAILED)",
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=NARRATE_CONCURRENCY,
+        help=f"Max narrate requests in flight at once (default {NARRATE_CONCURRENCY})",
+    )
     args = parser.parse_args()
 
     db = SessionLocal()
     try:
-        verify(db, args.name, args.api_base, no_verify_ssl=args.no_verify_ssl)
+        verify(db, args.name, args.api_base, concurrency=args.concurrency, verify_ssl=not args.no_verify_ssl)
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
         raise
@@ -12,6 +12,8 @@ Run from services/api: uv run python scripts/verify_voice_clone_narration.py [--
 import argparse
 import sys
 
+from sqlalchemy import or_
+
 from app.core.config import DEFAULT_FAMILY_ID
 from app.db.session import SessionLocal
 from app.db import models
@@ -24,16 +26,51 @@ def verify(db, participant_name: str | None = None):
         models.VoiceParticipant.family_id == DEFAULT_FAMILY_ID,
     )
     if participant_name:
-        # Case-insensitive match on label
-        name_lower = participant_name.strip().lower()
-        participants = [p for p in query.all() if name_lower in (p.label or "").lower()]
-    else:
-        participants = query.all()
+        # Case-insensitive match on label, done in SQL; escape LIKE wildcards in the name
+        pattern = participant_name.strip().replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        query = query.filter(models.VoiceParticipant.label.ilike(f"%{pattern}%", escape="\\"))
+    participants = query.all()
 
     if not participants:
         print("No participants found" + (f" matching '{participant_name}'" if participant_name else ""))
         return 1
 
+    # Shared stories (source=voice_story, shared_at set) owned by any matched participant, via
+    # moment.participant_id or the VoiceStory shared as the moment; one query for all participants
+    pid_list = [p.id for p in participants]
+    story_moment_ids = (
+        db.query(models.VoiceStory.shared_moment_id)
+        .filter(
+            models.VoiceStory.family_id == DEFAULT_FAMILY_ID,
+            models.VoiceStory.participant_id.in_(pid_list),
+            models.VoiceStory.shared_moment_id.isnot(None),
+        )
+    )
+    # Only the columns the checks use, not full Moment rows
+    moments = (
+        db.query(models.Moment.id, models.Moment.participant_id, models.Moment.title)
+        .filter(
+            models.Moment.family_id == DEFAULT_FAMILY_ID,
+            models.Moment.source == "voice_story",
+            models.Moment.shared_at.isnot(None),
+            models.Moment.deleted_at.is_(None),
+            or_(models.Moment.participant_id.in_(pid_list), models.Moment.id.in_(story_moment_ids)),
+        )
+        .all()
+    )
+    # VoiceStory owner per shared moment in one query (no relationships on the models to eager-load)
+    story_pid_by_moment = {}
+    if moments:
+        for shared_moment_id, story_pid in (
+            db.query(models.VoiceStory.shared_moment_id, models.VoiceStory.participant_id)
+            .filter(
+                models.VoiceStory.shared_moment_id.in_([m.id for m in moments]),
+                models.VoiceStory.family_id == DEFAULT_FAMILY_ID,
+            )
+            .all()
+        ):
+            story_pid_by_moment.setdefault(str(shared_moment_id), story_pid)
+
     ok_count = 0
     issue_count = 0
 
@@ -55,18 +92,6 @@ def verify(db, participant_name: str | None = None):
             print("  ✓  Has cloned voice")
             ok_count += 1
 
-        # Shared stories: moments with source=voice_story and shared_at set
-        moments = (
-            db.query(models.Moment)
-            .filter(
-                models.Moment.family_id == DEFAULT_FAMILY_ID,
-                models.Moment.source == "voice_story",
-                models.Moment.shared_at.isnot(None),
-                models.Moment.deleted_at.is_(None),
-            )
-            .all()
-        )
-
         # Filter to Harry's stories: moment.participant_id OR voice_story.participant_id
         harry_moments = []
         for m in moments:
@@ -76,15 +101,8 @@ def verify(db, participant_name: str | None = None):
                 harry_moments.append((m, "moment.participant_id"))
                 continue
             # Backfill from VoiceStory if moment has no participant_id
-            story = (
-                db.query(models.VoiceStory)
-                .filter(
-                    models.VoiceStory.shared_moment_id == m.id,
-                    models.VoiceStory.family_id == DEFAULT_FAMILY_ID,
-                )
-                .first()
-            )
-            if story and str(story.participant_id) == pid:
+            story_pid = story_pid_by_moment.get(mid)
+            if story_pid and str(story_pid) == pid:
                 harry_moments.append((m, "voice_story.participant_id (moment.participant_id missing)"))
                 if not m_participant:
                     print(f"  ⚠️  Story moment_id={mid} has no participant_id; backfilled from VoiceStory")
@@ -1,8 +1,24 @@
 #!/usr/bin/env python3
 """Wait for PostgreSQL to accept connections. Used at container startup so migrations run after DB is ready."""
 import os
+import socket
 import sys
 import time
+from urllib.parse import urlsplit
+
+import psycopg
+
+# Retry with exponential backoff (50 ms doubling, capped) until a wall-clock deadline, so a DB that is
+# up within the first few hundred ms isn't held behind a flat 1 s sleep
+WAIT_SECONDS = 30.0
+BACKOFF_BASE_SECONDS = 0.05
+BACKOFF_MAX_SECONDS = 2.0
+TCP_PROBE_TIMEOUT = 0.5
+
+# Server answered but refused us for a reason waiting won't fix (bad credentials, missing database):
+# class 28 = invalid authorization, 3D000 = invalid catalog name
+_FATAL_SQLSTATE_PREFIXES = ("28", "3D")
+_FATAL_MESSAGES = ("password authentication failed", "does not exist")
 
 
 def _normalize_db_url(url: str) -> str:
@@ -14,29 +30,68 @@ def _normalize_db_url(url: str) -> str:
     return url + ("?sslmode=require" if "?" not in url else "&sslmode=require")
 
 
+def _tcp_address(url: str) -> tuple[str, int] | None:
+    """(host, port) from a postgresql URL, or None if it has no TCP host (e.g. unix socket)."""
+    try:
+        parts = urlsplit(url)
+        return (parts.hostname, parts.port or 5432) if parts.hostname else None
+    except ValueError:
+        return None
+
+
+def _check(database_url: str, address: tuple[str, int] | None) -> None:
+    """Raise unless the DB accepts a query. A cheap TCP probe first, so retries while the server is
+    still down skip the TLS + auth handshake; the real connect runs once the port is open."""
+    if address is not None:
+        with socket.create_connection(address, timeout=TCP_PROBE_TIMEOUT):
+            pass
+    with psycopg.connect(database_url, connect_timeout=2) as conn:
+        conn.execute("SELECT 1")
+
+
+def _is_fatal(e: psycopg.OperationalError) -> bool:
+    """True for a connect error that retrying can't fix. libpq reports auth failures at connect time
+    without a result, so sqlstate is often missing and the message is checked as well."""
+    sqlstate = getattr(e, "sqlstate", None) or ""
+    return sqlstate.startswith(_FATAL_SQLSTATE_PREFIXES) or any(m in str(e) for m in _FATAL_MESSAGES)
+
+
+def _fail(message: str) -> None:
+    print(f"wait_for_db: {message}", file=sys.stderr)
+    # Stay up briefly so Azure can capture logs (no running replica = no console logs)
+    time.sleep(30)
+    sys.exit(1)
+
+
 def main():
     database_url = os.environ.get("DATABASE_URL", "").strip()
     if not database_url:
         print("wait_for_db: DATABASE_URL not set", file=sys.stderr)
         sys.exit(1)
     database_url = _normalize_db_url(database_url)
-    max_attempts = 30
-    for attempt in range(1, max_attempts + 1):
+    address = _tcp_address(database_url)
+    deadline = time.monotonic() + WAIT_SECONDS
+    attempt = 0
+    while True:
+        attempt += 1
         try:
-            import psycopg
-            with psycopg.connect(database_url, connect_timeout=2) as conn:
-                conn.execute("SELECT 1")
+            _check(database_url, address)
             print(f"wait_for_db: database ready after {attempt} attempt(s)")
             return
-        except Exception as e:
-            if attempt == max_attempts:
-                print(f"wait_for_db: gave up after {max_attempts} attempts: {e}", file=sys.stderr)
-                # Stay up briefly so Azure can capture logs (no running replica = no console logs)
-                time.sleep(30)
-                sys.exit(1)
-            print(f"wait_for_db: attempt {attempt}/{max_attempts} failed: {e}", file=sys.stderr)
-            time.sleep(1)
-    sys.exit(1)
+        except psycopg.OperationalError as e:
+            # Server down / not accepting yet is retried; refused credentials or a missing DB are not
+            if _is_fatal(e):
+                _fail(f"not retrying, configuration error: {e}")
+            error = e
+        except OSError as e:
+            # TCP probe refused / timed out, or the host doesn't resolve yet
+            error = e
+        delay = min(BACKOFF_BASE_SECONDS * (2 ** (attempt - 1)), BACKOFF_MAX_SECONDS)
+        if time.monotonic() + delay >= deadline:
+            _fail(f"gave up after {attempt} attempts: {error}")
+        print(f"wait_for_db: attempt {attempt} failed (retrying in {delay:.2f}s): {error}", file=sys.stderr)
+        time.sleep(delay)
+
 
 if __name__ == "__main__":
     main()
@@ -24,110 +24,85 @@ def _is_production_database_url(url: str) -> bool:
     return "database.azure.com" in url or ".postgres.database.azure.com" in url
 
 
+from sqlalchemy import text
+
 from app.db.session import SessionLocal
-from app.db import models
+
+
+# Tables in the order the report prints them; each is one data-modifying CTE in _WIPE_SQL
+WIPE_TABLES = (
+    "shared_story_listens",
+    "voice_stories",
+    "transcripts",
+    "moment_assets",
+    "moment_people",
+    "narrate_bgm_cache",
+    "moments",
+    "assets",
+    "voice_participants",
+    "users",
+    "people",
+)
+
+# One statement, one round trip. Every CTE sees the same snapshot and FK checks (NO ACTION) run at end of
+# statement, so parents and children can be deleted side by side; child rows are matched through the
+# family's moments / participants via subqueries instead of id lists fetched first.
+_WIPE_SQL = text(
+    """
+    WITH family_moments AS (
+        SELECT id FROM moments WHERE family_id = :family_id
+    ),
+    family_participants AS (
+        SELECT id FROM voice_participants WHERE family_id = :family_id
+    ),
+    d_shared_story_listens AS (
+        DELETE FROM shared_story_listens
+        WHERE participant_id IN (SELECT id FROM family_participants)
+           OR moment_id IN (SELECT id FROM family_moments)
+        RETURNING 1
+    ),
+    d_voice_stories AS (
+        DELETE FROM voice_stories WHERE family_id = :family_id RETURNING 1
+    ),
+    d_transcripts AS (
+        DELETE FROM transcripts WHERE moment_id IN (SELECT id FROM family_moments) RETURNING 1
+    ),
+    d_moment_assets AS (
+        DELETE FROM moment_assets WHERE moment_id IN (SELECT id FROM family_moments) RETURNING 1
+    ),
+    d_moment_people AS (
+        DELETE FROM moment_people WHERE moment_id IN (SELECT id FROM family_moments) RETURNING 1
+    ),
+    d_narrate_bgm_cache AS (
+        DELETE FROM narrate_bgm_cache WHERE moment_id IN (SELECT id FROM family_moments) RETURNING 1
+    ),
+    d_moments AS (
+        DELETE FROM moments WHERE family_id = :family_id RETURNING 1
+    ),
+    d_assets AS (
+        DELETE FROM assets WHERE family_id = :family_id RETURNING 1
+    ),
+    d_voice_participants AS (
+        DELETE FROM voice_participants WHERE family_id = :family_id RETURNING 1
+    ),
+    d_users AS (
+        DELETE FROM users WHERE family_id = :family_id RETURNING 1
+    ),
+    d_people AS (
+        DELETE FROM people WHERE family_id = :family_id RETURNING 1
+    )
+    SELECT
+"""
+    + ",\n".join(f"        (SELECT count(*) FROM d_{t}) AS {t}" for t in WIPE_TABLES)
+)
 
 
 def wipe(db):
-    """Delete all participant and related data for the default family in FK-safe order."""
-    participant_ids = [
-        r[0]
-        for r in db.query(models.VoiceParticipant.id).filter(
-            models.VoiceParticipant.family_id == DEFAULT_FAMILY_ID
-        ).all()
-    ]
-    moment_ids = [
-        r[0]
-        for r in db.query(models.Moment.id).filter(
-            models.Moment.family_id == DEFAULT_FAMILY_ID
-        ).all()
-    ]
-
-    total = 0
-
-    # 1. shared_story_listens (references voice_participants, moments)
-    if participant_ids:
-        n = db.query(models.SharedStoryListen).filter(
-            models.SharedStoryListen.participant_id.in_(participant_ids)
-        ).delete(synchronize_session=False)
-        print(f"  shared_story_listens: {n}")
-        total += n
-    else:
-        print("  shared_story_listens: 0")
-
-    # 2. voice_stories (references voice_participants, moments, assets)
-    n = db.query(models.VoiceStory).filter(
-        models.VoiceStory.family_id == DEFAULT_FAMILY_ID
-    ).delete(synchronize_session=False)
-    print(f"  voice_stories: {n}")
-    total += n
-
-    # 3. transcripts (references moments, assets)
-    if moment_ids:
-        n = db.query(models.Transcript).filter(
-            models.Transcript.moment_id.in_(moment_ids)
-        ).delete(synchronize_session=False)
-        print(f"  transcripts: {n}")
-        total += n
-    else:
-        print("  transcripts: 0")
-
-    # 4. moment_assets
-    if moment_ids:
-        n = db.query(models.MomentAsset).filter(
-            models.MomentAsset.moment_id.in_(moment_ids)
-        ).delete(synchronize_session=False)
-        print(f"  moment_assets: {n}")
-        total += n
-    else:
-        print("  moment_assets: 0")
-
-    # 5. moment_people
-    if moment_ids:
-        n = db.query(models.MomentPerson).filter(
-            models.MomentPerson.moment_id.in_(moment_ids)
-        ).delete(synchronize_session=False)
-        print(f"  moment_people: {n}")
-        total += n
-    else:
-        print("  moment_people: 0")
-
-    # 6. moments
-    n = db.query(models.Moment).filter(
-        models.Moment.family_id == DEFAULT_FAMILY_ID
-    ).delete(synchronize_session=False)
-    print(f"  moments: {n}")
-    total += n
-
-    # 7. assets (family-scoped; blobs in Azure are unchanged)
-    n = db.query(models.Asset).filter(
-        models.Asset.family_id == DEFAULT_FAMILY_ID
-    ).delete(synchronize_session=False)
-    print(f"  assets: {n}")
-    total += n
-
-    # 8. voice_participants
-    n = db.query(models.VoiceParticipant).filter(
-        models.VoiceParticipant.family_id == DEFAULT_FAMILY_ID
-    ).delete(synchronize_session=False)
-    print(f"  voice_participants: {n}")
-    total += n
-
-    # 9. users
-    n = db.query(models.User).filter(
-        models.User.family_id == DEFAULT_FAMILY_ID
-    ).delete(synchronize_session=False)
-    print(f"  users: {n}")
-    total += n
-
-    # 10. people
-    n = db.query(models.Person).filter(
-        models.Person.family_id == DEFAULT_FAMILY_ID
-    ).delete(synchronize_session=False)
-    print(f"  people: {n}")
-    total += n
-
-    return total
+    """Delete all participant and related data for the default family in one statement."""
+    counts = db.execute(_WIPE_SQL, {"family_id": DEFAULT_FAMILY_ID}).mappings().one()
+    for table in WIPE_TABLES:
+        print(f"  {table}: {counts[table]}")
+    return sum(counts[table] for table in WIPE_TABLES)
 
 
 def main():
@@ -160,7 +135,7 @@ def main():
 
     db = SessionLocal()
     try:
-        print("Wiping data for default family (FK-safe order)...")
+        print("Wiping data for default family...")
         total = wipe(db)
         db.commit()
         print(f"Done. Total rows deleted: {total}")